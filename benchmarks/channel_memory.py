@@ -0,0 +1,85 @@
+"""
+Memory benchmark of channels and connections.
+
+Creates a number of PyDMChannel objects bound to the slots of a label, as
+widgets do, and a number of PyDMConnection objects holding a full set of
+control variables, as the EPICS data plugins do, then reports the Python heap
+memory used per channel and per connection.
+
+The figures are measured with ``tracemalloc`` and so only account for memory
+allocated by Python, not the C++ side of the Qt objects.
+
+Usage::
+
+    python benchmarks/channel_memory.py --channels 10000 --connections 2000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from qtpy.QtWidgets import QApplication
+
+from pydm.data_plugins.plugin import ControlVariables, PyDMConnection
+from pydm.widgets.channel import PyDMChannel
+from pydm.widgets.label import PyDMLabel
+
+
+def _measure(create, count):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [create(i) for i in range(count)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return objects, (after - before) / count
+
+
+def run(n_channels=10000, n_connections=2000):
+    app = QApplication.instance() or QApplication([])
+    label = PyDMLabel()
+
+    def create_channel(i):
+        return PyDMChannel(
+            address="ca://BENCH:PV{}".format(i),
+            connection_slot=label.connectionStateChanged,
+            value_slot=label.channelValueChanged,
+            severity_slot=label.alarmSeverityChanged,
+            enum_strings_slot=label.enumStringsChanged,
+            unit_slot=label.unitChanged,
+            prec_slot=label.precisionChanged,
+            upper_ctrl_limit_slot=label.upperCtrlLimitChanged,
+            lower_ctrl_limit_slot=label.lowerCtrlLimitChanged,
+        )
+
+    channels, per_channel = _measure(create_channel, n_channels)
+
+    def create_connection(i):
+        connection = PyDMConnection(channels[i], channels[i].address, "ca")
+        connection.ctrl_vars = ControlVariables()
+        for name in ControlVariables.__slots__:
+            setattr(connection.ctrl_vars, name, float(i))
+        return connection
+
+    connections, per_connection = _measure(create_connection, min(n_connections, n_channels))
+
+    print(f"{len(channels)} channels: {per_channel:,.0f} bytes per channel")
+    print(f"{len(connections)} connections: {per_connection:,.0f} bytes per connection")
+    for connection in connections:
+        connection.deleteLater()
+    label.deleteLater()
+    app.processEvents()
+    return per_channel, per_connection
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the memory used by channels and connections")
+    parser.add_argument("--channels", type=int, default=10000, help="Number of channels to create")
+    parser.add_argument("--connections", type=int, default=2000, help="Number of connections to create")
+    args = parser.parse_args()
+    run(args.channels, args.connections)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Micro-benchmark of PyDMLabel value updates.
+
+Creates a number of labels and pushes value updates to all of them through
+``value_changed``, the same entry point used by the channel, then reports the
+number of label updates per second.  Each label follows a noisy signal whose
+noise is mostly below the display precision so that, as with many real PVs,
+a good share of updates do not change the displayed text.
+
+Usage::
+
+    python benchmarks/label_updates.py --labels 1000 --rounds 50
+"""
+
+import argparse
+import time
+
+import numpy as np
+from qtpy.QtWidgets import QApplication, QGridLayout, QWidget
+
+from pydm.widgets.label import PyDMLabel
+
+
+def run(n_labels=1000, rounds=50, precision=2, show_units=True):
+    app = QApplication.instance() or QApplication([])
+    parent = QWidget()
+    layout = QGridLayout(parent)
+    columns = max(1, int(np.sqrt(n_labels)))
+    labels = []
+    for i in range(n_labels):
+        label = PyDMLabel(parent)
+        label.precisionFromPV = False
+        label.precision = precision
+        label.showUnits = show_units
+        label.unit_changed("mm")
+        layout.addWidget(label, i // columns, i % columns)
+        labels.append(label)
+    parent.show()
+    app.processEvents()
+
+    rng = np.random.default_rng(0)
+    base = rng.uniform(0, 10, n_labels)
+    noise = rng.normal(0, 0.5 * 10**-precision, size=(rounds, n_labels))
+    values = (base + noise).tolist()
+
+    start = time.perf_counter()
+    for round_values in values:
+        for label, value in zip(labels, round_values):
+            label.value_changed(value)
+        app.processEvents()
+    elapsed = time.perf_counter() - start
+
+    updates = rounds * n_labels
+    print(f"{n_labels} labels, {rounds} rounds: {updates} updates in {elapsed:.3f} s")
+    print(f"{updates / elapsed:,.0f} label updates per second")
+    parent.close()
+    return updates / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PyDMLabel value updates")
+    parser.add_argument("--labels", type=int, default=1000, help="Number of labels to update")
+    parser.add_argument("--rounds", type=int, default=50, help="Number of updates pushed to every label")
+    parser.add_argument("--precision", type=int, default=2, help="Display precision of the labels")
+    parser.add_argument("--no-units", action="store_true", help="Do not show units on the labels")
+    args = parser.parse_args()
+    run(args.labels, args.rounds, args.precision, not args.no_units)
+
+
+if __name__ == "__main__":
+    main()
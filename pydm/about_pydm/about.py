@@ -7,7 +7,6 @@ from pyqtgraph import __version__ as pyqtgraphver
 import pydm
 import sys
 from os import path
-import inspect
 import qtpy
 
 # get Qt binding and version
@@ -73,10 +72,9 @@ class AboutWindow(QWidget):
         self.ui.dataPluginsTableWidget.setHorizontalHeaderLabels(col_labels)
         self.ui.dataPluginsTableWidget.horizontalHeader().setStretchLastSection(True)
         self.ui.dataPluginsTableWidget.verticalHeader().setVisible(False)
-        pydm.data_plugins.initialize_plugins_if_needed()
-        for protocol, plugin in pydm.data_plugins.plugin_modules.items():
+        for protocol, origin in pydm.data_plugins.available_plugins().items():
             protocol_item = QTableWidgetItem(protocol)
-            file_item = QTableWidgetItem(inspect.getfile(plugin.__class__))
+            file_item = QTableWidgetItem(origin)
             new_row = self.ui.dataPluginsTableWidget.rowCount()
             self.ui.dataPluginsTableWidget.insertRow(new_row)
             self.ui.dataPluginsTableWidget.setItem(new_row, 0, protocol_item)
@@ -15,6 +15,7 @@ import warnings
 from qtpy.QtCore import Qt, QTimer, Slot
 from qtpy.QtWidgets import QApplication
 from .main_window import PyDMMainWindow
+from .performance_monitor import EventLoopMonitor
 
 from .utilities import which, path_info, connection, ACTIVE_QT_WRAPPER, QtWrapperTypes
 from .utilities.stylesheet import apply_stylesheet
@@ -44,9 +45,12 @@ class PyDMApplication(QApplication):
         probably isn't something you will ever need to use when writing
         code that instantiates PyDMApplication.
     perfmon : bool, optional
-        Whether or not to enable performance monitoring using 'psutil'.
-        When enabled, CPU load information on a per-thread basis is
-        periodically printed to the terminal.
+        Whether or not to enable performance monitoring.  When enabled, the
+        responsiveness of the event loop is measured by an
+        :class:`~pydm.performance_monitor.EventLoopMonitor` shown in the
+        status bar of the main window, and CPU load information on a
+        per-thread basis is periodically printed to the terminal using
+        'psutil'.
     hide_nav_bar : bool, optional
         Whether or not to display the navigation bar (forward/back/home buttons)
         when the main window is first displayed.
@@ -72,6 +76,9 @@ class PyDMApplication(QApplication):
         Whether or not to launch PyDM in a full screen mode.
     homefile : str, optional
         The path to a PyDM file to return to whenever the home button is clicked in the navigation bar.
+    fork_server : bool, optional
+        Whether or not to open new processes by forking them from a pre-warmed
+        fork server, see :mod:`pydm.utilities.fork_server`.
     """
 
     # Instantiate our plugins.
@@ -93,6 +100,7 @@ class PyDMApplication(QApplication):
         stylesheet_path=None,
         fullscreen=False,
         home_file=None,
+        fork_server=False,
     ):
         super().__init__(command_line_args)
         # Enable High DPI display, if available.
@@ -108,6 +116,18 @@ class PyDMApplication(QApplication):
         self.fullscreen = fullscreen
         self.stylesheet_path = stylesheet_path
         self.perfmon = perfmon
+        self.event_loop_monitor = None
+        if perfmon:
+            self.event_loop_monitor = EventLoopMonitor(self, log_file=config.PERFMON_LOG)
+            self.event_loop_monitor.start()
+            self.aboutToQuit.connect(self.event_loop_monitor.stop)
+
+        self.fork_server = None
+        if fork_server:
+            # Imported here as the module is run on its own as the server process
+            from pydm.utilities.fork_server import ForkServer
+
+            self.fork_server = ForkServer.connect_or_start()
 
         # The home_file param is set by command line option. If the option wasn't set, try the environment variable
         # from config. Note that this may not be set either, in which case home_file will eventually be set to
@@ -176,7 +196,8 @@ class PyDMApplication(QApplication):
         Spawn a new PyDM process and open the supplied file.  Commands to open
         new windows in PyDM typically actually spawn an entirely new PyDM process.
         This keeps each window isolated, so that one window cannot slow
-        down or crash another.
+        down or crash another.  When running with a fork server, the process
+        is forked from it rather than started from scratch.
 
         Parameters
         ----------
@@ -219,6 +240,8 @@ class PyDMApplication(QApplication):
             args.extend(["--fullscreen"])
         if self.perfmon:
             args.extend(["--perfmon"])
+        if self.fork_server is not None:
+            args.append("--fork-server")
         if data_plugins.is_read_only():
             args.append("--read-only")
         if self.stylesheet_path:
@@ -233,6 +256,8 @@ class PyDMApplication(QApplication):
         args.extend(filepath_args)
         if command_line_args is not None:
             args.extend(command_line_args)
+        if self.fork_server is not None and self.fork_server.launch(args) is not None:
+            return
         subprocess.Popen(args, shell=False)
 
     def make_main_window(
@@ -255,6 +280,8 @@ class PyDMApplication(QApplication):
         )
 
         self.main_window = main_window
+        if self.event_loop_monitor is not None:
+            main_window.add_event_loop_monitor(self.event_loop_monitor)
         apply_stylesheet(stylesheet_path, widget=self.main_window)
         self.main_window.update_tools_menu()
 
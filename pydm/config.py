@@ -16,6 +16,66 @@ STYLESHEET_INCLUDE_DEFAULT = os.getenv("PYDM_STYLESHEET_INCLUDE_DEFAULT", False)
 
 CONFIRM_QUIT = os.getenv("PYDM_CONFIRM_QUIT", "n").lower() in ("y", "t", "1", "true")
 
+# Restyle every descendant of a widget on alarm severity changes, needed only by stylesheets
+# that style child widgets based on the alarm severity of a parent PyDM widget.
+ALARM_RESTYLE_SUBTREE = os.getenv("PYDM_ALARM_RESTYLE_SUBTREE", "n").lower() in ("y", "t", "1", "true")
+
+# Hold back value and alarm style updates of hidden PyDM widgets until they are shown again
+SUSPEND_HIDDEN_UPDATES = os.getenv("PYDM_SUSPEND_HIDDEN_UPDATES", "n").lower() in ("y", "t", "1", "true")
+
+# Most widgets kept, across all embedded displays, in the displays they cache to show again without
+# reloading them, see the cacheSize property of PyDMEmbeddedDisplay
+EMBEDDED_CACHE_WIDGETS = int(os.getenv("PYDM_EMBEDDED_CACHE_WIDGETS", "10000"))
+
+# Most displays of the navigation history of a main window kept alive to be shown again instantly,
+# and most widgets in all of them, older displays being loaded again when navigated to
+NAVIGATION_CACHE_SIZE = int(os.getenv("PYDM_NAVIGATION_CACHE_SIZE", "10"))
+NAVIGATION_CACHE_WIDGETS = int(os.getenv("PYDM_NAVIGATION_CACHE_WIDGETS", "20000"))
+
+# Keep the channels of the displays kept in the navigation history connected while they are not shown
+NAVIGATION_KEEP_CONNECTED = os.getenv("PYDM_NAVIGATION_KEEP_CONNECTED", "n").lower() in ("y", "t", "1", "true")
+
+# Number of threads preparing the displays of related display buttons in the background when the
+# buttons are shown or hovered, so that opening them only builds their widgets. 0 disables it
+PREFETCH_WORKERS = int(os.getenv("PYDM_PREFETCH_WORKERS", "0"))
+
+# Most values per second written by sliders and spinboxes while their value is continuously changed,
+# e.g. by dragging a slider, intermediate values being dropped. 0 writes every value
+MAX_WRITE_RATE = float(os.getenv("PYDM_MAX_WRITE_RATE", "0"))
+
+# File in which the directory indexes used by recursive file lookups are kept between sessions
+FILE_INDEX = os.getenv("PYDM_FILE_INDEX")
+
+# File in which the protocols provided by each data plugin file and entrypoint are kept between
+# sessions, so that plugins can be found without importing them
+DATA_PLUGINS_MANIFEST = os.getenv("PYDM_DATA_PLUGINS_MANIFEST")
+
+# Collect per-connection runtime statistics from startup instead of from the first time the
+# connection inspector is opened
+CONNECTION_STATISTICS = os.getenv("PYDM_CONNECTION_STATISTICS", "n").lower() in ("y", "t", "1", "true")
+
+# Deliver each update of a connection to all of its listeners through a single queued
+# connection per signal instead of one queued connection per listener
+FAN_OUT_DISPATCH = os.getenv("PYDM_FAN_OUT_DISPATCH", "n").lower() in ("y", "t", "1", "true")
+
+# Deliver all the control variables of a channel that change at once (units, precision,
+# limits, severity...) to widgets in a single update instead of one per variable
+COALESCED_METADATA = os.getenv("PYDM_COALESCED_METADATA", "n").lower() in ("y", "t", "1", "true")
+
+# Protocols whose channels are shared between PyDM processes through the connection broker
+BROKER_PROTOCOLS = [
+    protocol.strip().lower() for protocol in os.getenv("PYDM_BROKER_PROTOCOLS", "").split(",") if protocol.strip()
+]
+
+# Name of the local socket of the connection broker, defaults to one per user
+BROKER_NAME = os.getenv("PYDM_BROKER_NAME")
+
+# Rolling log file of the event loop responsiveness figures collected when running with --perfmon
+PERFMON_LOG = os.getenv("PYDM_PERFMON_LOG")
+
+# Open displays in new windows by forking them from a pre-warmed server process, as with --fork-server
+FORK_SERVER = os.getenv("PYDM_FORK_SERVER", "n").lower() in ("y", "t", "1", "true")
+
 # Environment variable pointing to a pydm display to return to when the home button is clicked
 HOME_FILE = os.getenv("PYDM_HOME_FILE")
 
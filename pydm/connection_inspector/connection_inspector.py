@@ -11,8 +11,9 @@ from qtpy.QtWidgets import (
     QFileDialog,
     QMessageBox,
     QLabel,
+    QLineEdit,
 )
-from qtpy.QtCore import Qt, Slot, QTimer
+from qtpy.QtCore import Qt, Slot, QTimer, QSortFilterProxyModel
 from .connection_table_model import ConnectionTableModel
 from pydm import data_plugins
 
@@ -20,9 +21,16 @@ from pydm import data_plugins
 class ConnectionInspector(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent, Qt.Window)
+        # Counting updates has a small cost, so only start once someone is looking
+        data_plugins.enable_connection_statistics()
         connections = self.fetch_data()
         self.table_view = ConnectionTableView(connections, self)
         self.setLayout(QVBoxLayout(self))
+        self.filter_edit = QLineEdit(self)
+        self.filter_edit.setPlaceholderText("Filter addresses...")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.textChanged.connect(self.table_view.proxy_model.setFilterFixedString)
+        self.layout().addWidget(self.filter_edit)
         self.layout().addWidget(self.table_view)
         button_layout = QHBoxLayout()
         self.layout().addItem(button_layout)
@@ -44,11 +52,7 @@ class ConnectionInspector(QWidget):
         self.update_timer.start()
 
     def update_data(self):
-        self.table_view.model().connections = self.fetch_data()
-        self.table_view.sortByColumn(
-            self.table_view.horizontalHeader().sortIndicatorSection(),
-            self.table_view.horizontalHeader().sortIndicatorOrder(),
-        )
+        self.table_view.connection_model.connections = self.fetch_data()
 
     def fetch_data(self):
         plugins = data_plugins.plugin_modules
@@ -69,7 +73,7 @@ class ConnectionInspector(QWidget):
                 # User hit Cancel
                 return
             with open(filename, "w") as f:
-                for conn in self.table_view.model().connections:
+                for conn in self.table_view.connection_model.connections:
                     f.write("{p}://{a}\n".format(p=conn.protocol, a=conn.address))
             self.save_status_label.setText("File saved to {}".format(filename))
         except Exception as e:
@@ -82,7 +86,7 @@ class ConnectionInspector(QWidget):
     @Slot()
     def copy_pv_list_to_clipboard(self):
         """Copy the list of PVs from the table to the clipboard"""
-        pv_list = [connection.address for connection in self.table_view.model().connections]
+        pv_list = [connection.address for connection in self.table_view.connection_model.connections]
         if len(pv_list) == 0:
             return
 
@@ -103,6 +107,13 @@ class ConnectionTableView(QTableView):
         self.setSelectionMode(QAbstractItemView.SingleSelection)
         self.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.verticalHeader().setVisible(False)
+        self.connection_model = ConnectionTableModel(connections, self)
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.connection_model)
+        self.proxy_model.setSortRole(Qt.UserRole)
+        self.proxy_model.setFilterKeyColumn(1)
+        self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.proxy_model.setDynamicSortFilter(True)
+        self.setModel(self.proxy_model)
         self.setSortingEnabled(True)
-        self.setModel(ConnectionTableModel(connections, self))
         self.resizeColumnsToContents()
@@ -1,38 +1,70 @@
 from qtpy.QtCore import QAbstractTableModel, Qt, QTimer, Slot
-from operator import attrgetter
+
+
+def _format_latency(latency):
+    return "" if latency is None else "{:.1f}".format(latency * 1000.0)
+
+
+# (header, connection attribute, display formatter)
+_COLUMNS = (
+    ("Protocol", "protocol", str),
+    ("Address", "address", str),
+    ("Connected", "connected", str),
+    ("Listeners", "listener_count", str),
+    ("Received", "updates_received", str),
+    ("Emitted", "updates_emitted", str),
+    ("Bytes", "bytes_received", str),
+    ("Latency (ms)", "last_latency", _format_latency),
+    ("Max/s", "max_burst", str),
+)
+
+# Columns which may change while the connection exists
+_DYNAMIC_COLUMNS = tuple(range(2, len(_COLUMNS)))
 
 
 class ConnectionTableModel(QAbstractTableModel):
+    """
+    Table of the data plugin connections and their runtime statistics.
+
+    Values are refreshed periodically, notifying views only about the rows
+    whose values changed since the previous refresh.  The raw value of each
+    cell is available through ``Qt.UserRole``, which is what the inspector
+    sorts on.
+    """
+
     def __init__(self, connections=[], parent=None):
         super().__init__(parent=parent)
-        self._column_names = ("protocol", "address", "connected")
+        self._column_names = tuple(column[1] for column in _COLUMNS)
+        self._connections = []
+        self._snapshots = []
         self.update_timer = QTimer(self)
         self.update_timer.setInterval(1000)
         self.update_timer.timeout.connect(self.update_values)
         self.connections = connections
 
-    def sort(self, col, order=Qt.AscendingOrder):
-        if self._column_names[col] == "value":
-            return
-        self.layoutAboutToBeChanged.emit()
-        sort_reversed = order == Qt.AscendingOrder
-        self._connections.sort(key=attrgetter(self._column_names[col]), reverse=sort_reversed)
-        self.layoutChanged.emit()
-
     @property
     def connections(self):
         return self._connections
 
     @connections.setter
     def connections(self, new_connections):
-        self.beginResetModel()
-        self._connections = new_connections
-        self.endResetModel()
+        new_connections = list(new_connections)
+        if len(new_connections) != len(self._connections) or any(
+            new is not old for new, old in zip(new_connections, self._connections)
+        ):
+            self.beginResetModel()
+            self._connections = new_connections
+            self._snapshots = [self._snapshot(conn) for conn in new_connections]
+            self.endResetModel()
         if len(self._connections) > 0:
             self.update_timer.start()
         else:
             self.update_timer.stop()
 
+    @staticmethod
+    def _snapshot(conn):
+        return tuple(getattr(conn, _COLUMNS[col][1], None) for col in _DYNAMIC_COLUMNS)
+
     # QAbstractItemModel Implementation
     def flags(self, index):
         return Qt.ItemIsSelectable | Qt.ItemIsEnabled
@@ -52,10 +84,16 @@ class ConnectionTableModel(QAbstractTableModel):
             return None
         if index.column() >= self.columnCount():
             return None
-        column_name = self._column_names[index.column()]
+        _, attribute, formatter = _COLUMNS[index.column()]
         conn = self.connections[index.row()]
+        value = getattr(conn, attribute, None)
         if role == Qt.DisplayRole or role == Qt.EditRole:
-            return str(getattr(conn, column_name))
+            return formatter(value)
+        elif role == Qt.UserRole:
+            if attribute in ("protocol", "address"):
+                return str(value)
+            # Keep numeric columns numeric so they sort by value
+            return -1.0 if value is None else float(value)
         else:
             return None
 
@@ -63,7 +101,7 @@ class ConnectionTableModel(QAbstractTableModel):
         if role != Qt.DisplayRole:
             return super().headerData(section, orientation, role)
         if orientation == Qt.Horizontal and section < self.columnCount():
-            return str(self._column_names[section]).capitalize()
+            return _COLUMNS[section][0]
         elif orientation == Qt.Vertical and section < self.rowCount():
             return section
 
@@ -71,4 +109,22 @@ class ConnectionTableModel(QAbstractTableModel):
 
     @Slot()
     def update_values(self):
-        self.dataChanged.emit(self.index(0, 2), self.index(self.rowCount(), 2))
+        """Notify views about the rows whose values changed since the last update."""
+        first = None
+        last = None
+        for row, conn in enumerate(self._connections):
+            snapshot = self._snapshot(conn)
+            if snapshot == self._snapshots[row]:
+                if first is not None:
+                    self._emit_rows_changed(first, last)
+                    first = None
+                continue
+            self._snapshots[row] = snapshot
+            if first is None:
+                first = row
+            last = row
+        if first is not None:
+            self._emit_rows_changed(first, last)
+
+    def _emit_rows_changed(self, first, last):
+        self.dataChanged.emit(self.index(first, _DYNAMIC_COLUMNS[0]), self.index(last, _DYNAMIC_COLUMNS[-1]))
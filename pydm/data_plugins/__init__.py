@@ -2,30 +2,44 @@
 Loads all the data plugins available at the given PYDM_DATA_PLUGINS_PATH
 environment variable and subfolders that follows the *_plugin.py and have
 classes that inherits from the pydm.data_plugins.PyDMPlugin class.
+
+Plugins are imported and instantiated the first time a channel uses their
+protocol, see :func:`load_plugin`.
 """
 
+import functools
 import inspect
 import logging
 import os
+import threading
 from collections import deque
 from contextlib import contextmanager
-from typing import Any, Dict, Generator, List, Optional, Type
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Type
 
 import entrypoints
 from qtpy.QtWidgets import QApplication
 
 from pydm import config
 from pydm.utilities import import_module_by_filename, log_failures, parsed_address
-from .plugin import PyDMPlugin
+from .manifest import get_manifest
+from .plugin import PyDMConnection, PyDMPlugin
 
 logger = logging.getLogger(__name__)
 plugin_modules: Dict[str, PyDMPlugin] = {}
+# Plugins found but not imported yet, keyed on protocol.  Values are lists of
+# (origin, loader) by increasing precedence, the loader returning the class.
+_lazy_plugins: Dict[str, List[Tuple[str, Callable[[], Any]]]] = {}
+_source_modules = {}
+_plugins_lock = threading.RLock()
 __read_only = False
 global __CONNECTION_QUEUE__
 __CONNECTION_QUEUE__ = None
 global __DEFER_CONNECTIONS__
 __DEFER_CONNECTIONS__ = False
 __plugins_initialized = False
+# Sources registered by a search that skipped the unknown plugins, replaced
+# by the next complete search.
+_partial_sources: List[Tuple[str, Tuple[str, Callable[[], Any]]]] = []
 
 
 @contextmanager
@@ -71,9 +85,17 @@ def establish_connection_immediately(channel):
     plugin.add_connection(channel)
 
 
-def plugin_for_address(address: str) -> Optional[PyDMPlugin]:
+def plugin_for_address(address: str, use_broker: bool = True) -> Optional[PyDMPlugin]:
     """
     Find the correct PyDMPlugin for a channel
+
+    Parameters
+    ----------
+    address : str
+        The address of the channel.
+    use_broker : bool, optional
+        Whether channels of the protocols listed in ``PYDM_BROKER_PROTOCOLS``
+        go through the connection broker, see :mod:`pydm.data_plugins.broker`.
     """
     # Check for a configured protocol
     try:
@@ -90,9 +112,16 @@ def plugin_for_address(address: str) -> Optional[PyDMPlugin]:
 
     # Load proper plugin module
     if protocol:
+        protocol = str(protocol).lower()
+        if use_broker and protocol in config.BROKER_PROTOCOLS:
+            from .broker import broker_plugin
+
+            return broker_plugin(protocol)
         initialize_plugins_if_needed()
+        if protocol not in plugin_modules:
+            load_plugin(protocol)
         try:
-            return plugin_modules[(str(protocol)).lower()]
+            return plugin_modules[protocol]
         except KeyError:
             logger.exception("Could not find protocol for %r", address)
     # Catch all in case of improper plugin specification
@@ -139,6 +168,119 @@ def add_plugin(plugin: Type[PyDMPlugin]) -> Optional[PyDMPlugin]:
     return instance
 
 
+def load_plugin(protocol: str) -> Optional[PyDMPlugin]:
+    """
+    Import and instantiate the data plugin for a protocol, unless it was
+    already.  If several plugins were found for the protocol, the last one
+    found is used, falling back on the previous ones if it fails to load.
+
+    Parameters
+    ----------
+    protocol : str
+        The protocol of the plugin.
+
+    Returns
+    -------
+    plugin : PyDMPlugin, optional
+        The plugin instance, None if no plugin could be loaded.
+    """
+    with _plugins_lock:
+        if protocol in plugin_modules:
+            return plugin_modules[protocol]
+        sources = _lazy_plugins.pop(protocol, [])
+        while sources:
+            origin, loader = sources.pop()
+            plugin = loader()
+            if plugin is None:
+                # The reason was logged by the loader
+                continue
+            if not _is_valid_plugin_class(plugin) or plugin.protocol != protocol:
+                logger.warning("%s does not provide a data plugin for protocol %s", origin, protocol)
+                continue
+            logger.debug("Loading data plugin %s for protocol %s from %s", plugin, protocol, origin)
+            instance = add_plugin(plugin)
+            if instance is not None:
+                return instance
+    return None
+
+
+def load_all_plugins() -> Dict[str, PyDMPlugin]:
+    """
+    Import and instantiate every data plugin found.
+
+    Returns
+    -------
+    plugins : dict
+        The plugin instances keyed on protocol.
+    """
+    initialize_plugins_if_needed()
+    for protocol in list(_lazy_plugins):
+        load_plugin(protocol)
+    return dict(plugin_modules)
+
+
+def available_plugins() -> Dict[str, str]:
+    """
+    The protocols of all the data plugins found, loaded or not.
+
+    Returns
+    -------
+    plugins : dict
+        Where each protocol is provided from, i.e. the file of the plugin
+        class or the name of the entrypoint, keyed on protocol.
+    """
+    initialize_plugins_if_needed()
+    with _plugins_lock:
+        available = {protocol: sources[-1][0] for protocol, sources in _lazy_plugins.items() if sources}
+        for protocol, plugin in plugin_modules.items():
+            try:
+                available[protocol] = inspect.getfile(plugin.__class__)
+            except TypeError:
+                available[protocol] = plugin.__class__.__module__
+    return available
+
+
+def register_lazy_plugin(protocol: str, origin: str, loader: Callable[[], Any]) -> None:
+    """
+    Make a data plugin available without importing it yet.
+
+    Parameters
+    ----------
+    protocol : str
+        The protocol the plugin provides.
+    origin : str
+        Where the plugin comes from, for the logs.
+    loader : callable
+        Called without arguments the first time the protocol is used, it
+        returns the plugin class or None if it could not be loaded.
+    """
+    with _plugins_lock:
+        if protocol in plugin_modules:
+            logger.debug("Ignoring data plugin from %s, protocol %s is already loaded", origin, protocol)
+            return
+        sources = _lazy_plugins.setdefault(protocol, [])
+        if sources:
+            logger.warning("Replacing the data plugin of protocol %s with the one from %s", protocol, origin)
+        sources.append((origin, loader))
+
+
+@log_failures(
+    logger,
+    explanation=("Unable to import plugin file: {args[0]}.  This plugin will be skipped."),
+    include_traceback=True,
+)
+def _import_plugin_source(source_filename: str):
+    module = _source_modules.get(source_filename)
+    if module is None:
+        module = _source_modules[source_filename] = import_module_by_filename(source_filename)
+    return module
+
+
+def _load_plugin_attribute(source_filename: str, attribute: str) -> Any:
+    module = _import_plugin_source(source_filename)
+    return getattr(module, attribute, None) if module is not None else None
+
+
 @log_failures(
     logger,
     explanation=("Unable to import plugin file: {args[0]}.  This plugin will be skipped."),
@@ -158,10 +300,28 @@ def _get_plugins_from_source(source_filename: str) -> List[Type[PyDMPlugin]]:
     plugins : list of PyDMPlugin classes
         The plugin classes.
     """
-    module = import_module_by_filename(source_filename)
+    module = _import_plugin_source(source_filename)
     return list(set(obj for _, obj in inspect.getmembers(module) if _is_valid_plugin_class(obj)))
 
 
+@log_failures(
+    logger,
+    explanation=("Unable to import plugin file: {args[0]}.  This plugin will be skipped."),
+    include_traceback=True,
+)
+def _get_plugin_attributes(source_filename: str) -> List[Tuple[str, str]]:
+    """
+    Import a plugin file to find its plugins, in the form returned by
+    :meth:`~pydm.data_plugins.manifest.PluginManifest.protocols`.
+    """
+    module = _import_plugin_source(source_filename)
+    found = {}
+    for attribute, obj in inspect.getmembers(module):
+        if _is_valid_plugin_class(obj) and obj.protocol and obj not in found:
+            found[obj] = (obj.protocol, attribute)
+    return list(found.values())
+
+
 def find_plugins_from_path(
     path: str, token: str = config.DATA_PLUGIN_SUFFIX
 ) -> Generator[Type[PyDMPlugin], None, None]:
@@ -175,15 +335,19 @@ def find_plugins_from_path(
     token : str, optional
         The suffix that plugin files are expected to have.
     """
+    for source_filename in _find_plugin_files(path, token):
+        yield from _get_plugins_from_source(source_filename)
 
+
+def _find_plugin_files(path: str, token: str) -> Generator[str, None, None]:
     for root, _, files in os.walk(path):
         if root.split(os.path.sep)[-1].startswith("__"):
             continue
 
         logger.debug("Looking for PyDM Data Plugins at: %s", root)
-        for name in files:
+        for name in sorted(files):
             if name.endswith(token):
-                yield from _get_plugins_from_source(os.path.join(root, name))
+                yield os.path.join(root, name)
 
 
 def find_plugins_from_entrypoints(
@@ -202,17 +366,22 @@ def find_plugins_from_entrypoints(
     """
     for entry in entrypoints.get_group_all(key):
         logger.debug("Found data plugin entrypoint: %s", entry.name)
-        try:
-            plugin_cls = entry.load()
-        except Exception as ex:
-            logger.exception("Failed to load %s entry %s: %s", key, entry.name, ex)
-            continue
+        plugin_cls = _load_entrypoint(entry, key)
+        if plugin_cls is not None:
+            yield plugin_cls
 
-        if not _is_valid_plugin_class(plugin_cls):
-            logger.warning("Invalid plugin class specified in entrypoint %s: %s", entry.name, plugin_cls)
-            continue
 
-        yield plugin_cls
+def _load_entrypoint(entry, key: str = config.ENTRYPOINT_DATA_PLUGIN) -> Optional[Type[PyDMPlugin]]:
+    try:
+        plugin_cls = entry.load()
+    except Exception as ex:
+        logger.exception("Failed to load %s entry %s: %s", key, entry.name, ex)
+        return None
+
+    if not _is_valid_plugin_class(plugin_cls):
+        logger.warning("Invalid plugin class specified in entrypoint %s: %s", entry.name, plugin_cls)
+        return None
+    return plugin_cls
 
 
 def _is_valid_plugin_class(obj: Any) -> bool:
@@ -285,6 +454,107 @@ def load_plugins_from_path(locations: List[str], token: str = config.DATA_PLUGIN
     return added_plugins
 
 
+def register_plugins_from_path(
+    locations: List[str], token: str = config.DATA_PLUGIN_SUFFIX, import_unknown: bool = True
+) -> List[str]:
+    """
+    Make the plugins found in file locations available without importing
+    them, using the protocols listed for each file by the data plugin
+    manifest.  Files whose protocols can not be found without importing them
+    are imported right away, their plugins are still only instantiated once
+    their protocol gets used.
+
+    Parameters
+    ----------
+    locations : list of str
+        List of file locations
+
+    token : str
+        Phrase that must match the end of the filename for it to be checked for
+        PyDMPlugins
+
+    import_unknown : bool, optional
+        Whether to import the files whose protocols are not declared.  If
+        False these files are skipped.
+
+    Returns
+    -------
+    protocols : list of str
+        The protocols of the plugins found in these locations.
+    """
+    manifest = get_manifest()
+    protocols = []
+    for loc in locations:
+        for source_filename in _find_plugin_files(loc, token):
+            declared = manifest.protocols(source_filename)
+            if not declared and not import_unknown:
+                logger.debug("Skipping data plugin file %s, its protocols are unknown", source_filename)
+                continue
+            if not declared:
+                declared = _get_plugin_attributes(source_filename) or []
+            for protocol, attribute in declared:
+                loader = functools.partial(_load_plugin_attribute, source_filename, attribute)
+                register_lazy_plugin(protocol, source_filename, loader)
+                protocols.append(protocol)
+    return protocols
+
+
+def register_plugins_from_entrypoints(
+    key: str = config.ENTRYPOINT_DATA_PLUGIN, import_unknown: bool = True
+) -> List[str]:
+    """
+    Make the plugins specified by entrypoints available without importing
+    them.  The protocol of an entrypoint is only known once it was loaded,
+    so each entrypoint is loaded once and its protocol recorded in the data
+    plugin manifest for the following sessions.
+
+    Parameters
+    ----------
+    key : str, optional
+        The entrypoint key.
+    import_unknown : bool, optional
+        Whether to load the entrypoints whose protocols are not recorded
+        yet.  If False these entrypoints are skipped.
+
+    Returns
+    -------
+    protocols : list of str
+        The protocols of the plugins found.
+    """
+    manifest = get_manifest()
+    protocols = []
+    for entry in entrypoints.get_group_all(key):
+        logger.debug("Found data plugin entrypoint: %s", entry.name)
+        protocol = manifest.entrypoint_protocol(entry)
+        if protocol is None and not import_unknown:
+            logger.debug("Skipping data plugin entrypoint %s, its protocol is unknown", entry.name)
+            continue
+        if protocol is None:
+            plugin_cls = _load_entrypoint(entry, key)
+            if plugin_cls is None:
+                continue
+            if not plugin_cls.protocol:
+                logger.warning("No protocol specified for data plugin: %s.%s", plugin_cls.__module__, plugin_cls)
+                continue
+            protocol = plugin_cls.protocol
+            manifest.set_entrypoint_protocol(entry, protocol)
+        loader = functools.partial(_load_entrypoint, entry, key)
+        register_lazy_plugin(protocol, "entrypoint {}".format(entry.name), loader)
+        protocols.append(protocol)
+    return protocols
+
+
+def enable_connection_statistics():
+    """
+    Make every current and future connection collect runtime statistics.
+    See :meth:`PyDMConnection.enable_statistics`.
+    """
+    PyDMConnection.collect_statistics = True
+    for plugin in plugin_modules.values():
+        for connection in list(plugin.connections.values()):
+            connection.enable_statistics()
+
+
 def is_read_only():
     """
     Check whether or not the app is running with the read only flag set.
@@ -311,14 +581,41 @@ def set_read_only(read_only):
         logger.info("Running PyDM in Read Only mode.")
 
 
-def initialize_plugins_if_needed():
-    global __plugins_initialized
-
-    if __plugins_initialized:
-        return
+def initialize_plugins_if_needed(import_unknown: bool = True):
+    """
+    Find the data plugins, once.  Plugins are only imported and instantiated
+    the first time their protocol is used, see :func:`load_plugin`.
 
-    __plugins_initialized = True
+    Parameters
+    ----------
+    import_unknown : bool, optional
+        Whether to import the plugin files and entrypoints whose protocols
+        can not be known otherwise.  If False, nothing is imported and the
+        plugins are searched for again by the next call importing them.
+    """
+    global __plugins_initialized
 
+    with _plugins_lock:
+        if __plugins_initialized:
+            return
+        if not import_unknown:
+            if not _partial_sources:
+                registered = {protocol: len(sources) for protocol, sources in _lazy_plugins.items()}
+                _find_plugins(import_unknown=False)
+                for protocol, sources in _lazy_plugins.items():
+                    _partial_sources.extend((protocol, source) for source in sources[registered.get(protocol, 0) :])
+            return
+
+        # Search again, so that the sources skipped before keep their place
+        for protocol, source in _partial_sources:
+            if source in _lazy_plugins.get(protocol, []):
+                _lazy_plugins[protocol].remove(source)
+        _partial_sources.clear()
+        __plugins_initialized = True
+        _find_plugins()
+
+
+def _find_plugins(import_unknown: bool = True):
     # Load the data plugins from PYDM_DATA_PLUGINS_PATH
     logger.debug("*" * 80)
     logger.debug("* Loading PyDM Data Plugins")
@@ -334,5 +631,5 @@ def initialize_plugins_if_needed():
     plugin_dir = os.path.dirname(os.path.realpath(__file__))
     locations.insert(0, plugin_dir)
 
-    load_plugins_from_path(locations)
-    load_plugins_from_entrypoints(config.ENTRYPOINT_DATA_PLUGIN)
+    register_plugins_from_path(locations, import_unknown=import_unknown)
+    register_plugins_from_entrypoints(config.ENTRYPOINT_DATA_PLUGIN, import_unknown=import_unknown)
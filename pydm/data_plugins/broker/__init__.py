@@ -0,0 +1,22 @@
+"""
+Sharing of data plugin connections between PyDM processes.
+
+Every window opened in a new process makes its own connections, so the same
+PV is subscribed to once per window.  When ``PYDM_BROKER_PROTOCOLS`` lists
+protocols, their channels are instead served by a broker process, started on
+demand, which makes a single connection per address for all the PyDM
+processes of the user and republishes its updates to each of them over a
+local socket.
+"""
+
+from .client import BrokerClient, BrokerConnection, BrokerPlugin, broker_plugin, server_name
+from .server import Broker
+
+__all__ = [
+    "Broker",
+    "BrokerClient",
+    "BrokerConnection",
+    "BrokerPlugin",
+    "broker_plugin",
+    "server_name",
+]
@@ -0,0 +1,39 @@
+"""Run the connection broker: ``python -m pydm.data_plugins.broker [NAME]``."""
+
+import argparse
+import logging
+import sys
+
+from qtpy.QtCore import QCoreApplication
+
+from pydm import config
+
+from .client import server_name
+from .server import Broker
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyDM connection broker")
+    parser.add_argument("name", nargs="?", default=None, help="Name of the local socket to listen on")
+    parser.add_argument(
+        "--linger",
+        type=float,
+        default=30.0,
+        help="Seconds to keep running once the last client disconnected, negative to keep running",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(format="[%(asctime)s] [%(levelname)-8s] - %(message)s", level=logging.INFO)
+
+    # The channels made by the plugins of the broker itself, such as the ones of
+    # calc:// expressions, connect directly
+    config.BROKER_PROTOCOLS = []
+    app = QCoreApplication(sys.argv[:1])
+    broker = Broker(args.name or server_name(), linger=int(args.linger * 1000))
+    if not broker.listen():
+        sys.exit(1)
+    logging.getLogger(__name__).info("PyDM connection broker listening as %s", broker.name)
+    sys.exit(app.exec_())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+import getpass
+import logging
+import sys
+from typing import Dict, Optional
+
+import numpy as np
+from qtpy.QtCore import QObject, QProcess, QTimer, Qt, Slot
+from qtpy.QtNetwork import QLocalSocket
+
+from pydm import config
+from pydm.data_plugins import is_read_only
+from pydm.data_plugins.plugin import _LISTENER_SLOTS, PyDMConnection, PyDMPlugin
+from pydm.widgets.channel import PyDMChannel
+
+from . import messages
+
+logger = logging.getLogger(__name__)
+
+# Signal of PyDMConnection emitted for the values of each PyDMChannel slot
+_SIGNAL_FOR_SLOT = {slot_name: signal_name for signal_name, slot_name in _LISTENER_SLOTS}
+_SIGNAL_FOR_SLOT["value_slot"] = "new_value_signal"
+
+_VALUE_SIGNAL_TYPES = (int, float, str, bool)
+
+
+def server_name() -> str:
+    """The name of the local socket of the broker, from ``PYDM_BROKER_NAME`` if set."""
+    return config.BROKER_NAME or "pydm-broker-{}".format(getpass.getuser())
+
+
+class BrokerConnection(PyDMConnection):
+    """
+    Connection to an address through the broker, which owns the actual data
+    plugin connection and republishes its updates to every PyDM process
+    subscribed to the address.
+    """
+
+    def __init__(self, channel: PyDMChannel, address: str, protocol: Optional[str] = None, parent=None):
+        super().__init__(channel, address, protocol, parent)
+        self.client = None
+        # Last value received for each PyDMChannel slot, replayed to new listeners
+        self._state = {}
+        self.add_listener(channel)
+
+    def add_listener(self, channel: PyDMChannel) -> None:
+        super().add_listener(channel)
+        for slot_name, value in self._state.items():
+            self._emit(slot_name, value)
+        if channel.value_signal is not None:
+            for signal_type in (int, float, str, bool, np.ndarray):
+                try:
+                    channel.value_signal[signal_type].connect(self.put_value, Qt.QueuedConnection)
+                # When signal type can't be found, PyQt5 throws KeyError here, but PySide6 index error.
+                # If signal type exists but doesn't match the slot, TypeError gets thrown.
+                except (KeyError, IndexError, TypeError):
+                    pass
+
+    def receive(self, slot_name: str, value) -> None:
+        """Deliver a value published by the broker to the listeners of this connection."""
+        if slot_name == "write_access_slot" and is_read_only():
+            value = False
+        elif slot_name == "connection_slot":
+            self.connected = value
+        elif slot_name == "value_slot":
+            self.value = value
+        self._state[slot_name] = value
+        self._emit(slot_name, value)
+
+    def _emit(self, slot_name: str, value) -> None:
+        signal = getattr(self, _SIGNAL_FOR_SLOT[slot_name])
+        if slot_name == "value_slot":
+            signal[type(value) if type(value) in _VALUE_SIGNAL_TYPES else object].emit(value)
+        elif slot_name.endswith("_limit_slot") and isinstance(value, int):
+            signal[int].emit(value)
+        else:
+            signal.emit(value)
+
+    @Slot(int)
+    @Slot(float)
+    @Slot(str)
+    @Slot(bool)
+    @Slot(np.ndarray)
+    def put_value(self, new_value):
+        if is_read_only():
+            return
+        if self.client is not None:
+            self.client.send(messages.PUT, self.address, new_value)
+
+    def close(self):
+        if self.client is not None:
+            self.client.unsubscribe(self)
+            self.client = None
+        super().close()
+
+
+class BrokerClient(QObject):
+    """
+    The link of a PyDM process to the broker, shared by the broker plugins
+    of every protocol.
+
+    The broker is started on demand if it is not running.  Subscriptions are
+    sent again whenever the link is established, so that they survive a
+    restart of the broker.
+
+    Parameters
+    ----------
+    name : str
+        The name of the local socket of the broker.
+    """
+
+    # Milliseconds between attempts to reach the broker
+    retry_interval = 500
+
+    def __init__(self, name: str, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.name = name
+        self.connections: Dict[str, BrokerConnection] = {}
+        self._reader = messages.MessageReader()
+        self._started_broker = False
+        self._socket = QLocalSocket(self)
+        self._socket.connected.connect(self._on_connected)
+        self._socket.disconnected.connect(self._on_disconnected)
+        self._socket.readyRead.connect(self._read)
+        self._socket.errorOccurred.connect(self._on_error)
+        self._retry_timer = QTimer(self)
+        self._retry_timer.setSingleShot(True)
+        self._retry_timer.setInterval(self.retry_interval)
+        self._retry_timer.timeout.connect(self._connect)
+        self._connect()
+
+    @property
+    def is_connected(self) -> bool:
+        return self._socket.state() == QLocalSocket.ConnectedState
+
+    def _connect(self) -> None:
+        if self._socket.state() == QLocalSocket.UnconnectedState:
+            self._socket.connectToServer(self.name)
+
+    def start_broker(self) -> None:
+        """Start a broker process, detached so that it outlives this process."""
+        logger.info("Starting the PyDM connection broker %s", self.name)
+        QProcess.startDetached(sys.executable, ["-m", "pydm.data_plugins.broker", self.name])
+        self._started_broker = True
+
+    @Slot()
+    def _on_connected(self) -> None:
+        logger.debug("Connected to the PyDM connection broker %s", self.name)
+        self._reader = messages.MessageReader()
+        for address in self.connections:
+            self.send(messages.SUBSCRIBE, address)
+
+    @Slot()
+    def _on_disconnected(self) -> None:
+        logger.warning("Lost the PyDM connection broker %s, reconnecting", self.name)
+        for connection in self.connections.values():
+            connection.receive("connection_slot", False)
+        self._started_broker = False
+        self._retry_timer.start()
+
+    def _on_error(self, error) -> None:
+        if self._socket.state() == QLocalSocket.ConnectedState:
+            return
+        if not self._started_broker and error in (
+            QLocalSocket.ServerNotFoundError,
+            QLocalSocket.ConnectionRefusedError,
+        ):
+            self.start_broker()
+        self._retry_timer.start()
+
+    @Slot()
+    def _read(self) -> None:
+        for kind, address, slot_name, value in self._reader.feed(bytes(self._socket.readAll())):
+            connection = self.connections.get(address)
+            if kind == messages.UPDATE and connection is not None:
+                connection.receive(slot_name, value)
+
+    def send(self, kind: str, address: str, *args) -> None:
+        if self.is_connected:
+            self._socket.write(messages.encode((kind, address) + args))
+
+    def subscribe(self, connection: BrokerConnection) -> None:
+        if self.connections.get(connection.address) is connection:
+            return
+        connection.client = self
+        self.connections[connection.address] = connection
+        self.send(messages.SUBSCRIBE, connection.address)
+
+    def unsubscribe(self, connection: BrokerConnection) -> None:
+        if self.connections.get(connection.address) is connection:
+            del self.connections[connection.address]
+            self.send(messages.UNSUBSCRIBE, connection.address)
+
+
+class BrokerPlugin(PyDMPlugin):
+    """
+    Stands in for the data plugin of a protocol, getting the data of its
+    channels from the broker.
+
+    Parameters
+    ----------
+    protocol : str
+        The protocol of the plugin it stands in for.
+    client : BrokerClient
+        The link to the broker.
+    """
+
+    connection_class = BrokerConnection
+
+    def __init__(self, protocol: str, client: BrokerClient):
+        super().__init__()
+        self.protocol = protocol
+        self.client = client
+
+    # The broker shares connections by the complete address
+    @staticmethod
+    def get_connection_id(channel: PyDMChannel) -> str:
+        return channel.address
+
+    @staticmethod
+    def get_address(channel: PyDMChannel) -> str:
+        return channel.address
+
+    def add_connection(self, channel: PyDMChannel) -> None:
+        super().add_connection(channel)
+        connection = self.connections.get(self.get_connection_id(channel))
+        if connection is not None and connection.client is None:
+            self.client.subscribe(connection)
+
+
+_client = None
+_plugins: Dict[str, BrokerPlugin] = {}
+
+
+def broker_plugin(protocol: str) -> BrokerPlugin:
+    """
+    The plugin getting the channels of a protocol from the broker, creating
+    the link to the broker on first use.
+
+    Parameters
+    ----------
+    protocol : str
+        The protocol of the channels.
+
+    Returns
+    -------
+    BrokerPlugin
+    """
+    global _client
+    plugin = _plugins.get(protocol)
+    if plugin is None:
+        if _client is None:
+            _client = BrokerClient(server_name())
+        plugin = _plugins[protocol] = BrokerPlugin(protocol, _client)
+    return plugin
@@ -0,0 +1,55 @@
+"""
+Framing of the messages exchanged between the broker and its clients.
+
+Each message is a tuple pickled and prefixed with its length.  Pickle keeps
+NumPy arrays compact and fast to decode; the broker only accepts clients of
+the user who started it, see :class:`~pydm.data_plugins.broker.server.Broker`.
+"""
+
+import pickle
+import struct
+from typing import List
+
+_HEADER = struct.Struct("!I")
+
+# Client to broker
+SUBSCRIBE = "subscribe"
+UNSUBSCRIBE = "unsubscribe"
+PUT = "put"
+# Broker to client, with the name of the PyDMChannel slot the value is for
+UPDATE = "update"
+
+
+def encode(message: tuple) -> bytes:
+    """Frame a message to be written to a socket."""
+    payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    return _HEADER.pack(len(payload)) + payload
+
+
+class MessageReader:
+    """Reassembles the messages from the bytes read from a socket."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[tuple]:
+        """
+        Add the bytes read from the socket.
+
+        Returns
+        -------
+        list of tuple
+            The messages completed by these bytes.
+        """
+        self._buffer += data
+        messages = []
+        offset = 0
+        while len(self._buffer) - offset >= _HEADER.size:
+            (size,) = _HEADER.unpack_from(self._buffer, offset)
+            end = offset + _HEADER.size + size
+            if len(self._buffer) < end:
+                break
+            messages.append(pickle.loads(self._buffer[offset + _HEADER.size : end]))
+            offset = end
+        del self._buffer[:offset]
+        return messages
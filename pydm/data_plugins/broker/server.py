@@ -0,0 +1,220 @@
+import functools
+import logging
+import os
+from typing import Dict, Optional, Set
+
+import numpy as np
+from qtpy.QtCore import QCoreApplication, QDir, QLockFile, QObject, QTimer, Signal, Slot
+from qtpy.QtNetwork import QLocalServer, QLocalSocket
+
+from pydm import data_plugins
+from pydm.widgets.channel import PyDMChannel
+
+from . import messages
+
+logger = logging.getLogger(__name__)
+
+# PyDMChannel slots through which the broker receives the data it republishes
+_PUBLISHED_SLOTS = (
+    "connection_slot",
+    "value_slot",
+    "severity_slot",
+    "write_access_slot",
+    "enum_strings_slot",
+    "unit_slot",
+    "prec_slot",
+    "upper_ctrl_limit_slot",
+    "lower_ctrl_limit_slot",
+    "upper_alarm_limit_slot",
+    "lower_alarm_limit_slot",
+    "upper_warning_limit_slot",
+    "lower_warning_limit_slot",
+    "timestamp_slot",
+)
+
+
+class _Subscription(QObject):
+    """
+    The channel of the broker for one address, shared by all the clients
+    subscribed to it.
+    """
+
+    value_signal = Signal([int], [float], [str], [bool], [np.ndarray])
+
+    def __init__(self, broker: "Broker", address: str):
+        super().__init__(broker)
+        self.broker = broker
+        self.address = address
+        self.clients: Set[QLocalSocket] = set()
+        # Last value received for each slot, sent to new subscribers
+        self.state = {}
+        slots = {name: functools.partial(self.publish, name) for name in _PUBLISHED_SLOTS}
+        self.channel = PyDMChannel(address, value_signal=self.value_signal, **slots)
+
+    def publish(self, slot_name: str, value) -> None:
+        self.state[slot_name] = value
+        self.broker.write(self.clients, messages.encode((messages.UPDATE, self.address, slot_name, value)))
+
+    def put(self, value) -> None:
+        if isinstance(value, np.generic):
+            value = value.item()
+        signal_type = np.ndarray if isinstance(value, np.ndarray) else type(value)
+        try:
+            self.value_signal[signal_type].emit(value)
+        except (KeyError, IndexError):
+            logger.warning("Unable to write a value of type %s to %s", type(value).__name__, self.address)
+
+
+class Broker(QObject):
+    """
+    Local server sharing data plugin connections between PyDM processes.
+
+    The broker makes one connection per address, through the data plugins,
+    whatever the number of PyDM processes subscribed to it, and republishes
+    its updates to each of them over a local socket.  A process subscribing
+    to an address which already has a connection immediately receives its
+    last known value and control variables.  Values written by any process
+    are written through the shared connection.
+
+    Only the user running the broker can connect to it.
+
+    Parameters
+    ----------
+    name : str
+        The name of the local socket to listen on.
+    parent : QObject, optional
+        The parent of the broker.
+    linger : int, optional
+        Milliseconds to keep running once the last client disconnected,
+        before quitting the application.  Negative values keep it running.
+    """
+
+    # Milliseconds to wait for another broker starting with the same name
+    startup_timeout = 5000
+
+    def __init__(self, name: str, parent: Optional[QObject] = None, linger: int = 30000):
+        super().__init__(parent)
+        self.name = name
+        self.subscriptions: Dict[str, _Subscription] = {}
+        self._clients: Dict[QLocalSocket, messages.MessageReader] = {}
+        self._server = QLocalServer(self)
+        self._server.setSocketOptions(QLocalServer.UserAccessOption)
+        self._server.newConnection.connect(self._accept)
+        self._linger_timer = QTimer(self)
+        self._linger_timer.setSingleShot(True)
+        self._linger_timer.setInterval(max(linger, 0))
+        self._linger_timer.timeout.connect(QCoreApplication.quit)
+        self._linger = linger >= 0
+
+    def listen(self) -> bool:
+        """
+        Start accepting clients.
+
+        Returns
+        -------
+        bool
+            False if another broker already serves this name or the socket
+            could not be created.
+        """
+        # Brokers starting at the same time take turns, so that one of them
+        # does not remove the socket the other one just created.
+        lock = QLockFile(self._socket_path() + ".lock")
+        if not lock.tryLock(self.startup_timeout):
+            logger.error("Unable to lock %s: another broker is still starting", lock.fileName())
+            return False
+        try:
+            if self._is_served():
+                logger.info("A PyDM connection broker is already running as %s", self.name)
+                return False
+            # Clean up the socket left behind by a broker which did not exit properly
+            QLocalServer.removeServer(self.name)
+            if not self._server.listen(self.name):
+                logger.error("Unable to listen as %s: %s", self.name, self._server.errorString())
+                return False
+        finally:
+            lock.unlock()
+        if self._linger:
+            self._linger_timer.start()
+        return True
+
+    def _socket_path(self) -> str:
+        """The path of the socket, as QLocalServer resolves the name."""
+        if os.path.isabs(self.name):
+            return self.name
+        return os.path.join(QDir.tempPath(), self.name)
+
+    def _is_served(self) -> bool:
+        """Whether something answers on the socket name of the broker."""
+        probe = QLocalSocket()
+        probe.connectToServer(self.name)
+        if probe.waitForConnected(1000):
+            probe.disconnectFromServer()
+            return True
+        return False
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    @Slot()
+    def _accept(self) -> None:
+        while self._server.hasPendingConnections():
+            client = self._server.nextPendingConnection()
+            self._clients[client] = messages.MessageReader()
+            client.readyRead.connect(functools.partial(self._read, client))
+            client.disconnected.connect(functools.partial(self._drop_client, client))
+            self._linger_timer.stop()
+
+    def _read(self, client: QLocalSocket) -> None:
+        reader = self._clients.get(client)
+        if reader is None:
+            return
+        for message in reader.feed(bytes(client.readAll())):
+            kind, address = message[:2]
+            if kind == messages.SUBSCRIBE:
+                self.subscribe(client, address)
+            elif kind == messages.UNSUBSCRIBE:
+                self.unsubscribe(client, address)
+            elif kind == messages.PUT and address in self.subscriptions:
+                self.subscriptions[address].put(message[2])
+
+    def subscribe(self, client: QLocalSocket, address: str) -> None:
+        subscription = self.subscriptions.get(address)
+        if subscription is None:
+            subscription = self.subscriptions[address] = _Subscription(self, address)
+            plugin = data_plugins.plugin_for_address(address, use_broker=False)
+            if plugin is not None:
+                plugin.add_connection(subscription.channel)
+        elif client not in subscription.clients:
+            for slot_name, value in subscription.state.items():
+                self.write((client,), messages.encode((messages.UPDATE, address, slot_name, value)))
+        subscription.clients.add(client)
+
+    def unsubscribe(self, client: QLocalSocket, address: str) -> None:
+        subscription = self.subscriptions.get(address)
+        if subscription is None:
+            return
+        subscription.clients.discard(client)
+        if not subscription.clients:
+            del self.subscriptions[address]
+            plugin = data_plugins.plugin_for_address(address, use_broker=False)
+            try:
+                if plugin is not None:
+                    plugin.remove_connection(subscription.channel)
+            except RuntimeError:
+                # The connection was already deleted, the application is shutting down
+                pass
+            subscription.deleteLater()
+
+    def _drop_client(self, client: QLocalSocket) -> None:
+        if self._clients.pop(client, None) is None:
+            return
+        for address in [address for address, sub in self.subscriptions.items() if client in sub.clients]:
+            self.unsubscribe(client, address)
+        client.deleteLater()
+        if not self._clients and self._linger:
+            self._linger_timer.start()
+
+    def write(self, clients, data: bytes) -> None:
+        for client in clients:
+            client.write(data)
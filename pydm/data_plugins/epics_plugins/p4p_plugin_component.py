@@ -1,16 +1,20 @@
+import heapq
+import itertools
 import logging
 import numpy as np
 import collections
 import threading
 import p4p
+import queue
 import re
 import time
+import weakref
 from p4p.client.thread import Context, Disconnected
 from p4p.wrapper import Value
 from p4p.nt import NTURI
 from .pva_codec import decompress
 from pydm.data_plugins import is_read_only
-from pydm.data_plugins.plugin import PyDMPlugin, PyDMConnection
+from pydm.data_plugins.plugin import ControlVariables, PyDMPlugin, PyDMConnection
 from pydm.widgets.channel import PyDMChannel
 from qtpy.QtCore import QObject, Qt
 from typing import Optional
@@ -20,9 +24,179 @@ logger = logging.getLogger(__name__)
 
 # arbitrary default for non-polled RPC
 DEFAULT_RPC_TIMEOUT = 5.0
+# Most RPC requests of polled channels running at the same time
+DEFAULT_RPC_WORKERS = 4
+
+
+class _RPCPoll:
+    """An RPC request polled at a given period, shared by the connections making the same request."""
+
+    def __init__(self, key, request: Value, period: float, timeout: float):
+        self.key = key
+        self.name = key[0]
+        self.request = request
+        # 0 for requests issued only once
+        self.period = period
+        # The timeout makes sure a single call is never slower than the polling-rate
+        self.timeout = timeout
+        self.connections = weakref.WeakSet()
+        self.cancelled = False
+        self.received = False
+        self.result = None
+
+    def poll(self) -> None:
+        result = None
+        try:
+            result = P4PPlugin.context.rpc(name=self.name, value=self.request, timeout=self.timeout)
+        except Exception:
+            # So widget displays name of channel when can't connect to RPC channel
+            pass
+        if self.cancelled:
+            return
+        self.result = result
+        self.received = True
+        for connection in list(self.connections):
+            try:
+                connection.send_rpc_result(result)
+            except RuntimeError:
+                # The connection was deleted
+                self.connections.discard(connection)
+
+
+class RPCPollScheduler:
+    """
+    Issues the RPC requests of the RPC channels of all the connections.
+
+    A single thread keeps the requests ordered by the time they are next due
+    and hands each one to a bounded pool of worker threads when it is.  All
+    of them are daemon threads, so that a pending request never holds up
+    the exit of the application.
+    Polled requests are issued again every ``pydm_pollrate`` seconds of wall
+    time, once the previous one returned, so a slow RPC server never gets
+    more than one request of a channel at a time.  Connections making the
+    same request at the same rate share a single poll, which stops once the
+    last of them is removed.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Most RPC requests running at the same time.
+    """
+
+    _instance = None
+
+    def __init__(self, max_workers: int = DEFAULT_RPC_WORKERS):
+        self._condition = threading.Condition()
+        # Heap of (due time, sequence number, poll)
+        self._queue = []
+        self._sequence = itertools.count()
+        self._polls = {}
+        self._max_workers = max_workers
+        # Due polls waiting for a worker thread, with the time they were due
+        self._due = queue.SimpleQueue()
+        self._thread = None
+
+    @classmethod
+    def instance(cls) -> "RPCPollScheduler":
+        """The scheduler shared by all the connections."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def add(self, connection: "Connection") -> _RPCPoll:
+        """
+        Start issuing the RPC request of a connection, or share the poll of
+        another connection making the same request at the same rate.
+
+        Parameters
+        ----------
+        connection : Connection
+            An RPC connection whose request was created.
+
+        Returns
+        -------
+        _RPCPoll
+            The poll to give back to :meth:`remove`.
+        """
+        period = 0 if connection._rpc_poll_once else connection._rpc_poll_rate
+        key = (
+            connection._rpc_function_name,
+            tuple(sorted(zip(connection._rpc_arg_names, connection._rpc_arg_values))),
+            period,
+        )
+        with self._condition:
+            poll = self._polls.get(key)
+            if poll is None:
+                poll = self._polls[key] = _RPCPoll(key, connection._value_obj, period, connection._rpc_poll_rate)
+                poll.connections.add(connection)
+                self._push(poll, time.monotonic())
+                return poll
+            poll.connections.add(connection)
+        if poll.received:
+            connection.send_rpc_result(poll.result)
+        return poll
+
+    def remove(self, connection: "Connection", poll: _RPCPoll) -> None:
+        """Stop issuing the request of a connection, and the poll with it if no other connection shares it."""
+        with self._condition:
+            poll.connections.discard(connection)
+            if not poll.connections:
+                self._cancel(poll)
+
+    def _cancel(self, poll: _RPCPoll) -> None:
+        poll.cancelled = True
+        if self._polls.get(poll.key) is poll:
+            del self._polls[poll.key]
+        self._condition.notify()
+
+    def _push(self, poll: _RPCPoll, due: float) -> None:
+        heapq.heappush(self._queue, (due, next(self._sequence), poll))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="pydm-p4p-rpc-scheduler", daemon=True)
+            self._thread.start()
+            for i in range(self._max_workers):
+                threading.Thread(target=self._work, name=f"pydm-p4p-rpc-{i}", daemon=True).start()
+        self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._queue and self._queue[0][2].cancelled:
+                    heapq.heappop(self._queue)
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                due = self._queue[0][0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                _, _, poll = heapq.heappop(self._queue)
+            self._due.put((poll, due))
+
+    def _work(self) -> None:
+        while True:
+            self._poll(*self._due.get())
+
+    def _poll(self, poll: _RPCPoll, due: float) -> None:
+        try:
+            poll.poll()
+        except Exception:
+            logger.exception(f"Error while polling RPC {poll.name}")
+        with self._condition:
+            if poll.cancelled:
+                return
+            if poll.period <= 0 or not poll.connections:
+                # A request without pollrate is only issued once
+                self._cancel(poll)
+                return
+            # Keep to the requested rate, without catching up on the polls missed by a slow request
+            self._push(poll, max(due + poll.period, time.monotonic()))
 
 
 class Connection(PyDMConnection):
+    sends_metadata = True
+
     def __init__(
         self, channel: PyDMChannel, address: str, protocol: Optional[str] = None, parent: Optional[QObject] = None
     ):
@@ -42,18 +216,7 @@ class Connection(PyDMConnection):
         super().__init__(channel, address, protocol, parent)
         self._connected = False
         self.nttable_data_location = PyDMPlugin.get_subfield(channel)
-        self._value = None
-        self._severity = None
-        self._precision = None
-        self._enum_strs = None
-        self._units = None
-        self._upper_ctrl_limit = None
-        self._lower_ctrl_limit = None
-        self._upper_alarm_limit = None
-        self._lower_alarm_limit = None
-        self._upper_warning_limit = None
-        self._lower_warning_limit = None
-        self._timestamp = None
+        self.ctrl_vars = ControlVariables()
 
         # RPC = Remote Procedure Call (https://mdavidsaver.github.io/p4p/rpc.html#p4p.rpc.rpcproxy)
         # example address: pva://pv:call:add?lhs=4&rhs=7&pydm_pollrate=10
@@ -63,7 +226,10 @@ class Connection(PyDMConnection):
         self._value_obj = None
         # Poll rate in seconds
         self._rpc_poll_rate = 0  # (in case of above example)
-        self._background_polling_thread = None
+        self._rpc_poll_once = False
+        self._rpc_poll = None
+        self._rpc_result = None
+        self._rpc_received = False
 
         self.monitor = None
         self.is_rpc = self.is_rpc_address(channel.address)
@@ -88,43 +254,15 @@ class Connection(PyDMConnection):
         elif isinstance(value, str):
             self.new_value_signal[str].emit(value)
 
-    def poll_rpc_channel(self) -> None:
-        # Keep executing this function at the polling rate
-
-        # When polling-rate is not specified by user (is 0), just do a single RPC request
-        only_poll_once = False
-        if self._rpc_poll_rate == 0:
-            self._rpc_poll_rate = DEFAULT_RPC_TIMEOUT
-            only_poll_once = True
-
-        while True:
-            start_time = time.process_time()
-
-            result = None
-            try:
-                result = P4PPlugin.context.rpc(
-                    name=self._rpc_function_name, value=self._value_obj, timeout=self._rpc_poll_rate
-                )
-            except Exception:
-                # So widget displays name of channel when can't connect to RPC channel
-                self.connection_state_signal.emit(False)
-
-            if result:
-                self.connection_state_signal.emit(True)
-                self.emit_for_type(result.value)
-            else:
-                self.connection_state_signal.emit(False)
-
-            if only_poll_once:
-                break
-
-            rpc_call_time = time.process_time() - start_time
-            # We want to call "rpc" every self._rpc_poll_rate seconds,
-            # so wait when the call returns faster than the polling-rate.
-            # The timeout arg makes sure a single call is never slower then the polling-rate.
-            poll_rate_and_rpc_call_time_dif = self._rpc_poll_rate - rpc_call_time
-            if poll_rate_and_rpc_call_time_dif > 0:
-                time.sleep(poll_rate_and_rpc_call_time_dif)
+    def send_rpc_result(self, result) -> None:
+        """Emit the result of an RPC request, None if it failed."""
+        self._rpc_result = result
+        self._rpc_received = True
+        if result:
+            self.connection_state_signal.emit(True)
+            self.emit_for_type(result.value)
+        else:
+            self.connection_state_signal.emit(False)
 
     def get_arg_datatype(self, arg_value_string):
         # Try to figure out the datatype of RPC request args
@@ -210,18 +348,7 @@ class Connection(PyDMConnection):
 
     def clear_cache(self) -> None:
         """Clear out all the stored values of this connection."""
-        self._value = None
-        self._severity = None
-        self._precision = None
-        self._enum_strs = None
-        self._units = None
-        self._upper_ctrl_limit = None
-        self._lower_ctrl_limit = None
-        self._upper_alarm_limit = None
-        self._lower_alarm_limit = None
-        self._upper_warning_limit = None
-        self._lower_warning_limit = None
-        self._timestamp = None
+        self.ctrl_vars.clear()
 
     def send_new_value(self, value: Value) -> None:
         """Callback invoked whenever a new value is received by our monitor. Emits signals based on values changed."""
@@ -234,10 +361,11 @@ class Connection(PyDMConnection):
                 self._connected = True
                 self.connection_state_signal.emit(True)
                 # Note that there is no way to get the actual write access value from p4p, so defaulting to True for now
-                self.write_access_signal.emit(True)
+                self.send_metadata({"write_access": True})
 
-            self._value = value
+            self.ctrl_vars.value = value
             has_value_changed_yet = False
+            metadata = {}
             for changed_value in value.changedSet():
                 if changed_value == "value" or changed_value.split(".")[0] == "value":
                     # NTTable has a changedSet item for each column that has changed
@@ -255,7 +383,7 @@ class Connection(PyDMConnection):
                             new_value["labels"] = value.labels
                     elif "NTEnum" in value.getID():
                         new_value = value.value.index
-                        self.enum_strings_signal.emit(tuple(value.value.choices))
+                        self.send_metadata({"enum_strings": tuple(value.value.choices)})
                     else:
                         new_value = value.value
 
@@ -306,51 +434,54 @@ class Connection(PyDMConnection):
                             raise ValueError(f"No matching signal for value: {new_value} with type: {type(new_value)}")
                 # Sometimes unchanged control variables appear to be returned with value changes, so checking against
                 # stored values to avoid sending misleading signals. Will revisit on data plugin changes.
-                elif changed_value == "alarm.severity" and value.alarm.severity != self._severity:
-                    self._severity = value.alarm.severity
-                    self.new_severity_signal.emit(value.alarm.severity)
-                elif changed_value == "display.precision" and value.display.precision != self._precision:
-                    self._precision = value.display.precision
-                    self.prec_signal.emit(value.display.precision)
-                elif changed_value == "display.units" and value.display.units != self._units:
-                    self._units = value.display.units
-                    self.unit_signal.emit(value.display.units)
-                elif changed_value == "control.limitLow" and value.control.limitLow != self._lower_ctrl_limit:
-                    self._lower_ctrl_limit = value.control.limitLow
-                    self.lower_ctrl_limit_signal.emit(value.control.limitLow)
-                elif changed_value == "control.limitHigh" and value.control.limitHigh != self._upper_ctrl_limit:
-                    self._upper_ctrl_limit = value.control.limitHigh
-                    self.upper_ctrl_limit_signal.emit(value.control.limitHigh)
+                elif changed_value == "alarm.severity" and value.alarm.severity != self.ctrl_vars.severity:
+                    self.ctrl_vars.severity = value.alarm.severity
+                    metadata["severity"] = value.alarm.severity
+                elif changed_value == "display.precision" and value.display.precision != self.ctrl_vars.precision:
+                    self.ctrl_vars.precision = value.display.precision
+                    metadata["precision"] = value.display.precision
+                elif changed_value == "display.units" and value.display.units != self.ctrl_vars.units:
+                    self.ctrl_vars.units = value.display.units
+                    metadata["units"] = value.display.units
+                elif changed_value == "control.limitLow" and value.control.limitLow != self.ctrl_vars.lower_ctrl_limit:
+                    self.ctrl_vars.lower_ctrl_limit = value.control.limitLow
+                    metadata["lower_ctrl_limit"] = value.control.limitLow
+                elif (
+                    changed_value == "control.limitHigh" and value.control.limitHigh != self.ctrl_vars.upper_ctrl_limit
+                ):
+                    self.ctrl_vars.upper_ctrl_limit = value.control.limitHigh
+                    metadata["upper_ctrl_limit"] = value.control.limitHigh
                 elif (
                     changed_value == "valueAlarm.highAlarmLimit"
-                    and value.valueAlarm.highAlarmLimit != self._upper_alarm_limit
+                    and value.valueAlarm.highAlarmLimit != self.ctrl_vars.upper_alarm_limit
                 ):
-                    self._upper_alarm_limit = value.valueAlarm.highAlarmLimit
-                    self.upper_alarm_limit_signal.emit(value.valueAlarm.highAlarmLimit)
+                    self.ctrl_vars.upper_alarm_limit = value.valueAlarm.highAlarmLimit
+                    metadata["upper_alarm_limit"] = value.valueAlarm.highAlarmLimit
                 elif (
                     changed_value == "valueAlarm.lowAlarmLimit"
-                    and value.valueAlarm.lowAlarmLimit != self._lower_alarm_limit
+                    and value.valueAlarm.lowAlarmLimit != self.ctrl_vars.lower_alarm_limit
                 ):
-                    self._lower_alarm_limit = value.valueAlarm.lowAlarmLimit
-                    self.lower_alarm_limit_signal.emit(value.valueAlarm.lowAlarmLimit)
+                    self.ctrl_vars.lower_alarm_limit = value.valueAlarm.lowAlarmLimit
+                    metadata["lower_alarm_limit"] = value.valueAlarm.lowAlarmLimit
                 elif (
                     changed_value == "valueAlarm.highWarningLimit"
-                    and value.valueAlarm.highWarningLimit != self._upper_warning_limit
+                    and value.valueAlarm.highWarningLimit != self.ctrl_vars.upper_warning_limit
                 ):
-                    self._upper_warning_limit = value.valueAlarm.highWarningLimit
-                    self.upper_warning_limit_signal.emit(value.valueAlarm.highWarningLimit)
+                    self.ctrl_vars.upper_warning_limit = value.valueAlarm.highWarningLimit
+                    metadata["upper_warning_limit"] = value.valueAlarm.highWarningLimit
                 elif (
                     changed_value == "valueAlarm.lowWarningLimit"
-                    and value.valueAlarm.lowWarningLimit != self._lower_warning_limit
+                    and value.valueAlarm.lowWarningLimit != self.ctrl_vars.lower_warning_limit
                 ):
-                    self._lower_warning_limit = value.valueAlarm.lowWarningLimit
-                    self.lower_warning_limit_signal.emit(value.valueAlarm.lowWarningLimit)
+                    self.ctrl_vars.lower_warning_limit = value.valueAlarm.lowWarningLimit
+                    metadata["lower_warning_limit"] = value.valueAlarm.lowWarningLimit
                 elif (
                     changed_value == "timeStamp.secondsPastEpoch"
-                    and value.timeStamp.secondsPastEpoch != self._timestamp
+                    and value.timeStamp.secondsPastEpoch != self.ctrl_vars.timestamp
                 ):
-                    self._timestamp = value.timeStamp.secondsPastEpoch
-                    self.timestamp_signal.emit(value.timeStamp.secondsPastEpoch)
+                    self.ctrl_vars.timestamp = value.timeStamp.secondsPastEpoch
+                    metadata["timestamp"] = value.timeStamp.secondsPastEpoch
+            self.send_metadata(metadata)
 
     @staticmethod
     def convert_epics_nttable(epics_struct):
@@ -402,7 +533,7 @@ class Connection(PyDMConnection):
         """Write a value to the PV"""
 
         if self.nttable_data_location:
-            nttable = Connection.convert_epics_nttable(self._value)
+            nttable = Connection.convert_epics_nttable(self.ctrl_vars.value)
             nttable = nttable["value"]
             Connection.set_value_by_keys(nttable, self.nttable_data_location, value)
             value = {"value": nttable}
@@ -428,26 +559,30 @@ class Connection(PyDMConnection):
         super().add_listener(channel)
 
         if self.is_rpc:
+            if self._rpc_poll is not None:
+                # The request is already issued, new listeners get its last result
+                if self._rpc_received:
+                    self.send_rpc_result(self._rpc_result)
+                return
             # In case of a RPC, we can just query the channel immediately and emit the value,
-            # and let the pollrate dictate if/when we query and emit again.f
+            # and let the pollrate dictate if/when we query and emit again.
             self._value_obj = self.create_request(self._rpc_function_name, self._rpc_arg_names, self._rpc_arg_values)
             if self._value_obj is None:
                 logger.warning(f"failed to create request object for RPC to {self._rpc_function_name}")
                 return
-
-            # Use daemon threads so they will be stopped when all the non-daemon
-            # threads (in our case just the main thread) are killed, preventing them from running forever.
-            self._background_polling_thread = threading.Thread(target=self.poll_rpc_channel, daemon=True)
-            self._background_polling_thread.start()
-
+            # When polling-rate is not specified by user (is 0), just do a single RPC request
+            if self._rpc_poll_rate == 0:
+                self._rpc_poll_rate = DEFAULT_RPC_TIMEOUT
+                self._rpc_poll_once = True
+            self._rpc_poll = RPCPollScheduler.instance().add(self)
             return
 
         if self.monitor is not None and self._connected:
             # Adding a listener to an already connected PV. Manually send the signals indicating the PV is
             # connected, and what the last known values were.
             self.connection_state_signal.emit(True)
-            self.write_access_signal.emit(True)
-            value_to_send = self._value
+            self.send_metadata({"write_access": True})
+            value_to_send = self.ctrl_vars.value
             self.clear_cache()
             if value_to_send is not None:
                 self.send_new_value(value_to_send)
@@ -463,9 +598,12 @@ class Connection(PyDMConnection):
 
     def close(self):
         """Closes out this connection."""
-        # If RPC, we have no monitor to close
+        # If RPC, we have no monitor to close but its request to stop issuing
         if self.monitor:
             self.monitor.close()
+        if self._rpc_poll is not None:
+            RPCPollScheduler.instance().remove(self, self._rpc_poll)
+            self._rpc_poll = None
         super().close()
 
 
@@ -7,7 +7,7 @@ import epics
 import numpy as np
 from epics.ca import use_initial_context
 from pydm.data_plugins import is_read_only
-from pydm.data_plugins.plugin import PyDMConnection, PyDMPlugin
+from pydm.data_plugins.plugin import ControlVariables, PyDMConnection, PyDMPlugin
 from qtpy.QtCore import Qt, Slot
 from qtpy.QtWidgets import QApplication
 
@@ -52,6 +52,8 @@ float_types = set(
 
 
 class Connection(PyDMConnection):
+    sends_metadata = True
+
     def __init__(self, channel, pv, protocol=None, parent=None):
         super().__init__(channel, pv, protocol, parent)
         self.app = QApplication.instance()
@@ -62,18 +64,7 @@ class Connection(PyDMConnection):
             auto_monitor=epics.dbr.DBE_VALUE | epics.dbr.DBE_ALARM | epics.dbr.DBE_PROPERTY,
             access_callback=self.send_access_state,
         )
-        self._value = None
-        self._severity = None
-        self._precision = None
-        self._enum_strs = None
-        self._unit = None
-        self._upper_ctrl_limit = None
-        self._lower_ctrl_limit = None
-        self._upper_alarm_limit = None
-        self._lower_alarm_limit = None
-        self._upper_warning_limit = None
-        self._lower_warning_limit = None
-        self._timestamp = None
+        self.ctrl_vars = ControlVariables()
 
         PyEPICSPlugin.thread_pool.submit(self.setup_callbacks, channel)
 
@@ -83,24 +74,13 @@ class Connection(PyDMConnection):
         self.add_listener(channel)
 
     def clear_cache(self):
-        self._value = None
-        self._severity = None
-        self._precision = None
-        self._enum_strs = None
-        self._unit = None
-        self._upper_ctrl_limit = None
-        self._lower_ctrl_limit = None
-        self._upper_alarm_limit = None
-        self._lower_alarm_limit = None
-        self._upper_warning_limit = None
-        self._lower_warning_limit = None
-        self._timestamp = None
+        self.ctrl_vars.clear()
 
     def send_new_value(self, value=None, char_value=None, count=None, ftype=None, *args, **kws):
         self.update_ctrl_vars(**kws)
 
-        if value is not None and not np.array_equal(value, self._value):
-            self._value = value
+        if value is not None and not np.array_equal(value, self.ctrl_vars.value):
+            self.ctrl_vars.value = value
             if isinstance(value, np.ndarray):
                 self.new_value_signal[np.ndarray].emit(value)
             else:
@@ -136,53 +116,55 @@ class Connection(PyDMConnection):
         """Callback invoked when there is a change any of these variables. For a full description see:
         https://cars9.uchicago.edu/software/python/pyepics3/pv.html#user-supplied-callback-functions
         """
-        if severity is not None and self._severity != severity:
-            self._severity = severity
-            self.new_severity_signal.emit(int(severity))
-        if precision is not None and self._precision != precision:
-            self._precision = precision
-            self.prec_signal.emit(precision)
-        if enum_strs is not None and self._enum_strs != enum_strs:
-            self._enum_strs = enum_strs
+        metadata = {}
+        if severity is not None and self.ctrl_vars.severity != severity:
+            self.ctrl_vars.severity = severity
+            metadata["severity"] = int(severity)
+        if precision is not None and self.ctrl_vars.precision != precision:
+            self.ctrl_vars.precision = precision
+            metadata["precision"] = precision
+        if enum_strs is not None and self.ctrl_vars.enum_strings != enum_strs:
+            self.ctrl_vars.enum_strings = enum_strs
             try:
                 enum_strs = tuple(b.decode(encoding="ascii") for b in enum_strs)
             except AttributeError:
                 pass
-            self.enum_strings_signal.emit(enum_strs)
-        if units is not None and len(units) > 0 and self._unit != units:
+            metadata["enum_strings"] = enum_strs
+        if units is not None and len(units) > 0 and self.ctrl_vars.units != units:
             if isinstance(units, bytes):
                 units = units.decode()
-            self._unit = units
-            self.unit_signal.emit(units)
-        if upper_ctrl_limit is not None and self._upper_ctrl_limit != upper_ctrl_limit:
-            self._upper_ctrl_limit = upper_ctrl_limit
-            self.upper_ctrl_limit_signal.emit(upper_ctrl_limit)
-        if lower_ctrl_limit is not None and self._lower_ctrl_limit != lower_ctrl_limit:
-            self._lower_ctrl_limit = lower_ctrl_limit
-            self.lower_ctrl_limit_signal.emit(lower_ctrl_limit)
-        if upper_alarm_limit is not None and self._upper_alarm_limit != upper_alarm_limit:
-            self._upper_alarm_limit = upper_alarm_limit
-            self.upper_alarm_limit_signal.emit(upper_alarm_limit)
-        if lower_alarm_limit is not None and self._lower_alarm_limit != lower_alarm_limit:
-            self._lower_alarm_limit = lower_alarm_limit
-            self.lower_alarm_limit_signal.emit(lower_alarm_limit)
-        if upper_warning_limit is not None and self._upper_warning_limit != upper_warning_limit:
-            self._upper_warning_limit = upper_warning_limit
-            self.upper_warning_limit_signal.emit(upper_warning_limit)
-        if lower_warning_limit is not None and self._lower_warning_limit != lower_warning_limit:
-            self._lower_warning_limit = lower_warning_limit
-            self.lower_warning_limit_signal.emit(lower_warning_limit)
-        if timestamp is not None and self._timestamp != timestamp:
-            self._timestamp = timestamp
-            self.timestamp_signal.emit(timestamp)
+            self.ctrl_vars.units = units
+            metadata["units"] = units
+        if upper_ctrl_limit is not None and self.ctrl_vars.upper_ctrl_limit != upper_ctrl_limit:
+            self.ctrl_vars.upper_ctrl_limit = upper_ctrl_limit
+            metadata["upper_ctrl_limit"] = upper_ctrl_limit
+        if lower_ctrl_limit is not None and self.ctrl_vars.lower_ctrl_limit != lower_ctrl_limit:
+            self.ctrl_vars.lower_ctrl_limit = lower_ctrl_limit
+            metadata["lower_ctrl_limit"] = lower_ctrl_limit
+        if upper_alarm_limit is not None and self.ctrl_vars.upper_alarm_limit != upper_alarm_limit:
+            self.ctrl_vars.upper_alarm_limit = upper_alarm_limit
+            metadata["upper_alarm_limit"] = upper_alarm_limit
+        if lower_alarm_limit is not None and self.ctrl_vars.lower_alarm_limit != lower_alarm_limit:
+            self.ctrl_vars.lower_alarm_limit = lower_alarm_limit
+            metadata["lower_alarm_limit"] = lower_alarm_limit
+        if upper_warning_limit is not None and self.ctrl_vars.upper_warning_limit != upper_warning_limit:
+            self.ctrl_vars.upper_warning_limit = upper_warning_limit
+            metadata["upper_warning_limit"] = upper_warning_limit
+        if lower_warning_limit is not None and self.ctrl_vars.lower_warning_limit != lower_warning_limit:
+            self.ctrl_vars.lower_warning_limit = lower_warning_limit
+            metadata["lower_warning_limit"] = lower_warning_limit
+        if timestamp is not None and self.ctrl_vars.timestamp != timestamp:
+            self.ctrl_vars.timestamp = timestamp
+            metadata["timestamp"] = timestamp
+        self.send_metadata(metadata)
 
     def send_access_state(self, read_access, write_access, *args, **kws):
         if is_read_only():
-            self.write_access_signal.emit(False)
+            self.send_metadata({"write_access": False})
             return
 
         if write_access is not None:
-            self.write_access_signal.emit(write_access)
+            self.send_metadata({"write_access": write_access})
 
     def reload_access_state(self):
         read_access = epics.ca.read_access(self.pv.chid)
@@ -0,0 +1,221 @@
+"""
+Discovery manifest of the data plugins, mapping each protocol to the source
+file or entrypoint providing it, so that a plugin only needs to be imported
+once a channel actually uses its protocol.
+"""
+
+import ast
+import atexit
+import json
+import logging
+import os
+from typing import Dict, List, Optional, Tuple
+
+from pydm import config
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FORMAT_VERSION = 1
+
+
+def _module_statements(body):
+    """Statements run when a module is imported, looking into if/try/with blocks."""
+    for node in body:
+        yield node
+        if isinstance(node, (ast.If, ast.With)):
+            yield from _module_statements(node.body)
+            yield from _module_statements(getattr(node, "orelse", []))
+        elif isinstance(node, ast.Try):
+            for block in (node.body, node.orelse, node.finalbody):
+                yield from _module_statements(block)
+            for handler in node.handlers:
+                yield from _module_statements(handler.body)
+
+
+def _protocol_literal(node) -> Optional[str]:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str) and node.value:
+        return node.value
+    return None
+
+
+def scan_plugin_source(source_filename: str) -> List[Tuple[str, str]]:
+    """
+    Find the protocols declared by a data plugin file without importing it.
+
+    Two declarations are recognized: a ``protocol = "..."`` class attribute
+    in a class defined by the module, and a module level
+    ``SomePlugin.protocol = "..."`` assignment.
+
+    Parameters
+    ----------
+    source_filename : str
+        The source code filename.
+
+    Returns
+    -------
+    list of tuple
+        ``(protocol, attribute)`` pairs, ``attribute`` being the module
+        attribute holding the plugin class.  Empty if no protocol could be
+        found, in which case the file needs to be imported to know.
+    """
+    try:
+        with open(source_filename, "rb") as f:
+            tree = ast.parse(f.read(), filename=source_filename)
+    except (OSError, SyntaxError, ValueError) as e:
+        logger.debug("Unable to scan data plugin file %s: %s", source_filename, e)
+        return []
+
+    found = []
+    for node in _module_statements(tree.body):
+        if isinstance(node, ast.ClassDef):
+            for statement in node.body:
+                if (
+                    isinstance(statement, ast.Assign)
+                    and any(isinstance(target, ast.Name) and target.id == "protocol" for target in statement.targets)
+                    and _protocol_literal(statement.value)
+                ):
+                    found.append((_protocol_literal(statement.value), node.name))
+        elif isinstance(node, ast.Assign) and _protocol_literal(node.value):
+            for target in node.targets:
+                if (
+                    isinstance(target, ast.Attribute)
+                    and target.attr == "protocol"
+                    and isinstance(target.value, ast.Name)
+                ):
+                    found.append((_protocol_literal(node.value), target.value.id))
+    return found
+
+
+def entrypoint_key(entry) -> str:
+    """Identifier of an entrypoint, changing with the version of the distribution providing it."""
+    distro = getattr(entry, "distro", None)
+    version = "{}-{}".format(distro.name, distro.version) if distro is not None else ""
+    return "{}={}:{}@{}".format(entry.name, entry.module_name, entry.object_name, version)
+
+
+class PluginManifest:
+    """
+    The protocols provided by data plugin files and entrypoints.
+
+    The protocols of a file are found with :func:`scan_plugin_source` and
+    kept along with the modification time of the file, so that they are only
+    looked up again once the file changes.  The protocol of an entrypoint can
+    only be found by loading it, so it is recorded the first time it is
+    loaded along with the version of the distribution that provides it.
+
+    Parameters
+    ----------
+    files : dict, optional
+        Previously stored file entries, see :meth:`to_dict`.
+    entrypoints : dict, optional
+        Previously stored protocols, keyed by :func:`entrypoint_key`.
+    """
+
+    def __init__(self, files: Optional[Dict] = None, entrypoints: Optional[Dict[str, str]] = None):
+        # Keyed on filename, values are [mtime, [[protocol, attribute], ...]]
+        self._files = dict(files or {})
+        self._entrypoints = dict(entrypoints or {})
+        self.dirty = False
+
+    def protocols(self, source_filename: str) -> List[Tuple[str, str]]:
+        """
+        The ``(protocol, attribute)`` pairs declared by a plugin file.
+
+        Parameters
+        ----------
+        source_filename : str
+            The source code filename.
+
+        Returns
+        -------
+        list of tuple
+        """
+        try:
+            mtime = os.stat(source_filename).st_mtime
+        except OSError:
+            return []
+        entry = self._files.get(source_filename)
+        if entry is None or entry[0] != mtime:
+            entry = [mtime, [list(pair) for pair in scan_plugin_source(source_filename)]]
+            self._files[source_filename] = entry
+            self.dirty = True
+        return [tuple(pair) for pair in entry[1]]
+
+    def entrypoint_protocol(self, entry) -> Optional[str]:
+        """The protocol of an entrypoint, if it was recorded before."""
+        return self._entrypoints.get(entrypoint_key(entry))
+
+    def set_entrypoint_protocol(self, entry, protocol: str) -> None:
+        """Record the protocol of the plugin class loaded from an entrypoint."""
+        key = entrypoint_key(entry)
+        if self._entrypoints.get(key) != protocol:
+            self._entrypoints[key] = protocol
+            self.dirty = True
+
+    def to_dict(self) -> Dict:
+        """The contents of the manifest in a JSON serializable form."""
+        return {"version": MANIFEST_FORMAT_VERSION, "files": self._files, "entrypoints": self._entrypoints}
+
+
+_manifest = None
+
+
+def get_manifest() -> PluginManifest:
+    """
+    Return the data plugin manifest of this process.
+
+    When the ``PYDM_DATA_PLUGINS_MANIFEST`` environment variable points to a
+    file, the manifest is loaded from it on first use and saved back to it
+    when the process exits if anything changed.
+
+    Returns
+    -------
+    PluginManifest
+    """
+    global _manifest
+    if _manifest is not None:
+        return _manifest
+    _manifest = PluginManifest()
+    if not config.DATA_PLUGINS_MANIFEST:
+        return _manifest
+    atexit.register(save, config.DATA_PLUGINS_MANIFEST)
+    try:
+        with open(config.DATA_PLUGINS_MANIFEST) as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return _manifest
+    except (OSError, ValueError) as e:
+        logger.warning("Unable to read data plugin manifest %s: %s", config.DATA_PLUGINS_MANIFEST, e)
+        return _manifest
+    if data.get("version") == MANIFEST_FORMAT_VERSION:
+        _manifest = PluginManifest(data.get("files"), data.get("entrypoints"))
+    return _manifest
+
+
+def clear() -> None:
+    """Forget the manifest of this process."""
+    global _manifest
+    _manifest = None
+
+
+def save(path: str) -> None:
+    """
+    Store the manifest of this process in ``path`` if it changed since it
+    was loaded.
+
+    Parameters
+    ----------
+    path : str
+        The file to write.
+    """
+    if _manifest is None or not _manifest.dirty:
+        return
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(_manifest.to_dict(), f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Unable to save data plugin manifest %s: %s", path, e)
+        return
+    _manifest.dirty = False
@@ -1,5 +1,7 @@
 import functools
 import numpy as np
+import sys
+import time
 import weakref
 import threading
 import warnings
@@ -9,12 +11,200 @@ from urllib.parse import ParseResult
 
 from pydm.utilities.remove_protocol import parsed_address
 from pydm.widgets import PyDMChannel
+from pydm.widgets.channel import METADATA_SLOTS
 from qtpy.compat import isalive
 from qtpy.QtCore import Signal, QObject, Qt
 from qtpy.QtWidgets import QApplication
 from pydm import config
 
 
+# Value types of the overloads of PyDMConnection.new_value_signal
+_VALUE_TYPES = (int, float, str, bool, object)
+
+# Signals of PyDMConnection, other than new_value_signal, and the PyDMChannel slot listening to each
+_LISTENER_SLOTS = (
+    ("connection_state_signal", "connection_slot"),
+    ("new_severity_signal", "severity_slot"),
+    ("write_access_signal", "write_access_slot"),
+    ("enum_strings_signal", "enum_strings_slot"),
+    ("unit_signal", "unit_slot"),
+    ("upper_ctrl_limit_signal", "upper_ctrl_limit_slot"),
+    ("lower_ctrl_limit_signal", "lower_ctrl_limit_slot"),
+    ("upper_alarm_limit_signal", "upper_alarm_limit_slot"),
+    ("lower_alarm_limit_signal", "lower_alarm_limit_slot"),
+    ("upper_warning_limit_signal", "upper_warning_limit_slot"),
+    ("lower_warning_limit_signal", "lower_warning_limit_slot"),
+    ("prec_signal", "prec_slot"),
+    ("timestamp_signal", "timestamp_slot"),
+)
+
+# Signal emitted for each key of the metadata passed to PyDMConnection.send_metadata
+METADATA_SIGNALS = {
+    "severity": "new_severity_signal",
+    "write_access": "write_access_signal",
+    "enum_strings": "enum_strings_signal",
+    "units": "unit_signal",
+    "precision": "prec_signal",
+    "upper_ctrl_limit": "upper_ctrl_limit_signal",
+    "lower_ctrl_limit": "lower_ctrl_limit_signal",
+    "upper_alarm_limit": "upper_alarm_limit_signal",
+    "lower_alarm_limit": "lower_alarm_limit_signal",
+    "upper_warning_limit": "upper_warning_limit_signal",
+    "lower_warning_limit": "lower_warning_limit_signal",
+    "timestamp": "timestamp_signal",
+}
+
+# Channel slots served by metadata_signal for listeners receiving coalesced metadata
+_METADATA_SLOTS = frozenset(METADATA_SLOTS.values())
+
+
+class ControlVariables:
+    """
+    Last known value and control variables of a connection, which data
+    plugins keep to only report the ones that changed.  The attribute names
+    match the keys of :data:`METADATA_SIGNALS`.
+    """
+
+    __slots__ = ("value",) + tuple(METADATA_SIGNALS)
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget every value, so that the next ones are all reported."""
+        for name in self.__slots__:
+            setattr(self, name, None)
+
+
+class _ValueSlotProbe(QObject):
+    """Never emitted, only used to find which value types a slot accepts."""
+
+    value = Signal((float,), (int,), (str,), (bool,), (object,))
+
+
+_value_slot_probe = None
+_value_slot_types = weakref.WeakKeyDictionary()
+
+
+def _accepted_value_types(slot: Callable) -> tuple:
+    """
+    The types of the new_value_signal overloads that Qt would connect to
+    ``slot``, cached on the underlying function for bound methods.
+    """
+    global _value_slot_probe
+    func = getattr(slot, "__func__", slot)
+    try:
+        return _value_slot_types[func]
+    except (KeyError, TypeError):
+        pass
+    if _value_slot_probe is None:
+        _value_slot_probe = _ValueSlotProbe()
+    accepted = []
+    for signal_type in _VALUE_TYPES:
+        signal = _value_slot_probe.value[signal_type]
+        try:
+            signal.connect(slot)
+        except TypeError:
+            continue
+        signal.disconnect(slot)
+        accepted.append(signal_type)
+    accepted = tuple(accepted)
+    try:
+        _value_slot_types[func] = accepted
+    except TypeError:
+        pass
+    return accepted
+
+
+def _slot_owner(slot: Callable) -> Optional[QObject]:
+    """The QObject a slot is a method of, looking through functools.partial."""
+    owner = getattr(slot, "__self__", None)
+    if owner is None and isinstance(slot, functools.partial):
+        owner = getattr(slot.func, "__self__", None)
+    return owner if isinstance(owner, QObject) else None
+
+
+class _ListenerTable(QObject):
+    """
+    Slots of the listeners of a single connection signal, called one after
+    the other from a single queued connection to that signal.
+
+    Qt drops the connections of a receiver when it is deleted; in the same
+    spirit, slots of QObjects that have been deleted without removing their
+    listener are dropped instead of being called.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Keyed on id(channel), values are (slot, owner QObject or None)
+        self.slots = {}
+        self._snapshot = None
+        self._generation = 0
+
+    def add(self, key: int, slot: Callable) -> None:
+        self.slots[key] = (slot, _slot_owner(slot))
+        self._snapshot = None
+        self._generation += 1
+
+    def remove(self, key: int) -> None:
+        if self.slots.pop(key, None) is not None:
+            self._snapshot = None
+            self._generation += 1
+
+    def dispatch(self, *args) -> None:
+        if self._snapshot is None:
+            self._snapshot = tuple(self.slots.items())
+        generation = self._generation
+        for key, entry in self._snapshot:
+            # Skip listeners removed by one of the slots called before them
+            if generation != self._generation and self.slots.get(key) is not entry:
+                continue
+            slot, owner = entry
+            if owner is not None and not isalive(owner):
+                self.remove(key)
+                continue
+            try:
+                slot(*args)
+            except Exception:
+                # Keep delivering to the other listeners, as separate Qt connections would
+                sys.excepthook(*sys.exc_info())
+
+
+class ConnectionStatistics:
+    """
+    Runtime statistics of a connection, only allocated once they are
+    enabled, see :meth:`PyDMConnection.enable_statistics`.
+    """
+
+    __slots__ = (
+        "updates_received",
+        "updates_emitted",
+        "bytes_received",
+        "last_latency",
+        "max_burst",
+        "burst_start",
+        "burst_count",
+    )
+
+    def __init__(self):
+        self.updates_received = 0
+        self.updates_emitted = 0
+        self.bytes_received = 0
+        self.last_latency = None
+        self.max_burst = 0
+        self.burst_start = 0.0
+        self.burst_count = 0
+
+
+def _statistic(name: str, default):
+    """Read-only attribute of a connection for one of its statistics."""
+
+    def read(self):
+        return default if self._stats is None else getattr(self._stats, name)
+
+    return property(read, doc="See :meth:`PyDMConnection.enable_statistics`.")
+
+
 class PyDMConnection(QObject):
     new_value_signal = Signal((float,), (int,), (str,), (bool,), (object,))
     connection_state_signal = Signal(bool)
@@ -30,6 +220,34 @@ class PyDMConnection(QObject):
     upper_warning_limit_signal = Signal((float,), (int,))
     lower_warning_limit_signal = Signal((float,), (int,))
     timestamp_signal = Signal(float)
+    metadata_signal = Signal(dict)
+
+    # Whether the connection class reports its control variables through
+    # send_metadata, which is needed to coalesce them into metadata_signal
+    sends_metadata = False
+
+    # Whether new connections of classes sending metadata deliver it with a single
+    # metadata_signal to the listeners which have a metadata slot
+    coalesce_metadata = config.COALESCED_METADATA
+
+    # Whether new connections collect runtime statistics, see enable_statistics
+    collect_statistics = config.CONNECTION_STATISTICS
+
+    # Whether new connections deliver each update to their listeners through a
+    # single queued connection per signal instead of one per listener
+    fan_out_dispatch = config.FAN_OUT_DISPATCH
+
+    # Statistics are off by default and listener tables only used with fan-out
+    # dispatch, so neither is allocated until needed: connections are many.
+    _stats = None
+    # Keyed on signal name, or on the value type for new_value_signal
+    _listener_tables = None
+
+    updates_received = _statistic("updates_received", 0)
+    updates_emitted = _statistic("updates_emitted", 0)
+    bytes_received = _statistic("bytes_received", 0)
+    last_latency = _statistic("last_latency", None)
+    max_burst = _statistic("max_burst", 0)
 
     def __init__(self, channel, address, protocol=None, parent=None):
         super().__init__(parent)
@@ -38,10 +256,108 @@ class PyDMConnection(QObject):
         self.connected = False
         self.value = None
         self.listener_count = 0
+        self.value_listener_count = 0
         self.app = QApplication.instance()
+        self.fan_out = PyDMConnection.fan_out_dispatch
+        self.coalesced_metadata = self.sends_metadata and PyDMConnection.coalesce_metadata
+        if PyDMConnection.collect_statistics:
+            self.enable_statistics()
+
+    def enable_statistics(self) -> None:
+        """
+        Start counting the value updates going through this connection.
+
+        Once enabled, the connection keeps track of:
+
+        * ``updates_received``: value updates received from the data source.
+        * ``updates_emitted``: value updates delivered to listeners, i.e. each
+          received update multiplied by the number of value listeners.
+        * ``bytes_received``: approximate size of the received values.
+        * ``last_latency``: seconds between the timestamp of the last update
+          and the moment it was received, if the data source provides one.
+        * ``max_burst``: largest number of updates received within a second.
+        """
+        if self._stats is not None:
+            return
+        self._stats = ConnectionStatistics()
+        for signal_type in (int, float, str, bool, object):
+            self.new_value_signal[signal_type].connect(self._count_value_update, Qt.DirectConnection)
+        self.timestamp_signal.connect(self._count_timestamp, Qt.DirectConnection)
+
+    @property
+    def statistics_enabled(self) -> bool:
+        """Whether the connection collects runtime statistics."""
+        return self._stats is not None
+
+    def statistics(self) -> dict:
+        """
+        Snapshot of the runtime statistics of this connection.
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            "listeners": self.listener_count,
+            "updates_received": self.updates_received,
+            "updates_emitted": self.updates_emitted,
+            "bytes_received": self.bytes_received,
+            "last_latency": self.last_latency,
+            "max_burst": self.max_burst,
+        }
+
+    def _count_value_update(self, value) -> None:
+        stats = self._stats
+        stats.updates_received += 1
+        stats.updates_emitted += self.value_listener_count
+        nbytes = getattr(value, "nbytes", None)
+        if nbytes is None:
+            nbytes = len(value) if isinstance(value, (str, bytes)) else 8
+        stats.bytes_received += nbytes
+        now = time.monotonic()
+        if now - stats.burst_start >= 1.0:
+            stats.burst_start = now
+            stats.burst_count = 0
+        stats.burst_count += 1
+        if stats.burst_count > stats.max_burst:
+            stats.max_burst = stats.burst_count
+
+    def _count_timestamp(self, timestamp) -> None:
+        self._stats.last_latency = time.time() - timestamp
+
+    def send_metadata(self, metadata: dict) -> None:
+        """
+        Report changes of the control variables of the channel.
+
+        Each entry is emitted with its own signal, e.g. ``units`` with
+        :attr:`unit_signal`, and when metadata is coalesced the whole
+        dictionary is also emitted once with :attr:`metadata_signal`, for
+        the listeners which apply every change in a single call.
+
+        Parameters
+        ----------
+        metadata : dict
+            The changed control variables, keyed on the names of
+            :data:`METADATA_SIGNALS`, in the order they should be applied.
+        """
+        if not metadata:
+            return
+        if self.coalesced_metadata:
+            self.metadata_signal.emit(metadata)
+        for key, value in metadata.items():
+            getattr(self, METADATA_SIGNALS[key]).emit(value)
+
+    def _receives_coalesced_metadata(self, channel) -> bool:
+        return self.coalesced_metadata and channel.metadata_slot is not None
 
     def add_listener(self, channel):
         self.listener_count = self.listener_count + 1
+        if channel.value_slot is not None:
+            self.value_listener_count += 1
+        if self.fan_out:
+            self._add_fan_out_listener(channel)
+            return
+
         if channel.connection_slot is not None:
             self.connection_state_signal.connect(channel.connection_slot, Qt.QueuedConnection)
 
@@ -55,6 +371,11 @@ class PyDMConnection(QObject):
                 except TypeError:
                     pass
 
+        if self._receives_coalesced_metadata(channel):
+            # A single connection replaces the ones of every control variable below
+            self.metadata_signal.connect(channel.metadata_slot, Qt.QueuedConnection)
+            return
+
         if channel.severity_slot is not None:
             self.new_severity_signal.connect(channel.severity_slot, Qt.QueuedConnection)
 
@@ -109,93 +430,10 @@ class PyDMConnection(QObject):
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=RuntimeWarning)
 
-            if self._should_disconnect(channel.connection_slot, destroying):
-                try:
-                    self.connection_state_signal.disconnect(channel.connection_slot)
-                except TypeError:
-                    pass
-
-            if self._should_disconnect(channel.value_slot, destroying):
-                for signal_type in (int, float, str, bool, object):
-                    try:
-                        self.new_value_signal[signal_type].disconnect(channel.value_slot)
-                    # If the signal exists (always does in this case since we define it for all 'signal_type' earlier)
-                    # but doesn't match slot, TypeError is thrown. We also don't need to catch KeyError/IndexError here,
-                    # since those are only thrown when signal type doesn't exist.
-                    except TypeError:
-                        pass
-
-            if self._should_disconnect(channel.severity_slot, destroying):
-                try:
-                    self.new_severity_signal.disconnect(channel.severity_slot)
-                except (KeyError, TypeError):
-                    pass
-
-            if self._should_disconnect(channel.write_access_slot, destroying):
-                try:
-                    self.write_access_signal.disconnect(channel.write_access_slot)
-                except (KeyError, TypeError):
-                    pass
-
-            if self._should_disconnect(channel.enum_strings_slot, destroying):
-                try:
-                    self.enum_strings_signal.disconnect(channel.enum_strings_slot)
-                except (KeyError, TypeError):
-                    pass
-
-            if self._should_disconnect(channel.unit_slot, destroying):
-                try:
-                    self.unit_signal.disconnect(channel.unit_slot)
-                except (KeyError, TypeError):
-                    pass
-
-            if self._should_disconnect(channel.upper_ctrl_limit_slot, destroying):
-                try:
-                    self.upper_ctrl_limit_signal.disconnect(channel.upper_ctrl_limit_slot)
-                except (KeyError, TypeError):
-                    pass
-
-            if self._should_disconnect(channel.lower_ctrl_limit_slot, destroying):
-                try:
-                    self.lower_ctrl_limit_signal.disconnect(channel.lower_ctrl_limit_slot)
-                except (KeyError, TypeError):
-                    pass
-
-            if self._should_disconnect(channel.upper_alarm_limit_slot, destroying):
-                try:
-                    self.upper_alarm_limit_signal.disconnect(channel.upper_alarm_limit_slot)
-                except (KeyError, TypeError):
-                    pass
-
-            if self._should_disconnect(channel.lower_alarm_limit_slot, destroying):
-                try:
-                    self.lower_alarm_limit_signal.disconnect(channel.lower_alarm_limit_slot)
-                except (KeyError, TypeError):
-                    pass
-
-            if self._should_disconnect(channel.upper_warning_limit_slot, destroying):
-                try:
-                    self.upper_warning_limit_signal.disconnect(channel.upper_warning_limit_slot)
-                except (KeyError, TypeError):
-                    pass
-
-            if self._should_disconnect(channel.lower_warning_limit_slot, destroying):
-                try:
-                    self.lower_warning_limit_signal.disconnect(channel.lower_warning_limit_slot)
-                except (KeyError, TypeError):
-                    pass
-
-            if self._should_disconnect(channel.prec_slot, destroying):
-                try:
-                    self.prec_signal.disconnect(channel.prec_slot)
-                except (KeyError, TypeError):
-                    pass
-
-            if self._should_disconnect(channel.timestamp_slot, destroying):
-                try:
-                    self.timestamp_signal.disconnect(channel.timestamp_slot)
-                except (KeyError, TypeError):
-                    pass
+            if self.fan_out:
+                self._remove_fan_out_listener(channel)
+            else:
+                self._disconnect_listener_slots(channel, destroying)
 
             if not destroying and channel.value_signal is not None and hasattr(self, "put_value"):
                 for signal_type in (str, int, float, np.ndarray, dict):
@@ -206,10 +444,148 @@ class PyDMConnection(QObject):
                     except (KeyError, IndexError, TypeError):
                         pass
 
+        if channel.value_slot is not None and self.value_listener_count > 0:
+            self.value_listener_count -= 1
         self.listener_count = self.listener_count - 1
         if self.listener_count < 1:
             self.close()
 
+    def _add_fan_out_listener(self, channel) -> None:
+        key = id(channel)
+        if channel.value_slot is not None:
+            for signal_type in _accepted_value_types(channel.value_slot):
+                self._listener_table(signal_type).add(key, channel.value_slot)
+        coalesced = self._receives_coalesced_metadata(channel)
+        if coalesced:
+            self._listener_table("metadata_signal").add(key, channel.metadata_slot)
+        for signal_name, slot_name in _LISTENER_SLOTS:
+            slot = getattr(channel, slot_name)
+            if slot is not None and not (coalesced and slot_name in _METADATA_SLOTS):
+                self._listener_table(signal_name).add(key, slot)
+
+    def _remove_fan_out_listener(self, channel) -> None:
+        if self._listener_tables is None:
+            return
+        key = id(channel)
+        for table in self._listener_tables.values():
+            table.remove(key)
+
+    def _listener_table(self, signal_key) -> _ListenerTable:
+        """
+        The listener table of a signal, connected to it on first use.  Value
+        tables are keyed on the type of their new_value_signal overload,
+        other tables on the signal name.
+        """
+        if self._listener_tables is None:
+            self._listener_tables = {}
+        table = self._listener_tables.get(signal_key)
+        if table is None:
+            # Listeners may be added from a plugin thread, so create the table
+            # there and hand it over to the thread the connection lives in.
+            table = self._listener_tables[signal_key] = _ListenerTable()
+            table.moveToThread(self.thread())
+            if isinstance(signal_key, str):
+                signal = getattr(self, signal_key)
+            else:
+                signal = self.new_value_signal[signal_key]
+            signal.connect(table.dispatch, Qt.QueuedConnection)
+        return table
+
+    def _disconnect_listener_slots(self, channel, destroying: bool) -> None:
+        if self._should_disconnect(channel.metadata_slot, destroying):
+            try:
+                self.metadata_signal.disconnect(channel.metadata_slot)
+            except (KeyError, TypeError):
+                pass
+
+        if self._should_disconnect(channel.connection_slot, destroying):
+            try:
+                self.connection_state_signal.disconnect(channel.connection_slot)
+            except TypeError:
+                pass
+
+        if self._should_disconnect(channel.value_slot, destroying):
+            for signal_type in (int, float, str, bool, object):
+                try:
+                    self.new_value_signal[signal_type].disconnect(channel.value_slot)
+                # If the signal exists (always does in this case since we define it for all 'signal_type' earlier)
+                # but doesn't match slot, TypeError is thrown. We also don't need to catch KeyError/IndexError here,
+                # since those are only thrown when signal type doesn't exist.
+                except TypeError:
+                    pass
+
+        if self._should_disconnect(channel.severity_slot, destroying):
+            try:
+                self.new_severity_signal.disconnect(channel.severity_slot)
+            except (KeyError, TypeError):
+                pass
+
+        if self._should_disconnect(channel.write_access_slot, destroying):
+            try:
+                self.write_access_signal.disconnect(channel.write_access_slot)
+            except (KeyError, TypeError):
+                pass
+
+        if self._should_disconnect(channel.enum_strings_slot, destroying):
+            try:
+                self.enum_strings_signal.disconnect(channel.enum_strings_slot)
+            except (KeyError, TypeError):
+                pass
+
+        if self._should_disconnect(channel.unit_slot, destroying):
+            try:
+                self.unit_signal.disconnect(channel.unit_slot)
+            except (KeyError, TypeError):
+                pass
+
+        if self._should_disconnect(channel.upper_ctrl_limit_slot, destroying):
+            try:
+                self.upper_ctrl_limit_signal.disconnect(channel.upper_ctrl_limit_slot)
+            except (KeyError, TypeError):
+                pass
+
+        if self._should_disconnect(channel.lower_ctrl_limit_slot, destroying):
+            try:
+                self.lower_ctrl_limit_signal.disconnect(channel.lower_ctrl_limit_slot)
+            except (KeyError, TypeError):
+                pass
+
+        if self._should_disconnect(channel.upper_alarm_limit_slot, destroying):
+            try:
+                self.upper_alarm_limit_signal.disconnect(channel.upper_alarm_limit_slot)
+            except (KeyError, TypeError):
+                pass
+
+        if self._should_disconnect(channel.lower_alarm_limit_slot, destroying):
+            try:
+                self.lower_alarm_limit_signal.disconnect(channel.lower_alarm_limit_slot)
+            except (KeyError, TypeError):
+                pass
+
+        if self._should_disconnect(channel.upper_warning_limit_slot, destroying):
+            try:
+                self.upper_warning_limit_signal.disconnect(channel.upper_warning_limit_slot)
+            except (KeyError, TypeError):
+                pass
+
+        if self._should_disconnect(channel.lower_warning_limit_slot, destroying):
+            try:
+                self.lower_warning_limit_signal.disconnect(channel.lower_warning_limit_slot)
+            except (KeyError, TypeError):
+                pass
+
+        if self._should_disconnect(channel.prec_slot, destroying):
+            try:
+                self.prec_signal.disconnect(channel.prec_slot)
+            except (KeyError, TypeError):
+                pass
+
+        if self._should_disconnect(channel.timestamp_slot, destroying):
+            try:
+                self.timestamp_signal.disconnect(channel.timestamp_slot)
+            except (KeyError, TypeError):
+                pass
+
     @staticmethod
     def _should_disconnect(slot: Callable, destroying: bool):
         """Return True if the signal/slot should be disconnected, False otherwise"""
@@ -4,20 +4,31 @@ import inspect
 import logging
 import os
 import sys
+import threading
 import warnings
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache
 from io import StringIO
 from os import path
-from string import Template
-from typing import Dict, Optional, Tuple
+from types import CodeType
+from typing import Dict, Optional, Set, Tuple
 
 import re
 import six
 from qtpy.QtWidgets import QApplication, QWidget
 
+from . import config
 from .help_files import HelpWindow
-from .utilities import import_module_by_filename, is_pydm_app, macro, ACTIVE_QT_WRAPPER, QtWrapperTypes
+from .utilities import (
+    find_file,
+    import_module_by_filename,
+    is_pydm_app,
+    load_profiler,
+    macro,
+    ACTIVE_QT_WRAPPER,
+    QtWrapperTypes,
+)
 
 
 if ACTIVE_QT_WRAPPER in (QtWrapperTypes.PYQT5, QtWrapperTypes.PYQT6):
@@ -32,6 +43,18 @@ class ScreenTarget:
 
 logger = logging.getLogger(__file__)
 
+# uic keeps the state of the file being compiled in module globals, so files
+# prefetched on worker threads must not be compiled at the same time
+_uic_lock = threading.Lock()
+
+_prefetch_executor: Optional[ThreadPoolExecutor] = None
+_prefetch_lock = threading.Lock()
+# Prefetch requests being prepared, and those already prepared
+_prefetch_pending: Dict[Tuple, Future] = {}
+_prefetch_done: Set[Tuple] = set()
+# Most prepared requests remembered, the compiled files themselves being bounded by their caches
+_PREFETCH_DONE_LIMIT = 1024
+
 
 def load_file(file, macros=None, args=None, target=ScreenTarget.NEW_PROCESS):
     """
@@ -70,7 +93,9 @@ def load_file(file, macros=None, args=None, target=ScreenTarget.NEW_PROCESS):
     base, extension = os.path.splitext(file)
     loader = _extension_to_loader.get(extension, load_py_file)
     logger.debug("Loading %s file by way of %s...", file, loader.__name__)
-    loaded_display = loader(file, args=args, macros=macros)
+    with load_profiler.display(file) as record:
+        loaded_display = loader(file, args=args, macros=macros)
+    load_profiler.profiler.bind(loaded_display, record)
 
     if os.path.exists(base + ".txt"):
         loaded_display.load_help_file(base + ".txt")
@@ -100,7 +125,8 @@ def _compile_ui_file(uifile: str) -> Tuple[str, str]:
     """
     if ACTIVE_QT_WRAPPER in (QtWrapperTypes.PYQT5, QtWrapperTypes.PYQT6):
         code_string = StringIO()
-        uic.compileUi(uifile, code_string)
+        with _uic_lock:
+            uic.compileUi(uifile, code_string)
         code_string = code_string.getvalue()
     elif ACTIVE_QT_WRAPPER == QtWrapperTypes.PYSIDE6:
         # seems like pyside6 only offers .ui compilation with pyside6-uic cmdline tool
@@ -125,9 +151,31 @@ def _compile_ui_file(uifile: str) -> Tuple[str, str]:
     return code_string, class_name
 
 
+@lru_cache()
+def _compile_expanded_ui(code_string: str, macro_items: Tuple) -> CodeType:
+    """
+    Substitute the macros in a compiled ui file and compile the result to bytecode.
+    Caches the result so that displays opened again with the same macros skip both steps.
+    """
+    if macro_items:
+        code_string = macro.replace_macros_in_template(code_string, dict(macro_items)).getvalue()
+    return compile(code_string, "<string>", "exec")
+
+
+def _expand_compiled_ui(code_string: str, macros: Optional[Dict[str, str]]) -> CodeType:
+    macro_items = tuple(sorted(macros.items())) if macros else ()
+    try:
+        hash(macro_items)
+    except TypeError:
+        # Macros whose values can't be hashed can't be cached either
+        return _compile_expanded_ui.__wrapped__(code_string, macro_items)
+    return _compile_expanded_ui(code_string, macro_items)
+
+
 def _load_ui_into_display(uifile, display):
     if ACTIVE_QT_WRAPPER in (QtWrapperTypes.PYQT5, QtWrapperTypes.PYQT6):
-        klass, _ = uic.loadUiType(uifile)
+        with _uic_lock:
+            klass, _ = uic.loadUiType(uifile)
     else:  # pyside6
         from PySide6.QtUiTools import loadUiType
 
@@ -140,7 +188,8 @@ def _load_ui_into_display(uifile, display):
     setupUi = six.get_unbound_function(klass.setupUi)
     # Add retranslateUi to Display class
     display.retranslateUi = functools.partial(retranslateUi, display)
-    setupUi(display, display)
+    with load_profiler.section("setupUi"):
+        setupUi(display, display)
 
     display.ui = display
 
@@ -151,6 +200,86 @@ def clear_compiled_ui_file_cache() -> None:
     need to be picked up, such as the user choosing to reload the display.
     """
     _compile_ui_file.cache_clear()
+    _compile_expanded_ui.cache_clear()
+    with _prefetch_lock:
+        _prefetch_done.clear()
+
+
+def prefetch_ui_file(
+    filename: str,
+    base_path: str = "",
+    macros: Optional[Dict[str, str]] = None,
+    subdir_scan_enabled: bool = False,
+) -> Optional[Future]:
+    """
+    Prepare a .ui file in the background, so that loading it later with the
+    same macros only has to build its widgets.
+
+    The file is looked up with `find_file` on the calling thread, as the
+    lookup caches are not shared with other threads, then compiled by uic
+    and its macros substituted on a worker thread, filling the caches used
+    by `load_file`.  At most ``PYDM_PREFETCH_WORKERS`` files are prepared at
+    the same time, and nothing is done if prefetching is disabled or if the
+    same request was already made.  Other kinds of files are only looked up.
+
+    Parameters
+    ----------
+    filename : str
+        The file to prepare, as given to `find_file`.
+    base_path : str, optional
+        The directory of the display the file will be opened from.
+    macros : dict, optional
+        The macros the file will be loaded with.
+    subdir_scan_enabled : bool, optional
+        Whether to look for the file in subdirectories too.
+
+    Returns
+    -------
+    Future, optional
+        The preparation of the file, resulting in its path.  None if nothing
+        was started.
+    """
+    global _prefetch_executor
+    if config.PREFETCH_WORKERS <= 0 or not filename:
+        return None
+    key = (filename, base_path, subdir_scan_enabled, tuple(sorted(macros.items())) if macros else ())
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    with _prefetch_lock:
+        if key in _prefetch_done or key in _prefetch_pending:
+            return None
+    fname = find_file(filename, base_path=base_path, subdir_scan_enabled=subdir_scan_enabled)
+    if fname is None or os.path.splitext(fname)[1] != ".ui":
+        # A missing file is reported when it is actually opened
+        _prefetched(key)
+        return None
+    with _prefetch_lock:
+        if _prefetch_executor is None:
+            _prefetch_executor = ThreadPoolExecutor(config.PREFETCH_WORKERS, thread_name_prefix="pydm-prefetch")
+        future = _prefetch_pending[key] = _prefetch_executor.submit(_prefetch, key, fname)
+    return future
+
+
+def _prefetch(key: Tuple, fname: str) -> str:
+    try:
+        code_string, _ = _compile_ui_file(fname)
+        _expand_compiled_ui(code_string, dict(key[3]))
+    except Exception:
+        # The error is reported when the file is actually opened
+        logger.debug("Unable to prefetch %s", fname, exc_info=True)
+    finally:
+        _prefetched(key)
+    return fname
+
+
+def _prefetched(key: Tuple) -> None:
+    with _prefetch_lock:
+        _prefetch_pending.pop(key, None)
+        if len(_prefetch_done) >= _PREFETCH_DONE_LIMIT:
+            _prefetch_done.clear()
+        _prefetch_done.add(key)
 
 
 def _load_compiled_ui_into_display(
@@ -173,15 +302,21 @@ def _load_compiled_ui_into_display(
         Macros to be substituted
     """
     if macros:
-        code_string = macro.replace_macros_in_template(Template(code_string), macros).getvalue()
+        with load_profiler.section("macro expansion"):
+            code = _expand_compiled_ui(code_string, macros)
+    else:
+        code = _expand_compiled_ui(code_string, macros)
     # Create and grab the class described by the compiled ui file
     ui_globals = {}
-    exec(code_string, ui_globals)
+    with load_profiler.section("exec"):
+        exec(code, ui_globals)
     klass = ui_globals[class_name]
+    load_profiler.profiler.instrument_widget_classes(ui_globals)
 
     # Add retranslateUi to Display class
     display.retranslateUi = functools.partial(klass.retranslateUi, display)
-    klass.setupUi(display, display)
+    with load_profiler.section("setupUi"):
+        klass.setupUi(display, display)
 
     display.ui = display
 
@@ -245,7 +380,7 @@ def load_adl_file(filename, macros=None, args=None):
     d = Display(macros=macros)
     d._loaded_file = filename
 
-    fp = macro.replace_macros_in_template(Template(ui_contents), macros or {})
+    fp = macro.replace_macros_in_template(ui_contents, macros or {})
     _load_ui_into_display(fp, d)
     fp.close()
     return d
@@ -278,7 +413,8 @@ def load_py_file(pyfile, args=None, macros=None):
     # submodules can be loaded.
     # Eventually, this should go away, and intelligence modules should behave
     # as real python modules.
-    module = import_module_by_filename(os.path.abspath(pyfile))
+    with load_profiler.section("import"):
+        module = import_module_by_filename(os.path.abspath(pyfile))
 
     if hasattr(module, "intelclass"):
         cls = module.intelclass
@@ -330,6 +466,11 @@ _extension_to_loader = {
 
 
 class Display(QWidget):
+    # Whether the PyDM widgets of this display, including the ones of the
+    # displays embedded in it, hold back their updates while hidden, as with
+    # the PYDM_SUSPEND_HIDDEN_UPDATES environment variable.
+    suspend_hidden_updates = False
+
     def __init__(self, parent=None, args=None, macros=None, ui_filename=None):
         super().__init__(parent)
         self.ui = None
@@ -450,7 +591,8 @@ class Display(QWidget):
     def load_ui_from_file(self, ui_file_path: str, macros: Optional[Dict[str, str]] = None):
         """Load the ui file from the input path, and make the file's widgets available in self.ui"""
         self._loaded_file = ui_file_path
-        code_string, class_name = _compile_ui_file(ui_file_path)
+        with load_profiler.section("ui compile"):
+            code_string, class_name = _compile_ui_file(ui_file_path)
         _load_compiled_ui_into_display(code_string, class_name, self, macros)
 
     def load_help_file(self, file_path: str) -> None:
@@ -1,7 +1,9 @@
+import collections
 import os
+import weakref
 from os import path
 
-from qtpy.QtWidgets import QApplication, QMainWindow, QFileDialog, QAction, QMessageBox
+from qtpy.QtWidgets import QApplication, QMainWindow, QFileDialog, QAction, QMessageBox, QWidget
 from qtpy.QtCore import Qt, QTimer, Slot, QSize, QLibraryInfo, QCoreApplication
 from qtpy.QtGui import QKeySequence
 from .utilities import (
@@ -13,6 +15,7 @@ from .utilities import (
 from .pydm_ui import Ui_MainWindow
 from .display import Display, ScreenTarget, load_file, clear_compiled_ui_file_cache
 from .connection_inspector import ConnectionInspector
+from .performance_monitor import EventLoopIndicator, EventLoopPanel
 from .about_pydm import AboutWindow
 from .show_macros import MacroWindow
 from . import data_plugins
@@ -27,6 +30,29 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+class _EvictedDisplay(object):
+    """
+    Stands in the navigation history for a display released from the
+    navigation cache, which is loaded again when navigated to.
+    """
+
+    def __init__(self, display):
+        self._loaded_file = display.loaded_file()
+        self._macros = display.macros()
+        self._args = display.args()
+        self.previous_display = display.previous_display
+        self.next_display = display.next_display
+
+    def loaded_file(self):
+        return self._loaded_file
+
+    def macros(self):
+        return self._macros
+
+    def args(self):
+        return self._args
+
+
 class PyDMMainWindow(QMainWindow):
     def __init__(
         self,
@@ -44,6 +70,10 @@ class PyDMMainWindow(QMainWindow):
         self.font_factor = 1
         self.iconFont = IconFont()
         self._display_widget = None
+        # Displays of the navigation history kept alive, least recently shown
+        # first, with their number of widgets
+        self._navigation_cache = collections.OrderedDict()
+        self._evicted_displays = weakref.WeakSet()
         self._showing_file_path_in_title_bar = False
         self._recursive_display_search = recursive_display_search
 
@@ -152,6 +182,7 @@ class PyDMMainWindow(QMainWindow):
         new_widget.setVisible(True)
         self._display_widget = new_widget
         self.setCentralWidget(self._display_widget)
+        self._cache_display(new_widget)
         self.enable_disable_navigation()
         self.update_window_title()
         self.add_menu_items()
@@ -162,12 +193,57 @@ class PyDMMainWindow(QMainWindow):
 
     def clear_display_widget(self):
         if self._display_widget is not None:
-            close_widget_connections(self._display_widget)
+            if not config.NAVIGATION_KEEP_CONNECTED:
+                close_widget_connections(self._display_widget)
             unregister_widget_rules(self._display_widget)
             self._display_widget.setVisible(False)
             self._display_widget.setParent(None)
             self.ui.actionEdit_in_Designer.setEnabled(False)
 
+    def _cache_display(self, display):
+        """
+        Keep a display of the navigation history alive, releasing the least
+        recently shown ones beyond the PYDM_NAVIGATION_CACHE_SIZE and
+        PYDM_NAVIGATION_CACHE_WIDGETS limits.  The current and home displays
+        are always kept.
+        """
+        if not isinstance(display, Display):
+            return
+        widget_count = self._navigation_cache.pop(display, None)
+        if widget_count is None:
+            widget_count = len(display.findChildren(QWidget)) + 1
+        self._navigation_cache[display] = widget_count
+        total = sum(self._navigation_cache.values())
+        for cached in list(self._navigation_cache):
+            if len(self._navigation_cache) <= config.NAVIGATION_CACHE_SIZE and total <= config.NAVIGATION_CACHE_WIDGETS:
+                break
+            if cached is display or cached is self.home_widget:
+                continue
+            total -= self._navigation_cache.pop(cached)
+            evicted = _EvictedDisplay(cached)
+            self._evicted_displays.add(evicted)
+            self._replace_in_history(cached, evicted)
+            close_widget_connections(cached)
+            cached.deleteLater()
+
+    def _replace_in_history(self, old, new):
+        for node in list(self._navigation_cache) + list(self._evicted_displays):
+            if node.previous_display is old:
+                node.previous_display = new
+            if node.next_display is old:
+                node.next_display = new
+
+    def _restore_display(self, display):
+        """The display to show for an entry of the navigation history, loading it again if it was released."""
+        if not isinstance(display, _EvictedDisplay):
+            return display
+        restored = load_file(display.loaded_file(), macros=display.macros(), args=display.args(), target=None)
+        restored.previous_display = display.previous_display
+        restored.next_display = display.next_display
+        self._replace_in_history(display, restored)
+        self._evicted_displays.discard(display)
+        return restored
+
     def handle_open_file_error(self, filename, error):
         self.statusBar().showMessage("Cannot open file: '{0}', reason: '{1}'...".format(filename, error), 5000)
 
@@ -193,6 +269,7 @@ class PyDMMainWindow(QMainWindow):
                 target=ScreenTarget.NEW_PROCESS,
             )
         else:
+            prev_display = self._restore_display(prev_display)
             prev_display.next_display = curr_display
             establish_widget_connections(prev_display)
             register_widget_rules(prev_display)
@@ -220,6 +297,7 @@ class PyDMMainWindow(QMainWindow):
                 target=ScreenTarget.NEW_PROCESS,
             )
         else:
+            next_display = self._restore_display(next_display)
             establish_widget_connections(next_display)
             register_widget_rules(next_display)
             next_display.previous_display = curr_display
@@ -477,6 +555,10 @@ class PyDMMainWindow(QMainWindow):
         new_widget = self.open(loaded_file, macros=macros, args=args)
         new_widget.previous_display = prev_display
         new_widget.next_display = next_display
+        # The reloaded display takes the place of the old one in the history
+        if self._navigation_cache.pop(curr_display, None) is not None:
+            self._replace_in_history(curr_display, new_widget)
+            curr_display.deleteLater()
 
     @Slot(bool)
     def increase_font_size(self, checked):
@@ -519,6 +601,25 @@ class PyDMMainWindow(QMainWindow):
             self.showFullScreen()
             self.ui.actionEnter_Fullscreen.setText(_translate("MainWindow", "Exit Fullscreen"))
 
+    def add_event_loop_monitor(self, monitor):
+        """
+        Show the figures of an event loop monitor in this window: an
+        indicator in the status bar, which toggles a dockable panel with the
+        details, also available from the View menu.
+
+        Parameters
+        ----------
+        monitor : EventLoopMonitor
+        """
+        self.event_loop_panel = EventLoopPanel(monitor, self)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.event_loop_panel)
+        self.event_loop_panel.hide()
+        self.event_loop_indicator = EventLoopIndicator(monitor, self)
+        self.event_loop_indicator.clicked.connect(self.event_loop_panel.toggleViewAction().trigger)
+        self.statusBar().addPermanentWidget(self.event_loop_indicator)
+        self.ui.menuView.addSeparator()
+        self.ui.menuView.addAction(self.event_loop_panel.toggleViewAction())
+
     @Slot(bool)
     def show_connections(self, checked):
         c = ConnectionInspector(self)
@@ -0,0 +1,9 @@
+from .event_loop_monitor import EventLoopMonitor, format_statistics
+from .event_loop_panel import EventLoopIndicator, EventLoopPanel
+
+__all__ = [
+    "EventLoopMonitor",
+    "EventLoopIndicator",
+    "EventLoopPanel",
+    "format_statistics",
+]
@@ -0,0 +1,345 @@
+import os
+import sys
+import time
+import logging
+import threading
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from typing import Dict, List, Optional
+
+from qtpy.QtCore import QCoreApplication, QEvent, QObject, QTimer, Qt, Signal, Slot
+
+logger = logging.getLogger(__name__)
+
+_PROBE_EVENT_TYPE = QEvent.Type(QEvent.registerEventType())
+
+
+def _frame_location(frame) -> str:
+    code = frame.f_code
+    return "{} ({}:{})".format(code.co_name, os.path.basename(code.co_filename), frame.f_lineno)
+
+
+class EventLoopMonitor(QObject):
+    """
+    Measures how responsive the Qt event loop of the GUI thread is.
+
+    Three things are measured while the monitor runs:
+
+    * The lag of a high resolution heartbeat timer, i.e. how late each timeout
+      is delivered compared to when it was due.
+    * The delay of a probe event posted on every heartbeat, which is the time
+      spent processing the events and queued signals posted before it, i.e. the
+      backlog of the event queue.
+    * The handlers blocking the event loop.  A watchdog thread samples the
+      stack of the GUI thread whenever the heartbeat is overdue by more than
+      ``stall_threshold`` and attributes the stall to the Python function that
+      the event loop called into.
+
+    Every ``report_interval`` the figures collected since the previous report
+    are summarized, emitted with :attr:`statistics_updated` and, if a log file
+    is given, appended to a size-rotated log file so that episodes of
+    sluggishness can be looked up afterwards.
+
+    Parameters
+    ----------
+    parent : QObject, optional
+        The parent of the monitor.
+    heartbeat_interval : int, optional
+        Interval of the heartbeat timer, in milliseconds.
+    report_interval : int, optional
+        Interval between reports, in milliseconds.
+    stall_threshold : float, optional
+        Heartbeat delay, in seconds, after which the event loop is considered
+        blocked and the GUI thread gets sampled.
+    log_file : str, optional
+        Path of the rolling log file.  Nothing is logged if not given.
+    history : int, optional
+        Number of reports kept in :attr:`history`.
+    """
+
+    statistics_updated = Signal(dict)
+
+    # Sampling period of the watchdog thread, in seconds
+    sample_interval = 0.01
+    log_max_bytes = 1_000_000
+    log_backup_count = 5
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        heartbeat_interval: int = 50,
+        report_interval: int = 1000,
+        stall_threshold: float = 0.1,
+        log_file: Optional[str] = None,
+        history: int = 300,
+    ):
+        super().__init__(parent)
+        self.heartbeat_interval = heartbeat_interval
+        self.stall_threshold = stall_threshold
+        self.log_file = log_file
+        self.history = deque(maxlen=history)
+
+        self._heartbeat = QTimer(self)
+        self._heartbeat.setTimerType(Qt.PreciseTimer)
+        self._heartbeat.setInterval(heartbeat_interval)
+        self._heartbeat.timeout.connect(self._beat)
+        self._report_timer = QTimer(self)
+        self._report_timer.setInterval(report_interval)
+        self._report_timer.timeout.connect(self.report)
+
+        self._lock = threading.Lock()
+        self._watchdog = None
+        self._stopped = threading.Event()
+        self._gui_thread = None
+        self._loop_frame = None
+        self._expected = None
+        self._last_beat = None
+        self._probe_posted = None
+        self._log = None
+        self._cpu = None
+        self._connection_updates = None
+        self._last_report = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every collected figure."""
+        with self._lock:
+            self._lags = []
+            self._queue_delays = []
+            self._stalls = []
+            # Keyed on handler location, values are [stalls, seconds, longest stall, innermost location]
+            self.handlers = {}
+            self._stall_start = None
+            self._stall_handlers = set()
+        self.history.clear()
+
+    @property
+    def running(self) -> bool:
+        return self._heartbeat.isActive()
+
+    def start(self) -> None:
+        """Start measuring.  Must be called from the GUI thread."""
+        if self.running:
+            return
+        self._gui_thread = threading.get_ident()
+        self._expected = None
+        self._last_beat = time.perf_counter()
+        self._last_report = self._last_beat
+        self._connection_updates = self._count_connection_updates()
+        self._open_log()
+        try:
+            import psutil
+
+            self._cpu = psutil.Process()
+            self._cpu.cpu_percent(interval=None)
+        except ImportError:
+            self._cpu = None
+        self._heartbeat.start()
+        self._report_timer.start()
+        self._stopped.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="pydm-event-loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        """Stop measuring and close the log file."""
+        self._heartbeat.stop()
+        self._report_timer.stop()
+        self._stopped.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+        self._loop_frame = None
+        if self._log is not None:
+            for handler in self._log.handlers[:]:
+                self._log.removeHandler(handler)
+                handler.close()
+            self._log = None
+
+    def _open_log(self) -> None:
+        if not self.log_file or self._log is not None:
+            return
+        try:
+            handler = RotatingFileHandler(self.log_file, maxBytes=self.log_max_bytes, backupCount=self.log_backup_count)
+        except OSError as e:
+            logger.warning("Unable to open the event loop log file %s: %s", self.log_file, e)
+            return
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        self._log = logging.getLogger("{}.{}".format(__name__, id(self)))
+        self._log.propagate = False
+        self._log.setLevel(logging.INFO)
+        self._log.addHandler(handler)
+
+    @Slot()
+    def _beat(self) -> None:
+        now = time.perf_counter()
+        # The Python frame the event loop was entered from, used by the
+        # watchdog to tell which handler the loop is currently stuck in.
+        self._loop_frame = sys._getframe(0).f_back
+        self._last_beat = now
+        with self._lock:
+            if self._expected is not None:
+                self._lags.append(max(0.0, now - self._expected))
+            if self._stall_start is not None:
+                self._end_stall(now)
+        self._expected = now + self.heartbeat_interval / 1000.0
+        if self._probe_posted is None:
+            self._probe_posted = now
+            QCoreApplication.postEvent(self, QEvent(_PROBE_EVENT_TYPE))
+
+    def event(self, event: QEvent) -> bool:
+        if event.type() == _PROBE_EVENT_TYPE:
+            if self._probe_posted is not None:
+                with self._lock:
+                    self._queue_delays.append(time.perf_counter() - self._probe_posted)
+                self._probe_posted = None
+            return True
+        return super().event(event)
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.sample_interval):
+            last_beat = self._last_beat
+            now = time.perf_counter()
+            overdue = now - last_beat - self.heartbeat_interval / 1000.0
+            if overdue < self.stall_threshold:
+                continue
+            frame = sys._current_frames().get(self._gui_thread)
+            if frame is None or self._last_beat != last_beat:
+                continue
+            handler, innermost = self._locate_handler(frame)
+            del frame
+            with self._lock:
+                if self._stall_start is None:
+                    self._stall_start = last_beat
+                entry = self.handlers.setdefault(handler, [0, 0.0, 0.0, innermost])
+                entry[1] += self.sample_interval
+                entry[3] = innermost
+                self._stall_handlers.add(handler)
+
+    def _locate_handler(self, frame):
+        innermost = _frame_location(frame)
+        loop_frame = self._loop_frame
+        handler = None
+        while frame is not None:
+            if frame.f_back is loop_frame:
+                handler = _frame_location(frame)
+                break
+            frame = frame.f_back
+        if handler is None:
+            # Blocked outside of a handler called from the main event loop,
+            # for instance in a nested event loop or in Qt itself.
+            handler = innermost
+        return handler, innermost
+
+    def _end_stall(self, now: float) -> None:
+        duration = now - self._stall_start
+        self._stalls.append(duration)
+        for handler in self._stall_handlers:
+            entry = self.handlers[handler]
+            entry[0] += 1
+            entry[2] = max(entry[2], duration)
+            if self._log is not None:
+                self._log.warning("stall %.0f ms in %s, last seen in %s", duration * 1000.0, handler, entry[3])
+        self._stall_start = None
+        self._stall_handlers = set()
+
+    def slowest_handlers(self, count: int = 10) -> List[Dict]:
+        """
+        The handlers which blocked the event loop the longest.
+
+        Parameters
+        ----------
+        count : int, optional
+            Maximum number of handlers returned.
+
+        Returns
+        -------
+        list
+            Dictionaries with the handler location, the number of stalls it
+            was part of, the total time it was seen blocking the loop, the
+            longest stall and the innermost location last sampled, slowest
+            first.
+        """
+        with self._lock:
+            entries = sorted(self.handlers.items(), key=lambda item: item[1][1], reverse=True)[:count]
+            return [
+                {"handler": handler, "stalls": stalls, "blocked": blocked, "longest": longest, "location": location}
+                for handler, (stalls, blocked, longest, location) in entries
+            ]
+
+    @staticmethod
+    def _count_connection_updates() -> Optional[int]:
+        from pydm import data_plugins
+
+        total = None
+        for plugin in data_plugins.plugin_modules.values():
+            for connection in list(plugin.connections.values()):
+                if connection.statistics_enabled:
+                    total = (total or 0) + connection.updates_emitted
+        return total
+
+    @Slot()
+    def report(self) -> Dict:
+        """
+        Summarize the figures collected since the previous report.
+
+        Returns
+        -------
+        dict
+            Lags and delays are in seconds.  ``cpu`` is the process CPU usage
+            in percent, if psutil is available, and ``updates`` the number of
+            value updates delivered per second by the connections collecting
+            statistics, if any.
+        """
+        now = time.perf_counter()
+        with self._lock:
+            lags, self._lags = self._lags, []
+            delays, self._queue_delays = self._queue_delays, []
+            stalls, self._stalls = self._stalls, []
+            pending = None if self._probe_posted is None else now - self._probe_posted
+        if pending is not None:
+            # A probe still waiting is at least this late
+            delays.append(pending)
+        elapsed = max(now - (self._last_report or now), 1e-9)
+        self._last_report = now
+
+        updates = self._count_connection_updates()
+        rate = None
+        if updates is not None and self._connection_updates is not None:
+            rate = max(0, updates - self._connection_updates) / elapsed
+        self._connection_updates = updates
+
+        statistics = {
+            "time": time.time(),
+            "lag": lags[-1] if lags else 0.0,
+            "lag_mean": sum(lags) / len(lags) if lags else 0.0,
+            "lag_max": max(lags) if lags else 0.0,
+            "queue_delay": delays[-1] if delays else 0.0,
+            "queue_delay_max": max(delays) if delays else 0.0,
+            "stalls": len(stalls),
+            "longest_stall": max(stalls) if stalls else 0.0,
+            "cpu": self._cpu.cpu_percent(interval=None) if self._cpu is not None else None,
+            "updates": rate,
+        }
+        self.history.append(statistics)
+        if self._log is not None:
+            self._log.info(format_statistics(statistics))
+        self.statistics_updated.emit(statistics)
+        return statistics
+
+
+def format_statistics(statistics: Dict) -> str:
+    """One line summary of a report of :class:`EventLoopMonitor`."""
+    text = "lag {:.1f}/{:.1f} ms, queue {:.1f}/{:.1f} ms, stalls {}".format(
+        statistics["lag_mean"] * 1000.0,
+        statistics["lag_max"] * 1000.0,
+        statistics["queue_delay"] * 1000.0,
+        statistics["queue_delay_max"] * 1000.0,
+        statistics["stalls"],
+    )
+    if statistics["stalls"]:
+        text += " (longest {:.0f} ms)".format(statistics["longest_stall"] * 1000.0)
+    if statistics["cpu"] is not None:
+        text += ", cpu {:.0f}%".format(statistics["cpu"])
+    if statistics["updates"] is not None:
+        text += ", updates {:.0f}/s".format(statistics["updates"])
+    return text
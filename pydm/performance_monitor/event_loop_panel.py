@@ -0,0 +1,132 @@
+from qtpy.QtCore import Qt, Slot
+from qtpy.QtWidgets import (
+    QDockWidget,
+    QFormLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QToolButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from .event_loop_monitor import format_statistics
+
+# Lag, in seconds, from which the indicator turns yellow and red
+WARNING_LAG = 0.05
+ALARM_LAG = 0.2
+
+
+def _ms(seconds):
+    return "{:.1f} ms".format(seconds * 1000.0)
+
+
+class EventLoopIndicator(QToolButton):
+    """
+    Compact status bar indicator of the event loop lag reported by an
+    :class:`EventLoopMonitor`, colored by how sluggish the GUI is.
+    """
+
+    def __init__(self, monitor, parent=None):
+        super().__init__(parent)
+        self.monitor = monitor
+        self.setAutoRaise(True)
+        self.setText("Lag --")
+        self.setToolTip("Event loop lag.  Click to show the event loop monitor.")
+        monitor.statistics_updated.connect(self.update_statistics)
+
+    @Slot(dict)
+    def update_statistics(self, statistics):
+        lag = max(statistics["lag_max"], statistics["queue_delay_max"])
+        self.setText("Lag {:.0f} ms".format(lag * 1000.0))
+        self.setToolTip(format_statistics(statistics))
+        if lag >= ALARM_LAG:
+            self.setStyleSheet("color: red; font-weight: bold;")
+        elif lag >= WARNING_LAG:
+            self.setStyleSheet("color: darkorange;")
+        else:
+            self.setStyleSheet("")
+
+
+class EventLoopPanel(QDockWidget):
+    """
+    Dockable panel showing the latest report of an :class:`EventLoopMonitor`
+    and the handlers which blocked the event loop the longest.
+    """
+
+    _handler_columns = ("Handler", "Stalls", "Blocked", "Longest", "Last seen in")
+
+    def __init__(self, monitor, parent=None):
+        super().__init__("Event Loop Monitor", parent)
+        self.setObjectName("EventLoopPanel")
+        self.monitor = monitor
+
+        contents = QWidget(self)
+        layout = QVBoxLayout(contents)
+        form = QFormLayout()
+        self.labels = {}
+        for key, title in (
+            ("lag", "Heartbeat lag (mean/max)"),
+            ("queue", "Queue delay (last/max)"),
+            ("stalls", "Stalls"),
+            ("cpu", "CPU"),
+            ("updates", "Value updates"),
+            ("log", "Log file"),
+        ):
+            label = QLabel("--", contents)
+            label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            form.addRow(title, label)
+            self.labels[key] = label
+        self.labels["log"].setText(monitor.log_file or "None")
+        layout.addLayout(form)
+
+        self.handler_table = QTableWidget(0, len(self._handler_columns), contents)
+        self.handler_table.setHorizontalHeaderLabels(self._handler_columns)
+        self.handler_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.handler_table.verticalHeader().setVisible(False)
+        self.handler_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        layout.addWidget(self.handler_table)
+
+        self.reset_button = QPushButton("Reset", contents)
+        self.reset_button.clicked.connect(self.reset)
+        layout.addWidget(self.reset_button)
+        self.setWidget(contents)
+
+        monitor.statistics_updated.connect(self.update_statistics)
+
+    @Slot()
+    def reset(self):
+        self.monitor.reset()
+        self.handler_table.setRowCount(0)
+
+    @Slot(dict)
+    def update_statistics(self, statistics):
+        if not self.isVisible():
+            return
+        self.labels["lag"].setText("{} / {}".format(_ms(statistics["lag_mean"]), _ms(statistics["lag_max"])))
+        self.labels["queue"].setText(
+            "{} / {}".format(_ms(statistics["queue_delay"]), _ms(statistics["queue_delay_max"]))
+        )
+        stalls = str(statistics["stalls"])
+        if statistics["stalls"]:
+            stalls += " (longest {})".format(_ms(statistics["longest_stall"]))
+        self.labels["stalls"].setText(stalls)
+        cpu = statistics["cpu"]
+        self.labels["cpu"].setText("--" if cpu is None else "{:.0f} %".format(cpu))
+        updates = statistics["updates"]
+        self.labels["updates"].setText("--" if updates is None else "{:.0f} /s".format(updates))
+
+        handlers = self.monitor.slowest_handlers()
+        self.handler_table.setRowCount(len(handlers))
+        for row, handler in enumerate(handlers):
+            values = (
+                handler["handler"],
+                str(handler["stalls"]),
+                _ms(handler["blocked"]),
+                _ms(handler["longest"]),
+                handler["location"],
+            )
+            for column, value in enumerate(values):
+                self.handler_table.setItem(row, column, QTableWidgetItem(value))
@@ -0,0 +1,132 @@
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+import uuid
+
+import numpy as np
+import pytest
+from qtpy.QtCore import QObject, Signal
+
+from pydm import config, data_plugins
+from pydm.data_plugins.broker import Broker, BrokerClient, BrokerPlugin, messages
+from pydm.widgets.channel import PyDMChannel
+
+
+class Writer(QObject):
+    send_value_signal = Signal([int], [float], [str], [bool], [np.ndarray])
+
+
+@pytest.fixture
+def broker(qapp):
+    broker = Broker("pydm-test-broker-{}".format(uuid.uuid4().hex), linger=-1)
+    assert broker.listen()
+    yield broker
+    broker.deleteLater()
+
+
+def test_broker_keeps_running_broker_socket(qtbot, broker):
+    # A second broker started for the same name leaves the socket of the first alone
+    other = Broker(broker.name, linger=-1)
+    assert not other.listen()
+    other.deleteLater()
+    client = BrokerClient(broker.name)
+    qtbot.waitUntil(lambda: client.is_connected)
+    qtbot.waitUntil(lambda: broker.client_count == 1)
+
+
+def test_brokers_started_together(tmp_path):
+    # Only one of several brokers started at the same time keeps the name
+    script = textwrap.dedent(
+        """
+        import sys, time
+        from qtpy.QtCore import QCoreApplication
+        from pydm.data_plugins.broker import Broker
+
+        app = QCoreApplication([])
+        broker = Broker(sys.argv[1], linger=-1)
+        time.sleep(max(0.0, float(sys.argv[2]) - time.time()))
+        print(broker.listen(), flush=True)
+        time.sleep(2)
+        """
+    )
+    name = "pydm-test-broker-{}".format(uuid.uuid4().hex)
+    start = str(time.time() + 3)
+    processes = [
+        subprocess.Popen([sys.executable, "-c", script, name, start], stdout=subprocess.PIPE, text=True)
+        for _ in range(4)
+    ]
+    results = [process.communicate(timeout=60)[0].strip() for process in processes]
+    assert sorted(results) == ["False", "False", "False", "True"]
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Requires unix sockets")
+def test_broker_replaces_stale_socket(qapp, tmp_path):
+    name = str(tmp_path / "broker")
+    # The socket of a broker which did not exit properly
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(name)
+    stale.close()
+    broker = Broker(name, linger=-1)
+    assert broker.listen()
+    broker.deleteLater()
+
+
+def test_message_reader():
+    array = np.arange(10.0)
+    data = messages.encode((messages.UPDATE, "ca://PV", "value_slot", array))
+    data += messages.encode((messages.SUBSCRIBE, "ca://OTHER"))
+    reader = messages.MessageReader()
+    received = []
+    for i in range(len(data)):
+        received.extend(reader.feed(data[i : i + 1]))
+    assert len(received) == 2
+    assert received[0][:3] == (messages.UPDATE, "ca://PV", "value_slot")
+    np.testing.assert_array_equal(received[0][3], array)
+    assert received[1] == (messages.SUBSCRIBE, "ca://OTHER")
+
+
+def test_broker_shares_connections(qtbot, broker):
+    # Two clients stand in for two PyDM processes, loc:// for the IOC
+    clients = [BrokerClient(broker.name) for _ in range(2)]
+    qtbot.waitUntil(lambda: all(client.is_connected for client in clients))
+    plugins = [BrokerPlugin("loc", client) for client in clients]
+    address = "loc://broker_test?type=float&init=1.5"
+    received = ([], [])
+    writers = [Writer(), Writer()]
+    channels = [
+        PyDMChannel(
+            address,
+            value_slot=received[i].append,
+            value_signal=writers[i].send_value_signal,
+        )
+        for i in range(2)
+    ]
+
+    plugins[0].add_connection(channels[0])
+    qtbot.waitUntil(lambda: received[0][-1:] == [1.5])
+    # The second subscriber gets the last value from the broker
+    plugins[1].add_connection(channels[1])
+    qtbot.waitUntil(lambda: received[1][-1:] == [1.5])
+    assert list(broker.subscriptions) == [address]
+    local_connection = data_plugins.plugin_for_address(address, use_broker=False).connections["broker_test"]
+    assert local_connection.listener_count == 1
+
+    # Values written by any client are written once and reach every client
+    writers[1].send_value_signal[float].emit(2.5)
+    qtbot.waitUntil(lambda: received[0][-1] == 2.5 and received[1][-1] == 2.5)
+
+    plugins[0].remove_connection(channels[0])
+    plugins[1].remove_connection(channels[1])
+    qtbot.waitUntil(lambda: not broker.subscriptions)
+    assert "broker_test" not in data_plugins.plugin_for_address(address, use_broker=False).connections
+
+
+def test_plugin_for_address_uses_broker(monkeypatch):
+    monkeypatch.setattr(config, "BROKER_PROTOCOLS", ["loc"])
+    monkeypatch.setattr(BrokerClient, "_connect", lambda self: None)
+    plugin = data_plugins.plugin_for_address("loc://brokered")
+    assert isinstance(plugin, BrokerPlugin) and plugin.protocol == "loc"
+    assert not isinstance(data_plugins.plugin_for_address("loc://brokered", use_broker=False), BrokerPlugin)
+    assert not isinstance(data_plugins.plugin_for_address("calc://direct"), BrokerPlugin)
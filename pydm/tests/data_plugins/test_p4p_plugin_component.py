@@ -1,5 +1,10 @@
 import functools
+import subprocess
+import sys
+import textwrap
+import time
 import numpy as np
+from types import SimpleNamespace
 import pytest
 from p4p.nt import NTEnum, NTScalar
 from pydm.data_plugins.epics_plugins.p4p_plugin_component import Connection, P4PPlugin
@@ -300,3 +305,71 @@ def test_create_rpc_value_obj(
 
     for item1, item2 in zip(result_query.items(), expected_query.items()):
         assert item1 == item2
+
+
+class MockRPCContext:
+    """A mock of a p4p context answering each RPC request with the number of requests received so far"""
+
+    def __init__(self):
+        self.requests = []
+
+    def rpc(self, name, value, timeout):
+        self.requests.append(name)
+        return SimpleNamespace(value=len(self.requests))
+
+
+def test_rpc_poll_scheduler(qtbot, monkeypatch):
+    """
+    Ensure that identical RPC requests are polled once for all the connections making them,
+    and that polling stops once the last of them is closed.
+    """
+    context = MockRPCContext()
+    monkeypatch.setattr(P4PPlugin, "context", context)
+    addresses = ("pva://pv:call:add?a=4&b=7&pydm_pollrate=0.05", "pva://pv:call:add?b=7&a=4&pydm_pollrate=0.05")
+    received = ([], [])
+    connections = []
+    for address, values in zip(addresses, received):
+        connections.append(Connection(PyDMChannel(address=address, value_slot=values.append), address))
+
+    poll = connections[0]._rpc_poll
+    assert connections[1]._rpc_poll is poll
+    qtbot.waitUntil(lambda: len(received[0]) >= 3 and len(received[1]) >= 3)
+    assert connections[0]._rpc_poll_rate == 0.05
+    assert set(context.requests) == {"pv:call:add"}
+
+    for connection in connections:
+        connection.close()
+    assert poll.cancelled
+    requests = len(context.requests)
+    qtbot.wait(200)
+    # At most the request running when the connections were closed
+    assert len(context.requests) <= requests + 1
+
+
+def test_rpc_poll_scheduler_does_not_block_exit():
+    """Ensure that an RPC request still running does not hold up the exit of the application"""
+    script = textwrap.dedent(
+        """
+        import threading
+        import time
+        from pydm.data_plugins.epics_plugins.p4p_plugin_component import Connection, P4PPlugin
+        from pydm.widgets.channel import PyDMChannel
+
+        started = threading.Event()
+
+
+        class SlowContext:
+            def rpc(self, name, value, timeout):
+                started.set()
+                time.sleep(60)
+
+
+        P4PPlugin.context = SlowContext()
+        address = "pva://pv:call:slow?a=1&pydm_pollrate=60"
+        connection = Connection(PyDMChannel(address=address), address)
+        assert started.wait(10)
+        """
+    )
+    start = time.monotonic()
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=30)
+    assert time.monotonic() - start < 20
@@ -1,6 +1,12 @@
+import time
 from unittest.mock import MagicMock
 
+import numpy as np
+import pytest
+from qtpy.QtCore import QObject
+
 from pydm.data_plugins import PyDMPlugin
+from pydm.data_plugins.plugin import METADATA_SIGNALS, ControlVariables, PyDMConnection
 from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes
 from pydm.widgets.channel import PyDMChannel
 
@@ -29,8 +35,9 @@ def test_connections():
     assert len(pydm_plugin.connections) == 0
 
 
-def test_signal_slot_disconnect():
+def test_signal_slot_disconnect(monkeypatch):
     """When a listener is removed from a channel, verify all signals/slots for that listener are disconnected"""
+    monkeypatch.setattr(PyDMConnection, "fan_out_dispatch", False)
     pydm_plugin = PyDMPlugin()
 
     signal_one = MagicMock()
@@ -115,3 +122,198 @@ def create_channel(address, value_signal):
         value_signal=value_signal,
         timestamp_slot=lambda: None,
     )
+
+
+def test_connection_statistics():
+    """Connections count the value updates received and delivered once statistics are enabled"""
+    pydm_plugin = PyDMPlugin()
+    channel_one = create_channel("ca://TEST:STATS", MagicMock())
+    channel_two = create_channel("ca://TEST:STATS", MagicMock())
+    pydm_plugin.add_connection(channel_one)
+    connection = pydm_plugin.connections["TEST:STATS"]
+    connection.add_listener(channel_one)
+    pydm_plugin.add_connection(channel_two)
+
+    connection.new_value_signal[int].emit(1)
+    assert connection.updates_received == 0
+    # Nothing is allocated for the statistics until they are enabled
+    assert not connection.statistics_enabled
+    assert connection._stats is None
+
+    connection.enable_statistics()
+    connection.enable_statistics()
+    connection.new_value_signal[int].emit(1)
+    connection.new_value_signal[str].emit("abcd")
+    connection.new_value_signal[np.ndarray].emit(np.zeros(10))
+    connection.timestamp_signal.emit(time.time() - 0.5)
+
+    stats = connection.statistics()
+    assert stats["listeners"] == 2
+    assert stats["updates_received"] == 3
+    assert stats["updates_emitted"] == 6
+    assert stats["bytes_received"] == 8 + 4 + 80
+    assert stats["max_burst"] == 3
+    assert 0.5 <= stats["last_latency"] < 5
+
+
+def test_fan_out_dispatch(qtbot, monkeypatch):
+    """In fan out mode each signal has a single queued connection, calling every listener in turn"""
+    monkeypatch.setattr(PyDMConnection, "fan_out_dispatch", True)
+    pydm_plugin = PyDMPlugin()
+    received = []
+    channels = [
+        PyDMChannel(
+            "ca://TEST:FANOUT",
+            value_slot=lambda value, i=i: received.append((i, value)),
+            severity_slot=lambda severity, i=i: received.append((i, "severity", severity)),
+        )
+        for i in range(3)
+    ]
+    pydm_plugin.add_connection(channels[0])
+    connection = pydm_plugin.connections["TEST:FANOUT"]
+    # Listener tables are only created for the first listener
+    assert connection._listener_tables is None
+    # The base connection class does not listen to the channel it is created for
+    connection.add_listener(channels[0])
+    for channel in channels[1:]:
+        pydm_plugin.add_connection(channel)
+    assert connection.fan_out
+    assert connection.receivers(connection.new_value_signal[float]) == 1
+    assert connection.receivers(connection.new_severity_signal) == 1
+    assert connection.receivers(connection.unit_signal) == 0
+
+    connection.new_value_signal[float].emit(1.5)
+    connection.new_severity_signal.emit(2)
+    assert received == []
+    qtbot.waitUntil(lambda: len(received) == 6)
+    assert received == [(0, 1.5), (1, 1.5), (2, 1.5), (0, "severity", 2), (1, "severity", 2), (2, "severity", 2)]
+
+    pydm_plugin.remove_connection(channels[1])
+    received.clear()
+    connection.new_value_signal[str].emit("a")
+    qtbot.waitUntil(lambda: len(received) == 2)
+    assert received == [(0, "a"), (2, "a")]
+    assert connection.listener_count == 2
+
+
+def test_fan_out_dispatch_removal_during_dispatch(qtbot, monkeypatch):
+    """A listener removed by a slot called before it in the same dispatch is not called"""
+    monkeypatch.setattr(PyDMConnection, "fan_out_dispatch", True)
+    pydm_plugin = PyDMPlugin()
+    received = []
+
+    def remove_second(value):
+        received.append("first")
+        pydm_plugin.remove_connection(second)
+
+    first = PyDMChannel("ca://TEST:FANOUT:REMOVE", value_slot=remove_second)
+    second = PyDMChannel("ca://TEST:FANOUT:REMOVE", value_slot=lambda value: received.append("second"))
+    pydm_plugin.add_connection(first)
+    connection = pydm_plugin.connections["TEST:FANOUT:REMOVE"]
+    connection.add_listener(first)
+    pydm_plugin.add_connection(second)
+
+    connection.new_value_signal[int].emit(1)
+    qtbot.waitUntil(lambda: len(received) > 0)
+    qtbot.wait(10)
+    assert received == ["first"]
+
+
+def test_fan_out_dispatch_deleted_receiver(qtbot, monkeypatch):
+    """Slots of deleted QObjects are dropped rather than called"""
+
+    class Receiver(QObject):
+        def value_changed(self, value):
+            raise AssertionError("Called a slot of a deleted object")
+
+    monkeypatch.setattr(PyDMConnection, "fan_out_dispatch", True)
+    pydm_plugin = PyDMPlugin()
+    receiver = Receiver()
+    channel = PyDMChannel("ca://TEST:FANOUT:DELETED", value_slot=receiver.value_changed)
+    pydm_plugin.add_connection(channel)
+    connection = pydm_plugin.connections["TEST:FANOUT:DELETED"]
+    connection.add_listener(channel)
+    table = connection._listener_tables[float]
+    assert len(table.slots) == 1
+
+    receiver.deleteLater()
+    qtbot.wait(10)
+    connection.new_value_signal[float].emit(1.0)
+    qtbot.wait(10)
+    assert len(table.slots) == 0
+
+
+class MetadataConnection(PyDMConnection):
+    sends_metadata = True
+
+
+class MetadataPlugin(PyDMPlugin):
+    connection_class = MetadataConnection
+
+
+@pytest.mark.parametrize("fan_out", [False, True])
+def test_coalesced_metadata(qtbot, monkeypatch, fan_out):
+    """Listeners with a metadata slot get every control variable sent at once in a single call"""
+    monkeypatch.setattr(PyDMConnection, "fan_out_dispatch", fan_out)
+    monkeypatch.setattr(PyDMConnection, "coalesce_metadata", True)
+    pydm_plugin = MetadataPlugin()
+    received = []
+    coalesced = PyDMChannel(
+        "ca://TEST:METADATA",
+        unit_slot=lambda units: received.append(("coalesced units", units)),
+        metadata_slot=lambda metadata: received.append(("metadata", metadata)),
+    )
+    separate = PyDMChannel(
+        "ca://TEST:METADATA",
+        unit_slot=lambda units: received.append(("separate units", units)),
+        prec_slot=lambda precision: received.append(("separate precision", precision)),
+    )
+    pydm_plugin.add_connection(coalesced)
+    connection = pydm_plugin.connections["TEST:METADATA"]
+    connection.add_listener(coalesced)
+    pydm_plugin.add_connection(separate)
+    assert connection.coalesced_metadata
+
+    connection.send_metadata({"units": "mm", "precision": 3})
+    connection.send_metadata({})
+    qtbot.waitUntil(lambda: len(received) == 3)
+    qtbot.wait(10)
+    assert received == [
+        ("metadata", {"units": "mm", "precision": 3}),
+        ("separate units", "mm"),
+        ("separate precision", 3),
+    ]
+
+    # Connection classes not sending metadata keep the separate signals for every listener
+    monkeypatch.setattr(MetadataConnection, "sends_metadata", False)
+    assert not MetadataConnection(coalesced, "TEST:OTHER").coalesced_metadata
+
+
+def test_channel_apply_metadata():
+    received = []
+    channel = PyDMChannel(
+        "ca://TEST:APPLY",
+        severity_slot=lambda severity: received.append(("severity", severity)),
+        upper_ctrl_limit_slot=lambda limit: received.append(("upper", limit)),
+    )
+    channel.apply_metadata({"upper_ctrl_limit": 10.0, "units": "mm", "severity": 2})
+    assert received == [("upper", 10.0), ("severity", 2)]
+
+
+def test_control_variables():
+    ctrl_vars = ControlVariables()
+    assert not hasattr(ctrl_vars, "__dict__")
+    assert set(ctrl_vars.__slots__) == {"value"} | set(METADATA_SIGNALS)
+    ctrl_vars.value = 1.0
+    ctrl_vars.units = "mm"
+    with pytest.raises(AttributeError):
+        ctrl_vars.unknown = True
+    ctrl_vars.clear()
+    assert ctrl_vars.value is None and ctrl_vars.units is None
+
+
+def test_channel_is_slotted():
+    channel = PyDMChannel("ca://TEST:SLOTS")
+    assert not hasattr(channel, "__dict__")
+    with pytest.raises(AttributeError):
+        channel.unknown_slot = None
@@ -2,6 +2,7 @@ import pytest
 from concurrent.futures import ThreadPoolExecutor
 
 from pydm.data_plugins.epics_plugins.pyepics_plugin_component import Connection, PyEPICSPlugin
+from pydm.data_plugins.plugin import PyDMConnection
 from pydm.tests.conftest import ConnectionSignals
 from pydm.widgets.channel import PyDMChannel
 
@@ -49,3 +50,17 @@ def test_update_ctrl_vars(signals: ConnectionSignals):
 
     expected_values = [70, 20, 100, 2, 90, 10]
     assert values_received == expected_values
+
+
+def test_update_ctrl_vars_coalesced(monkeypatch, signals: ConnectionSignals):
+    """With coalesced metadata, the changed control values are also emitted together in a single signal"""
+    monkeypatch.setattr(PyDMConnection, "coalesce_metadata", True)
+    received = []
+    mock_pyepics_connection = Connection(PyDMChannel(), "Test:PV:2")
+    mock_pyepics_connection.metadata_signal.connect(received.append)
+    mock_pyepics_connection.unit_signal.connect(lambda units: received.append(units))
+
+    mock_pyepics_connection.update_ctrl_vars(units="mm", precision=2, severity=1)
+    mock_pyepics_connection.update_ctrl_vars(units="mm", precision=2, severity=1)
+
+    assert received == [{"severity": 1, "precision": 2, "units": "mm"}, "mm"]
@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+from qtpy.QtCore import Qt
+
+from pydm import data_plugins
+from pydm.connection_inspector import ConnectionInspector
+from pydm.connection_inspector.connection_table_model import ConnectionTableModel
+from pydm.data_plugins.plugin import PyDMConnection
+
+
+def make_connection(address, **kwargs):
+    stats = dict(
+        protocol="ca",
+        address=address,
+        connected=True,
+        listener_count=1,
+        updates_received=0,
+        updates_emitted=0,
+        bytes_received=0,
+        last_latency=None,
+        max_burst=0,
+    )
+    stats.update(kwargs)
+    return SimpleNamespace(**stats)
+
+
+def test_connection_model_updates_changed_rows(qtbot):
+    connections = [make_connection("PV:{}".format(i)) for i in range(5)]
+    model = ConnectionTableModel(connections)
+    assert model.rowCount() == 5
+    assert model.headerData(4, Qt.Horizontal) == "Received"
+    assert model.data(model.index(0, 7)) == ""
+
+    changes = []
+    model.dataChanged.connect(lambda first, last: changes.append((first.row(), last.row())))
+    model.update_values()
+    assert changes == []
+
+    connections[1].updates_received = 10
+    connections[2].last_latency = 0.0123
+    connections[4].connected = False
+    model.update_values()
+    assert changes == [(1, 2), (4, 4)]
+    assert model.data(model.index(2, 7)) == "12.3"
+    assert model.data(model.index(1, 4), Qt.UserRole) == 10.0
+
+    # Setting the same connections again does not reset the model
+    resets = []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.connections = list(connections)
+    assert resets == []
+    model.connections = connections[:2]
+    assert resets == [True]
+    assert model.rowCount() == 2
+
+
+def test_connection_inspector_sort_and_filter(qtbot, monkeypatch):
+    monkeypatch.setattr(PyDMConnection, "collect_statistics", PyDMConnection.collect_statistics)
+    monkeypatch.setattr(data_plugins, "plugin_modules", {})
+    inspector = ConnectionInspector()
+    qtbot.addWidget(inspector)
+    assert PyDMConnection.collect_statistics
+
+    connections = [
+        make_connection("SLOW:PV", updates_received=2),
+        make_connection("BUSY:PV", updates_received=900),
+        make_connection("OTHER:PV", updates_received=50),
+    ]
+    view = inspector.table_view
+    view.connection_model.connections = connections
+    view.sortByColumn(4, Qt.DescendingOrder)
+    proxy = view.proxy_model
+    assert [proxy.index(row, 1).data() for row in range(proxy.rowCount())] == ["BUSY:PV", "OTHER:PV", "SLOW:PV"]
+
+    inspector.filter_edit.setText("pv")
+    assert proxy.rowCount() == 3
+    inspector.filter_edit.setText("busy")
+    assert proxy.rowCount() == 1
+    assert proxy.index(0, 1).data() == "BUSY:PV"
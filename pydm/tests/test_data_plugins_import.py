@@ -2,7 +2,7 @@ import os
 
 import entrypoints
 
-from pydm import config
+from pydm import config, data_plugins
 from pydm.data_plugins import (
     PyDMPlugin,
     initialize_plugins_if_needed,
@@ -10,7 +10,10 @@ from pydm.data_plugins import (
     load_plugins_from_path,
     plugin_for_address,
     plugin_modules,
+    register_plugins_from_entrypoints,
+    register_plugins_from_path,
 )
+from pydm.data_plugins import manifest
 
 
 def test_data_plugin_add(qapp, test_plugin):
@@ -89,3 +92,131 @@ def test_entrypoint_import(monkeypatch):
 
     assert "__test_suite_protocol__" in loaded
     assert isinstance(loaded["__test_suite_protocol__"], MyTestPlugin)
+
+
+lazy_file = """\
+from pydm.data_plugins import PyDMPlugin
+
+try:
+    from some_library import SomePlugin
+except ImportError:
+    SomePlugin = None
+
+if SomePlugin is not None:
+    SomePlugin.protocol = "lazy3"
+
+
+class LazyPlugin1(PyDMPlugin):
+    protocol = "lazy1"
+
+
+class LazyPlugin2(PyDMPlugin):
+    protocol = "lazy2"
+"""
+
+
+def test_scan_plugin_source(tmp_path):
+    source = tmp_path / "lazy_plugin.py"
+    source.write_text(lazy_file)
+    assert manifest.scan_plugin_source(str(source)) == [
+        ("lazy3", "SomePlugin"),
+        ("lazy1", "LazyPlugin1"),
+        ("lazy2", "LazyPlugin2"),
+    ]
+    source.write_text("def broken(:\n")
+    assert manifest.scan_plugin_source(str(source)) == []
+
+
+def test_lazy_plugin_loading(qapp, tmp_path, monkeypatch):
+    monkeypatch.setattr(data_plugins, "plugin_modules", {})
+    monkeypatch.setattr(data_plugins, "_lazy_plugins", {})
+    monkeypatch.setattr(manifest, "_manifest", None)
+    store = tmp_path / "manifest.json"
+    monkeypatch.setattr(config, "DATA_PLUGINS_MANIFEST", str(store))
+    source = tmp_path / "lazy_plugin.py"
+    source.write_text(lazy_file)
+
+    assert register_plugins_from_path([str(tmp_path)]) == ["lazy3", "lazy1", "lazy2"]
+    # Nothing is imported until a protocol gets used
+    assert str(source) not in data_plugins._source_modules
+    assert data_plugins.plugin_modules == {}
+
+    plugin = plugin_for_address("lazy2://test")
+    assert type(plugin).__name__ == "LazyPlugin2"
+    assert list(data_plugins.plugin_modules) == ["lazy2"]
+    assert plugin_for_address("lazy2://other") is plugin
+    # Both classes come from the same module
+    assert type(plugin_for_address("lazy1://test")).__module__ == type(plugin).__module__
+    # The library providing this one is not installed
+    assert plugin_for_address("lazy3://test") is None
+    assert "lazy3" not in data_plugins.available_plugins()
+
+    manifest.save(str(store))
+    monkeypatch.setattr(manifest, "_manifest", None)
+    stored = manifest.get_manifest()
+    assert not stored.dirty
+    assert stored.protocols(str(source))[1] == ("lazy1", "LazyPlugin1")
+    # Modifying the file invalidates its entry
+    source.write_text("from pydm.data_plugins import PyDMPlugin\n\nclass Other(PyDMPlugin):\n    protocol = 'other'\n")
+    os.utime(source, (0, 0))
+    assert stored.protocols(str(source)) == [("other", "Other")]
+    assert stored.dirty
+
+
+def test_undeclared_plugin_files(qapp, tmp_path, monkeypatch):
+    monkeypatch.setattr(data_plugins, "plugin_modules", {})
+    monkeypatch.setattr(data_plugins, "_lazy_plugins", {})
+    monkeypatch.setattr(manifest, "_manifest", manifest.PluginManifest())
+    # The protocol of this one is only known once it is imported
+    undeclared = tmp_path / "a_plugin.py"
+    undeclared.write_text(
+        "from pydm.data_plugins import PyDMPlugin\n\nclass Undeclared(PyDMPlugin):\n    protocol = 'lazy' + '1'\n"
+    )
+    (tmp_path / "b_plugin.py").write_text(lazy_file)
+
+    assert register_plugins_from_path([str(tmp_path)]) == ["lazy1", "lazy3", "lazy1", "lazy2"]
+    assert str(undeclared) in data_plugins._source_modules
+    assert data_plugins.plugin_modules == {}
+    # The last file found providing a protocol is used
+    assert type(plugin_for_address("lazy1://test")).__name__ == "LazyPlugin1"
+
+    monkeypatch.setattr(data_plugins, "plugin_modules", {})
+    monkeypatch.setattr(data_plugins, "_lazy_plugins", {})
+    undeclared.rename(tmp_path / "c_plugin.py")
+    register_plugins_from_path([str(tmp_path)])
+    assert type(plugin_for_address("lazy1://test")).__name__ == "Undeclared"
+
+
+def test_lazy_entrypoint_loading(monkeypatch):
+    monkeypatch.setattr(data_plugins, "plugin_modules", {})
+    monkeypatch.setattr(data_plugins, "_lazy_plugins", {})
+    monkeypatch.setattr(manifest, "_manifest", manifest.PluginManifest())
+    loads = []
+
+    class MyLazyPlugin(PyDMPlugin):
+        protocol = "__lazy_entrypoint__"
+
+    class Entrypoint:
+        name = "MyLazyPlugin"
+        module_name = "my_package.data"
+        object_name = "MyLazyPlugin"
+        distro = None
+
+        def load(self):
+            loads.append(self.name)
+            return MyLazyPlugin
+
+    monkeypatch.setattr(entrypoints, "get_group_all", lambda key: [Entrypoint()])
+    # Unknown entrypoints can be skipped rather than loaded
+    assert register_plugins_from_entrypoints(import_unknown=False) == []
+    assert loads == []
+    # Loaded once to find out the protocol, which is then known from the manifest
+    assert register_plugins_from_entrypoints() == ["__lazy_entrypoint__"]
+    assert len(loads) == 1
+    monkeypatch.setattr(data_plugins, "_lazy_plugins", {})
+    assert register_plugins_from_entrypoints() == ["__lazy_entrypoint__"]
+    assert len(loads) == 1
+    assert data_plugins.plugin_modules == {}
+
+    assert isinstance(data_plugins.load_plugin("__lazy_entrypoint__"), MyLazyPlugin)
+    assert len(loads) == 2
@@ -2,7 +2,7 @@ import os
 import weakref
 import gc
 
-from pydm import PyDMApplication
+from pydm import PyDMApplication, config
 from pydm.display import Display, clear_compiled_ui_file_cache
 from qtpy import uic
 from unittest.mock import MagicMock, patch
@@ -87,3 +87,30 @@ def test_menubar_text(qapp: PyDMApplication) -> None:
     # click the menu-item to go into fullscreen view
     action.trigger()
     assert action.text() == "Exit Fullscreen"
+
+
+def test_navigation_cache(qapp: PyDMApplication, monkeypatch) -> None:
+    """Verify that only the most recently shown displays of the navigation history are kept, and that the others
+    are loaded again when navigated to"""
+    monkeypatch.setattr(config, "NAVIGATION_CACHE_SIZE", 3)
+    qapp.make_main_window()
+    main_window = qapp.main_window
+    home = main_window.open(test_ui_path)
+    second = main_window.open(test_ui_path)
+    third = main_window.open(test_ui_path)
+    fourth = main_window.open(test_ui_path)
+
+    # The home display is always kept, the second one was released
+    assert list(main_window._navigation_cache) == [home, third, fourth]
+    assert third.previous_display is not second
+    assert third.previous_display.loaded_file() == second.loaded_file()
+
+    main_window.back()
+    assert main_window.display_widget() is third
+    main_window.back()
+    restored = main_window.display_widget()
+    assert restored not in (home, second, third, fourth)
+    assert restored.previous_display is home
+    assert restored.next_display is third
+    main_window.forward()
+    assert main_window.display_widget() is third
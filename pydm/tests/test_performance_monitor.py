@@ -0,0 +1,70 @@
+import time
+
+from qtpy.QtCore import QTimer
+
+from pydm.main_window import PyDMMainWindow
+from pydm.performance_monitor import EventLoopMonitor, EventLoopPanel, format_statistics
+
+
+def block_event_loop():
+    time.sleep(0.3)
+
+
+def test_event_loop_monitor_measures_lag(qtbot):
+    monitor = EventLoopMonitor(heartbeat_interval=10, report_interval=100000)
+    monitor.start()
+    try:
+        qtbot.wait(100)
+        statistics = monitor.report()
+        assert statistics["stalls"] == 0
+        assert 0.0 <= statistics["lag_mean"] <= statistics["lag_max"]
+        assert statistics["queue_delay_max"] < 0.1
+        assert statistics["updates"] is None
+        assert monitor.history[-1] is statistics
+        assert "lag" in format_statistics(statistics)
+    finally:
+        monitor.stop()
+    assert not monitor.running
+
+
+def test_event_loop_monitor_finds_blocking_handler(qtbot, tmp_path):
+    log_file = tmp_path / "perfmon.log"
+    monitor = EventLoopMonitor(heartbeat_interval=10, report_interval=100000, log_file=str(log_file))
+    monitor.start()
+    try:
+        qtbot.wait(50)
+        QTimer.singleShot(0, block_event_loop)
+        qtbot.wait(200)
+        statistics = monitor.report()
+    finally:
+        monitor.stop()
+
+    assert statistics["stalls"] >= 1
+    assert statistics["longest_stall"] >= 0.2
+    assert statistics["lag_max"] >= 0.2
+    slowest = monitor.slowest_handlers()
+    assert slowest[0]["handler"].startswith("block_event_loop (")
+    assert slowest[0]["stalls"] == 1
+
+    log = log_file.read_text()
+    assert "stall" in log and "block_event_loop" in log
+    assert "queue" in log
+
+
+def test_main_window_event_loop_monitor(qtbot):
+    monitor = EventLoopMonitor(report_interval=100000)
+    window = PyDMMainWindow()
+    qtbot.addWidget(window)
+    window.add_event_loop_monitor(monitor)
+    window.show()
+    assert window.event_loop_panel.isHidden()
+
+    window.event_loop_indicator.click()
+    assert not window.event_loop_panel.isHidden()
+    assert isinstance(window.event_loop_panel, EventLoopPanel)
+
+    monitor.handlers["slot (display.py:1)"] = [2, 0.5, 0.3, "sleep (display.py:2)"]
+    monitor.report()
+    assert window.event_loop_indicator.text().startswith("Lag")
+    assert window.event_loop_panel.handler_table.rowCount() == 1
+    assert window.event_loop_panel.handler_table.item(0, 0).text() == "slot (display.py:1)"
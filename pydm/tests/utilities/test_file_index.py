@@ -0,0 +1,66 @@
+import os
+
+from pydm import config
+from pydm.utilities import file_index
+from pydm.utilities.file_index import FileIndex
+
+
+def test_file_index_lookup(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / "top.ui").touch()
+    (tmp_path / "a" / "b" / "top.ui").touch()
+    (tmp_path / ".hidden" / "top.ui").touch()
+
+    index = FileIndex(str(tmp_path))
+    index.refresh()
+    assert index.complete
+    assert [(depth, path) for depth, _, path in index.lookup("top.ui")] == [
+        (0, str(tmp_path / "top.ui")),
+        (2, str(tmp_path / "a" / "b" / "top.ui")),
+    ]
+    assert index.lookup("missing.ui") == []
+
+
+def test_file_index_refresh(tmp_path):
+    (tmp_path / "a").mkdir()
+    index = FileIndex(str(tmp_path))
+    index.refresh()
+    assert index.lookup("new.ui") == []
+
+    (tmp_path / "a" / "new.ui").touch()
+    # Refreshes are throttled unless forced
+    index.refresh()
+    assert index.lookup("new.ui") == []
+    index.refresh(force=True)
+    assert [path for *_, path in index.lookup("new.ui")] == [str(tmp_path / "a" / "new.ui")]
+
+    os.remove(tmp_path / "a" / "new.ui")
+    os.rmdir(tmp_path / "a")
+    index.refresh(force=True)
+    assert index.lookup("new.ui") == []
+    assert list(index.to_dict()) == [str(tmp_path)]
+
+
+def test_file_index_persistent(tmp_path, monkeypatch):
+    tree = tmp_path / "tree"
+    (tree / "sub").mkdir(parents=True)
+    (tree / "sub" / "display.ui").touch()
+    os.utime(tree / "sub", (0, 1))
+    os.utime(tree, (0, 1))
+    store = str(tmp_path / "index.json")
+
+    monkeypatch.setattr(config, "FILE_INDEX", store)
+    monkeypatch.setattr(file_index, "_persistent_loaded", True)
+    monkeypatch.setattr(file_index, "_indexes", {})
+    index = file_index.get_index(str(tree))
+    index.refresh()
+    file_index.save(store)
+    assert not index.dirty
+
+    monkeypatch.setattr(file_index, "_persistent_loaded", False)
+    monkeypatch.setattr(file_index, "_indexes", {})
+    monkeypatch.setattr(FileIndex, "_list", staticmethod(lambda path: (_ for _ in ()).throw(AssertionError(path))))
+    loaded = file_index.get_index(str(tree))
+    assert loaded is not index
+    assert [path for *_, path in loaded.lookup("display.ui")] == [str(tree / "sub" / "display.ui")]
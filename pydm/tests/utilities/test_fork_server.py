@@ -0,0 +1,97 @@
+import os
+import select
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import pydm
+from pydm.utilities import fork_server
+from pydm.utilities.fork_server import ForkServer
+
+pytestmark = pytest.mark.skipif(not fork_server.is_available(), reason="Requires fork and unix sockets")
+
+
+def read_line(stream, timeout=30.0):
+    ready, _, _ = select.select([stream], [], [], timeout)
+    return stream.readline().decode() if ready else ""
+
+
+def test_fork_server(tmp_path):
+    address = str(tmp_path / "socket")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "pydm.utilities.fork_server", address, str(os.getpid())],
+        stdout=subprocess.PIPE,
+    )
+    server = ForkServer(address, process)
+    try:
+        assert server.wait_ready()
+        pid = server.launch(["pydm", "--version"])
+        assert pid is not None and pid != process.pid
+        assert read_line(process.stdout).strip() == "PyDM {}".format(pydm.__version__)
+
+        # A child would not see environment variables read while importing PyDM
+        env = dict(os.environ, PYDM_DEFAULT_PROTOCOL="changed")
+        assert server.launch(["pydm", "--version"], env=env) is None
+    finally:
+        process.terminate()
+        process.wait()
+    assert server.launch(["pydm", "--version"]) is None
+
+
+def test_fork_server_does_not_import_plugins(tmp_path):
+    (tmp_path / "declared_plugin.py").write_text(
+        "from pydm.data_plugins import PyDMPlugin\n\nclass Declared(PyDMPlugin):\n    protocol = 'declared'\n"
+    )
+    (tmp_path / "undeclared_plugin.py").write_text(
+        "from pydm.data_plugins import PyDMPlugin\n\nclass Undeclared(PyDMPlugin):\n    protocol = 'un' + 'declared'\n"
+    )
+    script = textwrap.dedent(
+        """
+        import sys
+        from pydm import data_plugins
+        from pydm.utilities import fork_server
+
+        fork_server._preload()
+        files = [getattr(module, "__file__", None) or "" for module in list(sys.modules.values())]
+        print(sorted(data_plugins._lazy_plugins), [f for f in files if f.endswith("_plugin.py")])
+        # The search is completed in the children
+        data_plugins.initialize_plugins_if_needed()
+        print(sorted(data_plugins.available_plugins()))
+        """
+    )
+    env = dict(os.environ, PYDM_DATA_PLUGINS_PATH=str(tmp_path), QT_QPA_PLATFORM="offscreen")
+    env.pop("PYDM_DATA_PLUGINS_MANIFEST", None)
+    output = subprocess.run(
+        [sys.executable, "-c", script], env=env, stdout=subprocess.PIPE, check=True, timeout=120
+    ).stdout.decode()
+    registered, available = output.strip().splitlines()[-2:]
+    assert "'declared'" in registered and "undeclared" not in registered
+    # No plugin module was imported, neither from PyDM nor from the path
+    assert registered.endswith(" []")
+    assert "'declared'" in available and "'undeclared'" in available
+
+
+def test_new_pydm_process_uses_fork_server(qapp, monkeypatch):
+    launched = []
+    started = []
+
+    class FakeForkServer:
+        pid = 1234
+
+        def launch(self, argv):
+            launched.append(argv)
+            return self.pid
+
+    monkeypatch.setattr(subprocess, "Popen", lambda args, shell: started.append(args))
+    monkeypatch.setattr(qapp, "fork_server", FakeForkServer(), raising=False)
+    qapp.new_pydm_process("display.ui")
+    assert len(launched) == 1 and not started
+    assert "--fork-server" in launched[0]
+    assert launched[0][-1].endswith("display.ui")
+
+    # Fall back on a new process when the server is unavailable
+    FakeForkServer.pid = None
+    qapp.new_pydm_process("display.ui")
+    assert len(started) == 1
@@ -0,0 +1,70 @@
+import json
+import os
+
+import pytest
+
+from pydm.display import ScreenTarget, load_file
+from pydm.utilities import load_profiler
+
+test_data = os.path.join(os.path.dirname(__file__), "..", "test_data")
+
+
+@pytest.fixture
+def profiler():
+    load_profiler.reset()
+    load_profiler.enable()
+    yield load_profiler.profiler
+    load_profiler.disable()
+    load_profiler.reset()
+
+
+def test_load_profiler_disabled():
+    load_profiler.reset()
+    with load_profiler.display("display.ui") as record:
+        with load_profiler.section("exec"):
+            pass
+    assert record is None
+    assert load_profiler.profiler.records == []
+    assert load_profiler.profiler.unattributed.sections == {}
+
+
+def test_load_profiler_sections(profiler):
+    with load_profiler.display("parent.ui") as parent:
+        with load_profiler.section("exec"):
+            pass
+        with load_profiler.section("exec"):
+            pass
+        with load_profiler.display("child.ui") as child:
+            with load_profiler.section("setupUi"):
+                pass
+    with load_profiler.section("channel connection"):
+        pass
+
+    assert profiler.records == [parent]
+    assert parent.children == [child]
+    assert parent.sections["exec"][0] == 2
+    assert list(child.sections) == ["setupUi"]
+    assert parent.duration >= child.duration
+    assert profiler.unattributed.sections["channel connection"][0] == 1
+
+    data = json.loads(load_profiler.to_json())
+    assert data["displays"][0]["file"] == "parent.ui"
+    assert data["displays"][0]["children"][0]["sections"]["setupUi"]["count"] == 1
+    assert "child.ui" in load_profiler.report()
+
+
+def test_load_profiler_display(qtbot, profiler):
+    display = load_file(os.path.join(test_data, "template.ui"), macros={"A": "1"}, target=ScreenTarget.HOME)
+    qtbot.addWidget(display)
+
+    (record,) = profiler.records
+    assert record.file_path.endswith("template.ui")
+    for section in ("ui compile", "macro expansion", "exec", "setupUi"):
+        assert record.sections[section][0] == 1
+    assert record.widgets["PyDMLabel"][0] == 3
+
+    # Loads done later on behalf of the display are attributed to it
+    with load_profiler.within(display):
+        with load_profiler.display("embedded.ui"):
+            pass
+    assert [child.file_path for child in record.children] == ["embedded.ui"]
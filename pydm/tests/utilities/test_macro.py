@@ -1,8 +1,15 @@
 import os
 import tempfile
 import pytest
+from string import Template
 
-from pydm.utilities.macro import substitute_in_file, parse_macro_string
+from pydm.utilities.macro import (
+    expand_macros,
+    parse_macro_string,
+    replace_macros_in_template,
+    substitute_in_file,
+    tokenize_template,
+)
 
 
 @pytest.mark.parametrize(
@@ -59,3 +66,45 @@ def test_macro_parser(macro_string, expected_dict):
     would ever attempt.
     """
     assert parse_macro_string(macro_string) == expected_dict
+
+
+@pytest.mark.parametrize(
+    "text, macros, expected",
+    [
+        ("${A} $B", {"A": "${B}", "B": "${C}", "C": "Z"}, "Z Z"),
+        ("$$A ${A}", {"A": "X"}, "$A X"),
+        ("echo ${MSG}", {"MSG": "it's \\'ok\\'"}, "echo it\\'s \\'ok\\'"),
+        ("${N} ${FLAG}", {"N": 3, "FLAG": "${N}"}, "3 3"),
+        ("$ ${undefined} ${A}", {"A": "${undefined}"}, "$ ${undefined} ${undefined}"),
+        # Macro names built from other macros
+        ("${DEV_${N}}", {"N": "1", "DEV_1": "MOTOR"}, "MOTOR"),
+        # Values only forming a reference once substituted
+        ("${X}", {"X": "${P}{Q}", "P": "$", "Q": "z"}, "z"),
+    ],
+)
+def test_replace_macros_nested(text, macros, expected):
+    assert replace_macros_in_template(text, macros).getvalue() == expected
+
+
+def test_expand_macros_nested():
+    assert expand_macros("${DEV_${N}}", {"N": "1", "DEV_1": "MOTOR"}) == "MOTOR"
+    assert expand_macros("${X}", {"X": "${P}{Q}", "P": "$", "Q": "z"}) == "z"
+    assert expand_macros("$$DEV_${N}", {"N": "1", "DEV_1": "MOTOR"}) == "$DEV_1"
+
+
+def test_replace_macros_cycle(caplog):
+    """Macros referencing themselves are left untouched instead of looping."""
+    text = "${A} ${B} ${SELF}"
+    macros = {"A": "a${B}", "B": "b${A}", "SELF": "${SELF}"}
+    result = replace_macros_in_template(Template(text), macros).getvalue()
+    assert result == "ab${A} b${A} ${SELF}"
+    assert "references itself" in caplog.text
+
+
+def test_template_tokenized_once():
+    text = "first ${A} then ${B}"
+    tokenize_template.cache_clear()
+    replace_macros_in_template(text, {"A": "1"})
+    replace_macros_in_template(text, {"A": "2", "B": "3"})
+    info = tokenize_template.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
@@ -3,9 +3,21 @@ import os
 import platform
 import tempfile
 
+import pytest
 from qtpy import QtWidgets
 
-from pydm.utilities import find_display_in_path, find_file, is_pydm_app, is_qt_designer, log_failures, path_info, which
+from pydm import utilities
+from pydm.utilities import (
+    clear_find_file_cache,
+    file_index,
+    find_display_in_path,
+    find_file,
+    is_pydm_app,
+    is_qt_designer,
+    log_failures,
+    path_info,
+    which,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -120,3 +132,88 @@ def test_log_failure_pass(caplog):
 
     assert result == 5
     assert not caplog.records
+
+
+def _age(*paths):
+    # Move modification times out of the window in which they are not trusted
+    for path in paths:
+        os.utime(path, (0, 1))
+
+
+def test_find_file_cached(monkeypatch):
+    clear_find_file_cache()
+    direc = tempfile.mkdtemp()
+    file_path = os.path.join(direc, "display.ui")
+    open(file_path, "w").close()
+    _age(direc)
+    monkeypatch.chdir(direc)
+    monkeypatch.delenv("PYDM_DISPLAYS_PATH", raising=False)
+
+    calls = []
+    original_which = utilities.which
+
+    def counting_which(*args, **kwargs):
+        calls.append(args[0])
+        return original_which(*args, **kwargs)
+
+    monkeypatch.setattr(utilities, "which", counting_which)
+    assert find_file("display.ui", base_path=direc) == file_path
+    probes = len(calls)
+    assert probes > 0
+    assert find_file("display.ui", base_path=direc) == file_path
+    assert len(calls) == probes
+
+    # A change to the searched directory invalidates the cached result
+    os.remove(file_path)
+    assert find_file("display.ui", base_path=direc) is None
+    assert len(calls) > probes
+
+
+def test_find_file_recursive_index():
+    clear_find_file_cache()
+    parent = tempfile.mkdtemp()
+    near = tempfile.mkdtemp(dir=parent)
+    far = tempfile.mkdtemp(dir=near)
+    far_file = os.path.join(far, "display.ui")
+    open(far_file, "w").close()
+
+    # The first lookups scan the tree, stopping at the first match, and build the index on the way
+    assert find_file("display.ui", base_path=parent, subdir_scan_enabled=True) == far_file
+    index = file_index.get_index(os.path.abspath(parent))
+    assert not index.complete
+    assert find_file("missing.ui", base_path=parent, subdir_scan_enabled=True) is None
+    assert index.complete
+    assert [entry[2] for entry in index.lookup("display.ui")] == [far_file]
+    assert find_file("display.ui", base_path=parent, subdir_scan_enabled=True) == far_file
+
+    # Closer files are preferred, and new files are found without waiting for a refresh
+    near_file = os.path.join(near, "display.py")
+    open(near_file, "w").close()
+    assert find_file("display.ui", base_path=parent, subdir_scan_enabled=True) == far_file
+    near_file = os.path.join(near, "display.ui")
+    open(near_file, "w").close()
+    index.refresh(force=True)
+    assert find_file("display.ui", base_path=parent, subdir_scan_enabled=True) == near_file
+
+    assert find_file("missing.ui", base_path=parent, subdir_scan_enabled=True) is None
+    with pytest.raises(FileNotFoundError):
+        find_file("missing.ui", base_path=parent, raise_if_not_found=True, subdir_scan_enabled=True)
+
+
+def test_find_file_recursive_scan_stops_at_first_match(monkeypatch):
+    clear_find_file_cache()
+    parent = tempfile.mkdtemp()
+    near_file = os.path.join(tempfile.mkdtemp(dir=parent), "display.ui")
+    open(near_file, "w").close()
+    deep = parent
+    for _ in range(5):
+        deep = tempfile.mkdtemp(dir=deep)
+
+    listed = []
+    list_directory = file_index.FileIndex._list
+    monkeypatch.setattr(
+        file_index.FileIndex, "_list", staticmethod(lambda path: listed.append(path) or list_directory(path))
+    )
+    assert find_file("display.ui", base_path=parent, subdir_scan_enabled=True) == near_file
+    # The file is found next to the directories of the first level, which are not listed
+    assert listed == [parent]
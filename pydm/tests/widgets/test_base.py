@@ -9,7 +9,9 @@ from qtpy.QtGui import QClipboard, QColor, QMouseEvent
 from pydm.tests.conftest import ConnectionSignals
 from pydm.utilities import is_pydm_app
 from pydm import data_plugins
-from pydm.widgets.base import AlarmLimit, is_channel_valid, PyDMWidget
+from pydm.display import Display
+from pydm.widgets import base
+from pydm.widgets.base import AlarmLimit, AlarmStyleScheduler, is_channel_valid, PyDMWidget
 from pydm.widgets import (
     PyDMChannel,
     PyDMLineEdit,
@@ -838,3 +840,72 @@ def test_pydmwidget_opacity(qtbot):
     assert widget.opacity() == 1
     widget.set_opacity(-1)
     assert widget.opacity() == 0
+
+
+def test_alarm_restyle_coalesced(qtbot, monkeypatch):
+    """
+    Verify that repeated alarm severity changes within one event loop iteration only repolish the widget
+    itself, once right away and once more with the final severity when the queued restyles are flushed.
+    """
+    pydm_label = PyDMLabel(init_channel="CA://MA_TEST")
+    qtbot.addWidget(pydm_label)
+    AlarmStyleScheduler.flush()
+
+    repolished = []
+    monkeypatch.setattr(base, "repolish", lambda widget, children=(): repolished.append(widget._alarm_state))
+
+    pydm_label.alarm_severity_changed(PyDMWidget.ALARM_MINOR)
+    pydm_label.alarm_severity_changed(PyDMWidget.ALARM_MAJOR)
+    pydm_label.alarm_severity_changed(PyDMWidget.ALARM_INVALID)
+    assert repolished == [PyDMWidget.ALARM_MINOR]
+
+    AlarmStyleScheduler.flush()
+    assert repolished == [PyDMWidget.ALARM_MINOR, PyDMWidget.ALARM_INVALID]
+
+    # Flapping back to the severity that is already styled costs nothing once flushed
+    pydm_label.alarm_severity_changed(PyDMWidget.ALARM_MAJOR)
+    pydm_label.alarm_severity_changed(PyDMWidget.ALARM_INVALID)
+    pydm_label.alarm_severity_changed(PyDMWidget.ALARM_MAJOR)
+    AlarmStyleScheduler.flush()
+    assert repolished == [PyDMWidget.ALARM_MINOR, PyDMWidget.ALARM_INVALID, PyDMWidget.ALARM_MAJOR]
+
+
+def test_hidden_updates_suspended(qtbot, monkeypatch):
+    """
+    Verify that hidden widgets only keep the latest value and alarm severity when suspending hidden updates, and
+    apply them once shown again.
+    """
+    display = Display()
+    qtbot.addWidget(display)
+    pydm_label = PyDMLabel(display, init_channel="CA://MA_TEST")
+    display.show()
+    pydm_label.channelValueChanged("first")
+    assert pydm_label.text() == "first"
+
+    pydm_label.hide()
+    pydm_label.channelValueChanged("second")
+    assert pydm_label.text() == "second"
+
+    display.suspend_hidden_updates = True
+    pydm_label.show()
+    pydm_label.hide()
+    changes = []
+    monkeypatch.setattr(pydm_label, "value_changed", changes.append)
+    monkeypatch.setattr(base, "repolish", lambda widget, children=(): changes.append(widget._alarm_state))
+    pydm_label.channelValueChanged("third")
+    pydm_label.channelValueChanged("fourth")
+    pydm_label.alarm_severity_changed(PyDMWidget.ALARM_MAJOR)
+    assert changes == []
+
+    pydm_label.show()
+    AlarmStyleScheduler.flush()
+    assert changes == ["fourth", PyDMWidget.ALARM_MAJOR]
+
+    # Widgets outside of such displays can be suspended globally
+    monkeypatch.setattr(base.config, "SUSPEND_HIDDEN_UPDATES", True)
+    other_label = PyDMLabel(init_channel="CA://MA_TEST")
+    qtbot.addWidget(other_label)
+    other_label.channelValueChanged("held")
+    assert other_label.text() == "CA://MA_TEST"
+    other_label.show()
+    assert other_label.text() == "held"
@@ -9,7 +9,7 @@ from qtpy.QtWidgets import QApplication
 from qtpy.QtCore import Qt, QSize
 from qtpy.QtDesigner import QDesignerFormWindowInterface
 
-from pydm.widgets.base import PyDMWidget
+from pydm.widgets.base import PyDMWidget, AlarmStyleScheduler
 from pydm.widgets.drawing import (
     deg_to_qt,
     qt_to_deg,
@@ -171,9 +171,12 @@ def test_pydmdrawing_paintEvent(qtbot, signals, alarm_sensitive_content):
     pydm_drawing = PyDMDrawing(parent=main_window, init_channel="fake://tst")
     qtbot.addWidget(pydm_drawing)
     pydm_drawing.alarmSensitiveContent = alarm_sensitive_content
+    # Apply any alarm restyles still coalesced for the next event loop iteration
+    AlarmStyleScheduler.flush()
     brush_before = pydm_drawing.brush.color().name()
     signals.new_severity_signal.connect(pydm_drawing.alarmSeverityChanged)
     signals.new_severity_signal.emit(PyDMWidget.ALARM_MAJOR)
+    AlarmStyleScheduler.flush()
 
     brush_after = pydm_drawing.brush.color().name()
     if alarm_sensitive_content:
@@ -1,11 +1,17 @@
+import json
 import os
 import pytest
 import sys
 from qtpy.QtWidgets import QApplication
+from pydm import data_plugins
+from pydm.display import load_file, ScreenTarget
+from pydm.widgets import PyDMEmbeddedDisplay
+from pydm.widgets.embedded_display import _display_cache
 
 test_ui_path_with_relative_path = os.path.join(
     os.path.dirname(os.path.realpath(__file__)), "../test_data", "test_relative_filename_parent.ui"
 )
+test_template_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "../test_data", "virtual_template.ui")
 
 
 def test_show_with_relative_filename(qtbot):
@@ -47,3 +53,50 @@ def test_show_with_relative_filename_and_symlink(qtbot, tmp_path):
         assert display.embedded_widget is not None
 
     qtbot.waitUntil(check_embed)
+
+
+def test_display_cache(qtbot):
+    embedded = PyDMEmbeddedDisplay()
+    qtbot.addWidget(embedded)
+    embedded.loadWhenShown = False
+    embedded.cacheSize = 1
+    embedded.set_macros_and_filename(test_template_path, json.dumps({"NAME": "cache_a", "VALUE": 1}))
+    first = embedded.embedded_widget
+    assert first is not None
+    local_plugin = data_plugins.plugin_for_address("loc://")
+    assert "virtual_cache_a" in local_plugin.connections
+
+    # Switching away keeps the display, disconnected unless configured otherwise
+    embedded.macros = json.dumps({"NAME": "cache_b", "VALUE": 2})
+    second = embedded.embedded_widget
+    assert second is not first
+    assert "virtual_cache_a" not in local_plugin.connections
+
+    # Switching back shows the same display again, connected
+    embedded.macros = json.dumps({"NAME": "cache_a", "VALUE": 1})
+    assert embedded.embedded_widget is first
+    assert "virtual_cache_a" in local_plugin.connections
+
+    embedded.keepCachedConnected = True
+    with qtbot.waitSignal(second.destroyed):
+        # Only the most recently shown display is kept
+        embedded.macros = json.dumps({"NAME": "cache_c", "VALUE": 3})
+    assert "virtual_cache_a" in local_plugin.connections
+    embedded.macros = json.dumps({"NAME": "cache_a", "VALUE": 1})
+    assert embedded.embedded_widget is first
+
+
+def test_display_cache_evicted_with_owner(qtbot):
+    # The parent display loaded from a .ui file keeps the embedded display as an attribute
+    parent = load_file(test_ui_path_with_relative_path, target=ScreenTarget.HOME)
+    embedded = parent.embeddedDisplay
+    embedded.loadWhenShown = False
+    embedded.cacheSize = 1
+    embedded.set_macros_and_filename(test_template_path, json.dumps({"NAME": "orphan_a", "VALUE": 1}))
+    cached = embedded.embedded_widget
+    embedded.macros = json.dumps({"NAME": "orphan_b", "VALUE": 2})
+    assert any(entry[0] is cached for entry in _display_cache._entries.values())
+
+    with qtbot.waitSignal(cached.destroyed):
+        parent.deleteLater()
+    assert not any(entry[3]() is embedded for entry in _display_cache._entries.values())
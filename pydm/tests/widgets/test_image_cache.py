@@ -0,0 +1,145 @@
+import os
+import json
+import shutil
+
+import pytest
+
+from qtpy.QtCore import Qt, QSize
+from qtpy.QtGui import QPixmap
+from qtpy.QtSvg import QSvgRenderer
+
+from pydm.widgets.image_cache import ImageCache, image_cache
+from pydm.widgets.symbol import PyDMSymbol
+from pydm.widgets.drawing import PyDMDrawingImage
+
+examples_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", "examples")
+svg_file = os.path.abspath(os.path.join(examples_path, "symbol", "go.svg"))
+jpeg_file = os.path.abspath(os.path.join(examples_path, "drawing", "SLAC_logo.jpeg"))
+
+
+def test_image_cache_shares_decoded_images(qapp):
+    """
+    Loading the same file twice returns the same decoded object and does not
+    read the file again.
+    """
+    cache = ImageCache()
+    svg = cache.load(svg_file)
+    assert isinstance(svg, QSvgRenderer)
+    assert cache.load(svg_file) is svg
+
+    pixmap = cache.load(jpeg_file)
+    assert isinstance(pixmap, QPixmap)
+    assert cache.load(jpeg_file) is pixmap
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    assert cache.load(None) is None
+    assert cache.load("/no/such/image.png") is None
+
+
+def test_image_cache_invalidates_on_modification(qapp, tmp_path):
+    """
+    A cached image is reloaded once its file changes on disk.
+    """
+    cache = ImageCache()
+    path = str(tmp_path / "image.svg")
+    shutil.copy(svg_file, path)
+    first = cache.load(path)
+    assert cache.load(path) is first
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+    second = cache.load(path)
+    assert second is not first
+    assert isinstance(second, QSvgRenderer)
+
+
+def test_image_cache_scaled(qapp):
+    """
+    Rasterizations are cached per image, size and aspect ratio mode.
+    """
+    cache = ImageCache(max_scaled=2)
+    pixmap = cache.load(jpeg_file)
+    scaled = cache.scaled(pixmap, QSize(40, 40))
+    assert max(scaled.width(), scaled.height()) == 40
+    assert cache.scaled(pixmap, (40, 40)) is scaled
+    assert cache.scaled(pixmap, (40, 40), Qt.IgnoreAspectRatio).size() == QSize(40, 40)
+
+    svg = cache.load(svg_file)
+    rendered = cache.scaled(svg, (30, 30))
+    assert not rendered.isNull()
+    assert cache.scaled(svg, (30, 30)) is rendered
+
+    # The least recently used entry was evicted.
+    assert cache.scaled(pixmap, (40, 40)) is not scaled
+
+
+def test_image_cache_scaled_device_pixel_ratio(qapp):
+    """
+    High density rasterizations are made at the device resolution and are
+    cached apart from the standard ones.
+    """
+    cache = ImageCache()
+    svg = cache.load(svg_file)
+    standard = cache.scaled(svg, (30, 30), Qt.IgnoreAspectRatio)
+    dense = cache.scaled(svg, (30, 30), Qt.IgnoreAspectRatio, 2.0)
+    assert dense is not standard
+    assert dense.size() == QSize(60, 60)
+    assert dense.devicePixelRatio() == 2.0
+    assert cache.scaled(svg, (30, 30), Qt.IgnoreAspectRatio, 2.0) is dense
+
+
+def test_symbol_releases_animated_renderers(qtbot, tmp_path):
+    """
+    Changing the files of a symbol stops it from repainting on the animated
+    images it no longer shows.
+    """
+    animated = tmp_path / "spinner.svg"
+    animated.write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">'
+        '<rect width="10" height="10"><animateColor attributeName="fill" from="red" to="blue" dur="1s"'
+        ' repeatCount="indefinite"/></rect></svg>'
+    )
+    symbol = PyDMSymbol()
+    qtbot.addWidget(symbol)
+    symbol.imageFiles = json.dumps({"0": str(animated)})
+    assert len(symbol._animated_renderers) == 1
+    symbol.imageFiles = json.dumps({"0": svg_file})
+    assert symbol._animated_renderers == []
+
+
+def test_symbols_share_images(qtbot):
+    """
+    Symbols using the same files share a single decoded image.
+    """
+    files = json.dumps({"0": svg_file, "1": jpeg_file, "2": svg_file})
+    symbols = []
+    for _ in range(3):
+        symbol = PyDMSymbol()
+        qtbot.addWidget(symbol)
+        symbol.imageFiles = files
+        symbols.append(symbol)
+
+    first = symbols[0]._state_images
+    assert first[0][1] is first[2][1]
+    for symbol in symbols[1:]:
+        assert symbol._state_images[0][1] is first[0][1]
+        assert symbol._state_images[1][1] is first[1][1]
+    assert json.loads(symbols[1].imageFiles) == json.loads(files)
+
+
+def test_drawing_images_share_pixmap(qtbot):
+    """
+    Drawing images of the same file share a single decoded pixmap.
+    """
+    images = [PyDMDrawingImage(filename=jpeg_file) for _ in range(2)]
+    for image in images:
+        qtbot.addWidget(image)
+    assert images[0]._pixmap.cacheKey() == images[1]._pixmap.cacheKey()
+    assert image_cache.load(jpeg_file, svg=False).cacheKey() == images[0]._pixmap.cacheKey()
+
+
+def test_symbol_qt_message_handler_deprecated(qtbot):
+    symbol = PyDMSymbol()
+    qtbot.addWidget(symbol)
+    with pytest.deprecated_call():
+        symbol.qt_message_handler(0, None, "message")
@@ -8,7 +8,7 @@ import warnings
 
 from pydm.utilities import is_pydm_app
 from pydm.widgets.label import PyDMLabel
-from pydm.widgets.base import PyDMWidget
+from pydm.widgets.base import PyDMWidget, AlarmStyleScheduler
 from pydm.widgets.display_format import parse_value_for_display, DisplayFormat
 from pydm.utilities import checkObjectProperties
 
@@ -270,6 +270,60 @@ def test_show_units(qtbot, signals, value, display_format, unit_name, expected):
     assert pydm_label.displayFormat == display_format
 
 
+def test_format_string_cached(qtbot, monkeypatch):
+    """
+    Verify the format string is only rebuilt when its inputs change, and that setText is skipped when the
+    formatted text is already displayed.
+    """
+    pydm_label = PyDMLabel()
+    qtbot.addWidget(pydm_label)
+    pydm_label.value_changed(1.0)
+    format_string = pydm_label.format_string
+
+    set_text_calls = []
+    original_set_text = pydm_label.setText
+    monkeypatch.setattr(pydm_label, "setText", lambda text: set_text_calls.append(text) or original_set_text(text))
+
+    pydm_label.value_changed(2.0)
+    assert pydm_label.format_string is format_string
+    assert set_text_calls == ["2"]
+
+    # Same text once formatted with a precision of 0, no call to setText
+    pydm_label.value_changed(2.2)
+    assert set_text_calls == ["2"]
+
+    # A change in units rebuilds the format string
+    pydm_label.showUnits = True
+    pydm_label.unit_changed("mm")
+    assert pydm_label.format_string == "{:.0f} mm"
+    assert pydm_label.text() == "2 mm"
+
+    # A format string built by a subclass is still honored
+    class BracketLabel(PyDMLabel):
+        def update_format_string(self):
+            self.format_string = "<{}>"
+            return self.format_string
+
+    bracket_label = BracketLabel()
+    qtbot.addWidget(bracket_label)
+    bracket_label.value_changed(3)
+    assert bracket_label.text() == "<3>"
+
+
+def test_metadata_changed(qtbot):
+    """
+    Verify that control variables received at once are applied to the label as separate updates would be.
+    """
+    pydm_label = PyDMLabel()
+    qtbot.addWidget(pydm_label)
+    pydm_label.channel = "loc://test_label_metadata?type=float&init=1.5"
+    pydm_label.showUnits = True
+    pydm_label.metadataChanged({"units": "mm", "precision": 2, "severity": PyDMWidget.ALARM_MINOR})
+    pydm_label.value_changed(1.5)
+    assert pydm_label.text() == "1.50 mm"
+    assert pydm_label._alarm_state == PyDMWidget.ALARM_MINOR
+
+
 @pytest.mark.parametrize(
     "alarm_severity, alarm_sensitive_content, alarm_sensitive_border",
     [
@@ -335,10 +389,13 @@ def test_label_alarms(qtbot, signals, alarm_severity, alarm_sensitive_content, a
 
     signals.new_severity_signal.connect(pydm_label.alarmSeverityChanged)
     initial_severity = pydm_label._alarm_state
+    # Apply any alarm restyles still coalesced for the next event loop iteration
+    AlarmStyleScheduler.flush()
     option = QStyleOption()
     option.initFrom(pydm_label)
     before_color = option.palette.text().color().name()
     signals.new_severity_signal.emit(alarm_severity)
+    AlarmStyleScheduler.flush()
 
     assert pydm_label._alarm_state == alarm_severity
     option = QStyleOption()
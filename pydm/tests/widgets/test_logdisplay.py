@@ -25,21 +25,25 @@ def test_write(qtbot, log):
     # Watch our error message show up in the log
     err_msg = "This is a test of the emergency broadcast system"
     log.error(err_msg)
+    logd.handler.flush()
     assert err_msg in logd.text.toPlainText()
     # Debug shouldn't show up
     debug_msg = "Pay no attention to the man behind the curtain"
     log.debug(debug_msg)
+    logd.handler.flush()
     assert debug_msg not in logd.text.toPlainText()
     # Change the level so debug does show up
     logd.setLevel("DEBUG")
     assert logd.handler.level == logging.DEBUG
     assert logd.log.level <= logging.DEBUG
     log.debug(debug_msg)
+    logd.handler.flush()
     assert debug_msg in logd.text.toPlainText()
     # Change the name and make sure we still see what we need
     logd.logname = "log_test"
     info_msg = "The more things change the more they stay the same"
     log.info(info_msg)
+    logd.handler.flush()
     assert info_msg in logd.text.toPlainText()
     logd.clear()
     assert logd.text.toPlainText() == ""
@@ -48,6 +52,44 @@ def test_write(qtbot, log):
     # maybe since the logger is associated with the previous logd instance when it gets deleted?
 
 
+def test_batched_write(qtbot):
+    log = logging.getLogger("log_test.batched")
+    logd = PyDMLogDisplay(logname=log.name, level=logging.INFO)
+    qtbot.addWidget(logd)
+    logd.bufferSize = 5
+    logd.maxLines = 4
+    assert logd.bufferSize == 5
+    assert logd.maxLines == 4
+
+    batches = []
+    logd.handler.messages.connect(batches.append)
+    for i in range(8):
+        log.info("message %d", i)
+    # Nothing is written until the buffer is flushed
+    assert logd.text.toPlainText() == ""
+
+    # The messages arrive at the display in a single batch, with a report of the dropped ones
+    qtbot.waitUntil(lambda: len(batches) == 1)
+    assert len(batches[0]) == 6
+    assert "3 log messages dropped" in batches[0][0]
+    assert logd.handler.dropped == 3
+
+    # Only the newest lines are kept in the display
+    lines = logd.text.toPlainText().split("\n")
+    assert len(lines) == 4
+    assert lines[-1].endswith("message 7")
+    log.removeHandler(logd.handler)
+
+
+def test_unbuffered_write(qtbot, log):
+    logd = PyDMLogDisplay(logname=log.name, level=logging.INFO)
+    qtbot.addWidget(logd)
+    logd.bufferSize = 0
+    log.warning("Written right away")
+    assert "Written right away" in logd.text.toPlainText()
+    log.removeHandler(logd.handler)
+
+
 def test_handler_cleanup(qtbot, log):
     logd = PyDMLogDisplay(logname=log.name, level=logging.DEBUG)
     qtbot.addWidget(logd)
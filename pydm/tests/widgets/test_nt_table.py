@@ -0,0 +1,74 @@
+import numpy as np
+from qtpy.QtCore import Qt
+
+from pydm.widgets.nt_table import ColumnarTableModel, PyDMNTTable
+
+
+def test_value_changed_columns(qtbot):
+    """Verify NTTable data is served straight from its columns"""
+    table = PyDMNTTable()
+    qtbot.addWidget(table)
+    table.value_changed({"labels": ["Name", "Value"], "name": ["a", "b", "c"], "value": np.array([1.5, 2.5, 3.5])})
+
+    model = table._model
+    assert isinstance(model, ColumnarTableModel)
+    assert model.rowCount() == 3
+    assert model.columnCount() == 2
+    assert model.headerData(1, Qt.Horizontal) == "Value"
+    assert model.data(model.index(1, 0)) == "b"
+    assert model.data(model.index(2, 1)) == "3.5"
+
+
+def test_update_emits_changed_cells_only(qtbot):
+    """Verify an update with the same shape only emits dataChanged for the changed cells"""
+    model = ColumnarTableModel(["x", "y"], columns=[np.arange(10), np.zeros(10)])
+    changed_ranges = []
+    model.dataChanged.connect(
+        lambda top_left, bottom_right: changed_ranges.append(
+            (top_left.row(), bottom_right.row(), top_left.column(), bottom_right.column())
+        )
+    )
+
+    new_y = np.zeros(10)
+    new_y[[3, 4, 8]] = 1.0
+    model.set_columns([np.arange(10), new_y])
+    assert changed_ranges == [(3, 4, 1, 1), (8, 8, 1, 1)]
+
+    changed_ranges.clear()
+    model.set_columns([np.arange(10), new_y.copy()])
+    assert changed_ranges == []
+
+
+def test_sort_uses_permutation(qtbot):
+    """Verify sorting serves rows through a permutation that follows later updates"""
+    model = ColumnarTableModel(["key", "value"], columns=[np.array([3, 1, 2]), np.array([30.0, 10.0, 20.0])])
+
+    # Matches PythonTableModel, where Qt's ascending order shows the largest values first
+    model.sort(0, Qt.DescendingOrder)
+    assert [model.data(model.index(row, 1)) for row in range(3)] == ["10.0", "20.0", "30.0"]
+    assert model.source_row(0) == 1
+
+    changed_rows = []
+    model.dataChanged.connect(lambda top_left, bottom_right: changed_rows.append(top_left.row()))
+    model.set_columns([np.array([3, 1, 2]), np.array([30.0, 10.0, 25.0])])
+    # Source row 2 is shown at view row 1
+    assert changed_rows == [1]
+    assert model.data(model.index(1, 1)) == "25.0"
+
+    # Changing the sort column reorders the rows
+    model.set_columns([np.array([0, 1, 2]), np.array([30.0, 10.0, 25.0])])
+    assert [model.data(model.index(row, 0)) for row in range(3)] == ["0", "1", "2"]
+
+
+def test_edit_maps_to_source_row(qtbot):
+    """Verify edits on a sorted model are passed the row of the underlying data"""
+    edits = []
+
+    def edit_method(parent, row, column, value):
+        edits.append((row, column, value))
+        return True
+
+    model = ColumnarTableModel(["key"], columns=[np.array([5, 9, 7])], edit_method=edit_method)
+    model.sort(0, Qt.AscendingOrder)
+    assert model.setData(model.index(0, 0), "1")
+    assert edits == [(1, 0, "1")]
@@ -4,6 +4,7 @@ import sys
 import warnings
 from qtpy.QtCore import Qt, QSize
 from qtpy.QtWidgets import QApplication
+from pydm import config, display
 from pydm.utilities.stylesheet import global_style
 from pydm.widgets.related_display_button import PyDMRelatedDisplayButton
 from pydm.utilities import IconFont, checkObjectProperties
@@ -254,3 +255,41 @@ def test_no_pydm_app_stylesheet(monkeypatch, qtbot):
     assert original_style in display4.styleSheet()
     # And we need to add the global stylesheet too
     assert global_style() in display4.styleSheet()
+
+
+def test_prefetch_displays(qtbot, monkeypatch):
+    monkeypatch.setattr(config, "PREFETCH_WORKERS", 1)
+    display.clear_compiled_ui_file_cache()
+    QApplication.instance().make_main_window()
+    main_window = QApplication.instance().main_window
+    qtbot.addWidget(main_window)
+    button = PyDMRelatedDisplayButton(parent=main_window)
+    button.filenames = [test_ui_path]
+    button.macros = ['{"FOO": "1"}']
+    qtbot.addWidget(button)
+
+    # Showing the button prepares its display in the background
+    button.show()
+    qtbot.waitUntil(lambda: display._compile_expanded_ui.cache_info().currsize == 1)
+    qtbot.waitUntil(lambda: not display._prefetch_pending)
+    # Nothing is done once it is prepared
+    assert display.prefetch_ui_file(test_ui_path, "", {"FOO": "1"}) is None
+
+    hits = display._compile_expanded_ui.cache_info().hits
+    qtbot.mouseRelease(button, Qt.LeftButton)
+    assert display._compile_expanded_ui.cache_info().hits == hits + 1
+    assert main_window.display_widget().macros() == {"FOO": "1"}
+
+
+def test_prefetch_displays_skips_new_process(qtbot, monkeypatch):
+    monkeypatch.setattr(config, "PREFETCH_WORKERS", 1)
+    display.clear_compiled_ui_file_cache()
+    button = PyDMRelatedDisplayButton()
+    button.filenames = [test_ui_path]
+    button.openInNewWindow = True
+    qtbot.addWidget(button)
+
+    # The display is opened by another process, preparing it here is wasted
+    button.show()
+    assert not display._prefetch_pending
+    assert display._compile_expanded_ui.cache_info().currsize == 0
@@ -376,6 +376,41 @@ def test_internal_slider_value_changed(qtbot, signals, new_value, mute_change):
         assert signals.value is None
 
 
+def test_max_write_rate(qtbot):
+    """
+    Test that the values of a dragged slider are written at most maxWriteRate times per second.
+
+    Expectations:
+    The first value is written right away, the values changed faster than the rate are dropped but the last one,
+    which is written once the interval is over, or right away when the slider is released.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        pytest-qt window for widget test
+    """
+    pydm_slider = PyDMSlider()
+    qtbot.addWidget(pydm_slider)
+
+    pydm_slider.userDefinedLimits = True
+    pydm_slider.userMinimum = 0
+    pydm_slider.userMaximum = 100
+    pydm_slider.maxWriteRate = 10
+    written = []
+    pydm_slider.send_value_signal[float].connect(written.append)
+
+    for position in range(20):
+        pydm_slider.internal_slider_value_changed(position)
+    assert len(written) == 1
+    qtbot.waitUntil(lambda: len(written) == 2)
+    assert written[-1] == pydm_slider.value
+
+    pydm_slider.internal_slider_value_changed(5)
+    pydm_slider.internal_slider_released()
+    assert len(written) == 3
+    assert written[-1] == pydm_slider.value
+
+
 @pytest.mark.parametrize(
     "show_labels, orientation, tick_position",
     [
@@ -466,3 +466,33 @@ def test_write_on_press(
     # check that changing the exponent does not modify
     press_key_and_verify(Qt.Key_Left, Qt.ControlModifier, initial_spinbox_value, write_on_press)
     press_key_and_verify(Qt.Key_Right, Qt.ControlModifier, initial_spinbox_value, write_on_press)
+
+
+def test_max_write_rate(qtbot):
+    """
+    Test that the values of a continuously stepped spinbox are written at most maxWriteRate times per second.
+
+    Expectations:
+    The first value is written right away, the values changed faster than the rate are dropped but the last one,
+    which is written once the interval is over.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        Window for widget testing
+    """
+    pydm_spinbox = PyDMSpinbox()
+    qtbot.addWidget(pydm_spinbox)
+    pydm_spinbox.userDefinedLimits = True
+    pydm_spinbox.userMinimum = 0
+    pydm_spinbox.userMaximum = 100
+    pydm_spinbox.maxWriteRate = 10
+    written = []
+    pydm_spinbox.send_value_signal[float].connect(written.append)
+
+    for value in range(1, 20):
+        pydm_spinbox.setValue(value)
+        pydm_spinbox.send_value()
+    assert written == [1]
+    qtbot.waitUntil(lambda: len(written) == 2)
+    assert written[-1] == 19
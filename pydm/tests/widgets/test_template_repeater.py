@@ -1,7 +1,9 @@
 import os
-from pydm.widgets import PyDMSlider, PyDMTemplateRepeater
+from qtpy.QtWidgets import QLabel, QScrollArea
+from pydm.widgets import PyDMLabel, PyDMSlider, PyDMTemplateRepeater
 
 test_template_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "../test_data", "template.ui")
+virtual_template_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "../test_data", "virtual_template.ui")
 
 
 def test_template_file(qtbot):
@@ -16,3 +18,35 @@ def test_template_file(qtbot):
     slider = template_repeater.findChild(PyDMSlider, "bCtrlSlider")
     assert slider is not None
     assert slider.channel == "ca://{}:BCTRL".format(test_data[0]["devname"])
+
+
+def test_virtualized(qtbot):
+    # Test that only the instances in view are created, and reused while scrolling.
+    scroll_area = QScrollArea()
+    qtbot.addWidget(scroll_area)
+    scroll_area.setWidgetResizable(True)
+    scroll_area.resize(300, 200)
+    template_repeater = PyDMTemplateRepeater()
+    template_repeater.virtualized = True
+    scroll_area.setWidget(template_repeater)
+    template_repeater.templateFilename = virtual_template_path
+    test_data = [{"NAME": "item{}".format(i), "VALUE": i} for i in range(1000)]
+    template_repeater.data = test_data
+    scroll_area.show()
+    qtbot.waitUntil(lambda: template_repeater.count() > 1)
+
+    count = template_repeater.count()
+    assert count < 50
+    assert template_repeater.height() > 1000 * 20
+    labels = template_repeater.findChildren(PyDMLabel, "valueLabel")
+    assert sorted(label.value for label in labels) == list(range(count))
+
+    scroll_area.verticalScrollBar().setValue(scroll_area.verticalScrollBar().maximum())
+    qtbot.waitUntil(lambda: template_repeater.findChild(QLabel, "nameLabel").text() != "item0")
+    qtbot.waitUntil(lambda: any(label.text() == "item999" for label in template_repeater.findChildren(QLabel)))
+    assert template_repeater.count() <= count
+    # Instances are reused for the items scrolled into view
+    assert set(template_repeater.findChildren(PyDMLabel, "valueLabel")) <= set(labels)
+    last = [label for label in labels if label.channel == "loc://virtual_item999?type=int&init=999"]
+    assert len(last) == 1
+    qtbot.waitUntil(lambda: last[0].value == 999)
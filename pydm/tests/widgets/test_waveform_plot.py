@@ -223,3 +223,57 @@ def test_redrawPlot_with_crosshair():
 
     # Verify that the crosshair_position_updated signal was emitted with the scene position.
     widget.crosshair_position_updated.emit.assert_called_once_with(dummy_scene_pos.x(), dummy_scene_pos.y())
+
+
+def test_redrawPlot_skips_unchanged_curves(qtbot):
+    """Verify that only curves which received new data are redrawn, and that frame statistics track this"""
+    widget = PyDMWaveformPlot()
+    qtbot.addWidget(widget)
+    curve_1 = WaveformCurveItem()
+    curve_2 = WaveformCurveItem()
+    widget.addCurve(curve_1)
+    widget.addCurve(curve_2)
+
+    curve_1.receiveYWaveform(np.array([1, 2, 3], dtype=float))
+    curve_2.receiveYWaveform(np.array([4, 5, 6], dtype=float))
+    widget.set_needs_redraw()
+    widget.redrawPlot()
+    assert not curve_1.needs_redraw
+    assert not curve_2.needs_redraw
+    assert widget.frameStatistics()["last_updated"] == 2
+
+    # Only the first curve gets new data, so the second one should be left alone
+    curve_1.receiveYWaveform(np.array([7, 8, 9], dtype=float))
+    assert curve_1.needs_redraw
+    widget.set_needs_redraw()
+    with mock.patch.object(curve_2, "redrawCurve") as mocked_redraw:
+        widget.redrawPlot()
+        mocked_redraw.assert_not_called()
+
+    stats = widget.frameStatistics()
+    assert stats["frames"] == 2
+    assert stats["last_updated"] == 1
+    assert stats["last_skipped"] == 1
+    assert stats["total_updated"] == 3
+    assert stats["total_skipped"] == 1
+
+    widget.resetFrameStatistics()
+    assert widget.frameStatistics()["frames"] == 0
+
+
+def test_receive_waveform_rejects_all_inf(qtbot):
+    """Verify waveforms made up entirely of infinite values are ignored, while partial infs are accepted"""
+    curve = WaveformCurveItem()
+
+    curve.receiveYWaveform(np.array([np.inf, np.inf, -np.inf]))
+    assert curve.latest_y is None
+
+    curve.receiveYWaveform(np.array([], dtype=float))
+    assert curve.latest_y is None
+
+    curve.receiveYWaveform(np.array([np.inf, 1.0]))
+    assert np.array_equal(curve.latest_y, np.array([np.inf, 1.0]))
+
+    curve.receiveYWaveform(np.array([1, 2, 3], dtype=int))
+    assert np.array_equal(curve.latest_y, np.array([1, 2, 3]))
+    assert curve.generation == 2
@@ -0,0 +1,76 @@
+import numpy as np
+from qtpy.QtCore import Qt
+
+from pydm.widgets.waveformtable import PyDMWaveformTable
+
+
+def test_value_changed_layout(qtbot):
+    """Verify a waveform is laid out over the configured number of columns, with lazily formatted cells"""
+    table = PyDMWaveformTable()
+    qtbot.addWidget(table)
+    table.setColumnCount(3)
+
+    table.value_changed(np.arange(7, dtype=float))
+    model = table.model()
+
+    assert table.rowCount() == 3
+    assert table.columnCount() == 3
+    assert model.data(model.index(1, 2)) == "5.0"
+    assert model.data(model.index(2, 0)) == "6.0"
+    # The last row is only partially filled
+    assert model.data(model.index(2, 1)) is None
+    assert model.flags(model.index(2, 1)) == Qt.NoItemFlags
+
+
+def test_value_changed_emits_changed_rows_only(qtbot):
+    """Verify that an update of the same length only emits dataChanged for the rows that differ"""
+    table = PyDMWaveformTable()
+    qtbot.addWidget(table)
+    table.setColumnCount(2)
+    waveform = np.arange(20, dtype=float)
+    table.value_changed(waveform)
+
+    changed_ranges = []
+    table.model().dataChanged.connect(
+        lambda top_left, bottom_right: changed_ranges.append((top_left.row(), bottom_right.row()))
+    )
+
+    new_waveform = waveform.copy()
+    new_waveform[[2, 3, 5, 15]] = -1
+    table.value_changed(new_waveform)
+    assert changed_ranges == [(1, 2), (7, 7)]
+
+    changed_ranges.clear()
+    table.value_changed(new_waveform.copy())
+    assert changed_ranges == []
+
+
+def test_headers(qtbot):
+    """Verify header labels are served by the model, falling back to section numbers"""
+    table = PyDMWaveformTable()
+    qtbot.addWidget(table)
+    table.setColumnCount(2)
+    table.value_changed(np.zeros(4))
+    model = table.model()
+
+    table.columnHeaderLabels = ["A"]
+    assert model.headerData(0, Qt.Horizontal) == "A"
+    assert model.headerData(1, Qt.Horizontal) == ""
+
+    table.rowHeaderLabels = []
+    assert model.headerData(1, Qt.Vertical) == "2"
+
+
+def test_send_waveform(qtbot, signals):
+    """Verify editing a cell sends the updated waveform"""
+    table = PyDMWaveformTable()
+    qtbot.addWidget(table)
+    table.value_changed(np.array([1.0, 2.0, 3.0]))
+
+    table.send_value_signal[np.ndarray].connect(signals.receiveValue)
+
+    model = table.model()
+    assert model.setData(model.index(1, 0), "10.5")
+    assert np.array_equal(signals.value, np.array([1.0, 10.5, 3.0]))
+    assert model.data(model.index(1, 0)) == "10.5"
+    assert not model.setData(model.index(2, 0), "not a number")
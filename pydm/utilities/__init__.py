@@ -18,7 +18,7 @@ from enum import IntEnum
 
 from qtpy import QtCore, QtGui, QtWidgets
 
-from . import colors, macro, shortcuts
+from . import colors, file_index, load_profiler, macro, shortcuts
 from .connection import close_widget_connections, establish_widget_connections
 from .iconfont import IconFont
 from .remove_protocol import protocol_and_address, remove_protocol, parsed_address
@@ -26,6 +26,8 @@ from .units import convert, find_unit_options, find_unittype
 
 __all__ = [
     "colors",
+    "file_index",
+    "load_profiler",
     "macro",
     "shortcuts",
     "close_widget_connections",
@@ -326,6 +328,7 @@ def _screen_file_extensions(preferred_extension):
     return extensions
 
 
+@load_profiler.timed("find_file")
 def find_file(
     fname,
     base_path=None,
@@ -397,46 +400,157 @@ def find_file(
         x_path[idx] = os.path.expanduser(os.path.expandvars(path))
 
     root, ext = os.path.splitext(fname)
+    extensions = _screen_file_extensions(ext)
+
+    # Look in the search path itself, reusing the result of an identical
+    # lookup as long as none of the searched directories changed since.
+    searched = _searched_directories(x_path)
+    key = (fname, mode, searched)
+    signature = _search_path_signature(root, searched)
+    cached = _find_file_cache.get(key)
+    if signature is not None and cached is not None and cached[0] == signature:
+        file_path = cached[1]
+    else:
+        file_path = _find_in_directories(root, extensions, mode, x_path)
+        if signature is not None:
+            _find_file_cache[key] = (signature, file_path)
 
-    # 3 seconds should be more than generous enough
-    SUBDIR_SCAN_TIME_LIMIT = 3
-    start_time = time.perf_counter()
+    if file_path is None and subdir_scan_enabled:
+        if subdir_scan_base_path_only:
+            roots = [base_path] if base_path else []
+        else:
+            roots = list(x_path)
+        file_path = _find_in_subdirectories(root, extensions, mode, roots)
 
-    file_path = None
-    while file_path is None and len(x_path) > 0:
-        # Loop through the possible screen file extensions
-        for e in _screen_file_extensions(ext):
-            file_path = which(str(root) + str(e), mode=mode, pathext=e, extra_path=x_path)
-            if file_path is not None:
-                break  # pick the first screen file found
+    if file_path is None and raise_if_not_found:
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), fname)
+    return file_path
 
-        if not subdir_scan_enabled or time.perf_counter() - start_time >= SUBDIR_SCAN_TIME_LIMIT:
-            if not file_path and raise_if_not_found:
-                raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), fname)
-            break
 
-        # Only search recursively under base path
-        if subdir_scan_base_path_only:
-            if base_path is None or len(base_path) == 0:
-                break
-            x_path.clear()
-            x_path.append(os.path.expanduser(os.path.expandvars(base_path)))
-            # Prevent entering this block again
-            subdir_scan_base_path_only = False
+# Results of find_file lookups in the search path, keyed on the file name, access
+# mode and search path, with the modification times of the directories searched.
+_find_file_cache = {}
+
 
+def clear_find_file_cache():
+    """
+    Forget every file location remembered by ``find_file``, including the
+    directory indexes used for recursive lookups.
+    """
+    _find_file_cache.clear()
+    file_index.clear()
+
+
+def _searched_directories(x_path):
+    """
+    Every directory ``which`` looks in when called by ``_find_in_directories``,
+    as it searches the ``PATH`` after the given directories.
+    """
+    path = os.environ.get("PATH", os.defpath)
+    directories = list(x_path) + (path.split(os.pathsep) if path else [])
+    if sys.platform == "win32" and os.curdir not in directories:
+        directories.append(os.curdir)
+    return tuple(directories)
+
+
+def _search_path_signature(root, x_path):
+    """
+    Modification times of the directories that a lookup of ``root`` in
+    ``x_path`` would probe, or None if they are too recent to be trusted.
+    """
+    now = time.time_ns()
+    signature = []
+    for path in x_path:
+        try:
+            mtime = os.stat(os.path.dirname(os.path.join(path, root)) or os.curdir).st_mtime_ns
+        except OSError:
+            mtime = None
+        else:
+            if now - mtime < file_index.RACY_MTIME_WINDOW:
+                return None
+        signature.append(mtime)
+    return tuple(signature)
+
+
+def _find_in_directories(root, extensions, mode, directories):
+    # Loop through the possible screen file extensions
+    for e in extensions:
+        file_path = which(str(root) + str(e), mode=mode, pathext=e, extra_path=directories)
+        if file_path is not None:
+            return file_path  # pick the first screen file found
+    return None
+
+
+def _find_in_subdirectories(root, extensions, mode, roots):
+    """
+    Look for the file in the subdirectories of ``roots``, closest first.
+
+    Files are looked up in the directory indexes of ``roots`` once they are
+    complete.  Until then, and whenever the name to look for has a directory
+    part, the subdirectories are scanned instead, stopping at the first
+    match.  Scans record the directories they list in the indexes, which
+    are thus completed by the lookups themselves.
+    """
+    if not roots:
+        return None
+    if os.path.dirname(root):
+        return _scan_subdirectories(root, extensions, mode, roots)
+    indexes = [file_index.get_index(path) for path in roots]
+    if not all(index.complete for index in indexes):
+        return _scan_subdirectories(root, extensions, mode, roots, indexes)
+    return _find_in_indexes(root, extensions, mode, indexes)
+
+
+def _find_in_indexes(root, extensions, mode, indexes):
+    # Same order as a breadth first scan: closest directories first, then the
+    # preferred extension, then the search path order.
+    candidates = []
+    for ext_idx, e in enumerate(extensions):
+        for root_idx, index in enumerate(indexes):
+            for depth, order, path in index.lookup(str(root) + str(e)):
+                if depth > 0:
+                    candidates.append((depth, ext_idx, root_idx, order, path, index))
+    for *_, path, index in sorted(candidates, key=lambda candidate: candidate[:5]):
+        if os.path.exists(path) and os.access(path, mode) and not os.path.isdir(path):
+            return path
+        # Only the directory of a file which went away needs listing again
+        index.listing(os.path.dirname(path))
+    return None
+
+
+def _scan_subdirectories(root, extensions, mode, roots, indexes=None):
+    # 3 seconds should be more than generous enough
+    SUBDIR_SCAN_TIME_LIMIT = 3
+    start_time = time.perf_counter()
+
+    # Directories to list, along with the index of the tree they belong to
+    x_path = collections.deque(zip(roots, indexes or [None] * len(roots)))
+    while len(x_path) > 0 and time.perf_counter() - start_time < SUBDIR_SCAN_TIME_LIMIT:
         # This might get large in some situations, but it's the easiest way to do BFS without
         # changing too much of the existing logic, and ideally recursion isn't needed
         path_count = len(x_path)
         for _ in range(path_count):
-            for subdir in os.listdir(x_path[0]):
+            path, index = x_path[0]
+            if index is not None:
+                x_path.extend((subdir, index) for subdir in index.listing(path)[1])
+                x_path.popleft()
+                continue
+            try:
+                subdirs = os.listdir(path)
+            except OSError:
+                subdirs = []
+            for subdir in subdirs:
                 if subdir.startswith(".") or subdir.startswith("__pycache__"):
                     continue
-                new_path = os.path.join(x_path[0], subdir)
+                new_path = os.path.join(path, subdir)
                 if os.path.isdir(new_path):
-                    x_path.append(new_path)
+                    x_path.append((new_path, None))
             x_path.popleft()
-
-    return file_path
+        if x_path:
+            file_path = _find_in_directories(root, extensions, mode, [path for path, _ in x_path])
+            if file_path is not None:
+                return file_path
+    return None
 
 
 def find_display_in_path(file, mode=None, path=None, pathext=None):
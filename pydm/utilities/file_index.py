@@ -0,0 +1,314 @@
+import atexit
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from pydm import config
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+
+# Maximum time spent listing directories in a single refresh of an index.
+# Directories left unlisted make the index incomplete until a scan of
+# find_file gets to them.
+REFRESH_TIME_LIMIT = 3
+
+# Directories modified less than this many nanoseconds before being listed are
+# listed again on the next refresh, as filesystems with a coarse timestamp
+# resolution may not bump their modification time on a subsequent change.
+RACY_MTIME_WINDOW = 2_000_000_000
+
+
+def _skip_directory(name: str) -> bool:
+    return name.startswith(".") or name.startswith("__pycache__")
+
+
+class FileIndex:
+    """
+    Filename index of a directory tree, used by ``find_file`` for recursive
+    lookups.
+
+    Every directory of the tree is stored with its modification time, the
+    files it contains and its subdirectories.  Refreshing the index only
+    stats the known directories and lists again the ones whose modification
+    time changed, which is much cheaper than walking the tree on network
+    filesystems.  Lookups are dictionary hits that return every file with a
+    given name, in the same breadth-first order that a scan of the tree
+    would find them.
+
+    Parameters
+    ----------
+    root : str
+        The absolute path of the directory to index.
+    directories : dict, optional
+        Previously stored directory entries, as returned by
+        :meth:`to_dict`.
+    """
+
+    # Minimum time, in seconds, between two refreshes of the same index.
+    refresh_interval = 1.0
+
+    def __init__(self, root: str, directories: Optional[Dict] = None):
+        self.root = root
+        # Keyed on directory path, values are (mtime_ns, files, subdirectories).
+        # A mtime of None marks a directory that was not listed yet.
+        self._dirs = {}
+        for path, (mtime, files, subdirs) in (directories or {}).items():
+            self._dirs[path] = (mtime, tuple(files), tuple(subdirs))
+        self._names = None
+        self._last_refresh = None
+        self.dirty = False
+
+    @property
+    def complete(self) -> bool:
+        """Whether every directory of the tree has been listed."""
+        return self.root in self._dirs and all(entry[0] is not None for entry in self._dirs.values())
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Bring the index up to date with the filesystem.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Refresh even if the index was refreshed less than
+            ``refresh_interval`` seconds ago.
+        """
+        now = time.monotonic()
+        if not force and self._last_refresh is not None and now - self._last_refresh < self.refresh_interval:
+            return
+        self._last_refresh = now
+        deadline = time.perf_counter() + REFRESH_TIME_LIMIT
+        self._dirs.setdefault(self.root, (None, (), ()))
+
+        changed = False
+        pending = deque(self._dirs)
+        while pending:
+            path = pending.popleft()
+            entry = self._dirs.get(path)
+            if entry is None:
+                continue
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                del self._dirs[path]
+                changed = True
+                continue
+            if entry[0] == mtime:
+                continue
+            if time.perf_counter() >= deadline:
+                if entry[0] is not None:
+                    self._dirs[path] = (None, entry[1], entry[2])
+                    changed = True
+                continue
+            files, subdirs = self._list(path)
+            if time.time_ns() - mtime < RACY_MTIME_WINDOW:
+                # The directory may still change without its modification
+                # time moving forward, so make sure the next refresh lists it.
+                mtime = -1
+            self._dirs[path] = (mtime, files, subdirs)
+            changed = True
+            for subdir in subdirs:
+                if subdir not in self._dirs:
+                    self._dirs[subdir] = (None, (), ())
+                    pending.append(subdir)
+
+        if changed or self._names is None:
+            self._rebuild()
+        self.dirty = self.dirty or changed
+
+    def listing(self, path: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        The files and subdirectories of a directory of the tree, reusing its
+        entry if it did not change since it was listed and recording it in
+        the index otherwise.  Used by the scans of ``find_file`` to build
+        the index level by level as they go.
+
+        Parameters
+        ----------
+        path : str
+            A directory of the tree.
+
+        Returns
+        -------
+        tuple
+            The names of the files and the paths of the subdirectories.
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return (), ()
+        entry = self._dirs.get(path)
+        if entry is not None and entry[0] == mtime:
+            return entry[1], entry[2]
+        files, subdirs = self._list(path)
+        if time.time_ns() - mtime < RACY_MTIME_WINDOW:
+            mtime = -1
+        self._dirs[path] = (mtime, files, subdirs)
+        for subdir in subdirs:
+            self._dirs.setdefault(subdir, (None, (), ()))
+        self._names = None
+        self.dirty = True
+        return files, subdirs
+
+    @staticmethod
+    def _list(path: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        continue
+                    if not is_dir:
+                        files.append(entry.name)
+                        continue
+                    if _skip_directory(entry.name):
+                        continue
+                    if entry.is_symlink():
+                        # Avoid walking in circles through links to a parent directory
+                        target = os.path.realpath(entry.path)
+                        real_path = os.path.realpath(path)
+                        if real_path == target or real_path.startswith(target + os.sep):
+                            continue
+                    subdirs.append(entry.path)
+        except OSError:
+            pass
+        return tuple(files), tuple(subdirs)
+
+    def _rebuild(self) -> None:
+        # Walk the stored tree breadth first from the root, numbering the
+        # directories in the order a scan of the filesystem would visit them.
+        names = {}
+        reachable = set()
+        queue = deque([(self.root, 0)])
+        order = 0
+        while queue:
+            path, depth = queue.popleft()
+            if path in reachable or path not in self._dirs:
+                continue
+            reachable.add(path)
+            _, files, subdirs = self._dirs[path]
+            for name in files:
+                names.setdefault(name, []).append((depth, order, os.path.join(path, name)))
+            order += 1
+            queue.extend((subdir, depth + 1) for subdir in subdirs)
+        for path in set(self._dirs) - reachable:
+            del self._dirs[path]
+        self._names = names
+
+    def lookup(self, name: str) -> List[Tuple[int, int, str]]:
+        """
+        Find every indexed file called ``name``.
+
+        Parameters
+        ----------
+        name : str
+            The file name, without any directory part.
+
+        Returns
+        -------
+        list
+            Tuples of (depth, order, path) where depth is the number of
+            directories between the root and the file and order is the
+            breadth-first position of the directory holding it.
+        """
+        if self._names is None:
+            self._rebuild()
+        return self._names.get(name, [])
+
+    def to_dict(self) -> Dict:
+        """The directory entries of this index in a JSON serializable form."""
+        return {path: [mtime, list(files), list(subdirs)] for path, (mtime, files, subdirs) in self._dirs.items()}
+
+
+_indexes = {}
+_persistent_loaded = False
+
+
+def get_index(root: str) -> FileIndex:
+    """
+    Return the index of the directory tree under ``root``, brought up to
+    date if it is complete.  Incomplete indexes are left to the scans of
+    ``find_file``, which stop at the first match, to complete.
+
+    When the ``PYDM_FILE_INDEX`` environment variable points to a file, the
+    indexes are loaded from it on first use and saved back to it when the
+    process exits, so that later processes only need to revalidate them.
+
+    Parameters
+    ----------
+    root : str
+        The absolute path of the directory.
+
+    Returns
+    -------
+    FileIndex
+    """
+    if not _persistent_loaded:
+        _load_persistent()
+    index = _indexes.get(root)
+    if index is None:
+        index = _indexes[root] = FileIndex(root)
+    if index.complete:
+        index.refresh()
+    return index
+
+
+def clear() -> None:
+    """Forget every directory index held by this process."""
+    _indexes.clear()
+
+
+def _load_persistent() -> None:
+    global _persistent_loaded
+    _persistent_loaded = True
+    if not config.FILE_INDEX:
+        return
+    atexit.register(save, config.FILE_INDEX)
+    try:
+        with open(config.FILE_INDEX) as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as e:
+        logger.warning("Unable to read file index %s: %s", config.FILE_INDEX, e)
+        return
+    if data.get("version") != INDEX_FORMAT_VERSION:
+        return
+    for root, directories in data.get("roots", {}).items():
+        _indexes.setdefault(root, FileIndex(root, directories))
+
+
+def save(path: str) -> None:
+    """
+    Store the directory indexes of this process in ``path`` if any of them
+    changed since it was loaded.
+
+    Parameters
+    ----------
+    path : str
+        The file to write.
+    """
+    if not any(index.dirty for index in _indexes.values()):
+        return
+    data = {
+        "version": INDEX_FORMAT_VERSION,
+        "roots": {root: index.to_dict() for root, index in _indexes.items()},
+    }
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Unable to write file index %s: %s", path, e)
+        return
+    for index in _indexes.values():
+        index.dirty = False
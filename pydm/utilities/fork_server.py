@@ -0,0 +1,287 @@
+"""
+Pre-warmed fork server for opening displays in new PyDM processes.
+
+Opening a display in a new window starts a new PyDM process, which has to
+import Qt, NumPy, pyqtgraph, PyDM and its widgets and look for data plugins
+before showing anything.  The fork server is a long-lived process which does
+all of this once, without creating a QApplication, and then forks a fresh
+child for each window requested over a local socket.  Each child is a
+separate process in its own session, so one window can still neither slow
+down nor crash another.
+
+The first PyDM process started with ``--fork-server`` starts the server and
+publishes its address in the ``PYDM_FORK_SERVER_ADDRESS`` environment
+variable, so that the processes it opens use the same server.  The server
+exits once the process that started it and all the processes it forked have
+exited.  Forking requires a POSIX system; elsewhere, and whenever the server
+is unavailable, new processes are started the usual way.
+"""
+
+import json
+import logging
+import os
+import select
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ADDRESS_ENV = "PYDM_FORK_SERVER_ADDRESS"
+
+# Prefixes of the environment variables read when PyDM is imported, which a
+# forked child would not see if they changed since the server started.
+_IMPORT_TIME_ENV_PREFIXES = ("PYDM_", "QT_", "PYQTGRAPH_")
+
+
+def is_available() -> bool:
+    """Whether processes can be forked from a server on this platform."""
+    return hasattr(os, "fork") and hasattr(socket, "AF_UNIX")
+
+
+def _import_time_environment(env) -> Dict[str, str]:
+    return {
+        key: value for key, value in env.items() if key.startswith(_IMPORT_TIME_ENV_PREFIXES) and key != ADDRESS_ENV
+    }
+
+
+class ForkServer:
+    """
+    Client side of a fork server.
+
+    Parameters
+    ----------
+    address : str
+        The path of the socket of the server.
+    process : subprocess.Popen, optional
+        The server process, if it was started by this process.
+    """
+
+    # Seconds to wait for the server to answer a request
+    timeout = 2.0
+
+    def __init__(self, address: str, process: Optional[subprocess.Popen] = None):
+        self.address = address
+        self.process = process
+
+    @classmethod
+    def start(cls) -> "ForkServer":
+        """
+        Start a new fork server process and publish its address in the
+        environment of this process.  The server only accepts requests once
+        it is done importing PyDM.
+
+        Returns
+        -------
+        ForkServer
+        """
+        address = os.path.join(tempfile.mkdtemp(prefix="pydm-fork-server-"), "socket")
+        os.environ[ADDRESS_ENV] = address
+        process = subprocess.Popen(
+            [sys.executable, "-m", "pydm.utilities.fork_server", address, str(os.getpid())],
+            shell=False,
+        )
+        logger.debug("Started fork server %d at %s", process.pid, address)
+        return cls(address, process)
+
+    @classmethod
+    def connect_or_start(cls) -> Optional["ForkServer"]:
+        """
+        The fork server published in the environment, or a new one.
+
+        Returns
+        -------
+        ForkServer, optional
+            None if fork servers are not available on this platform.
+        """
+        if not is_available():
+            logger.info("Fork server is not available on this platform, new processes will be started normally.")
+            return None
+        address = os.environ.get(ADDRESS_ENV)
+        if address and os.path.exists(address):
+            return cls(address)
+        return cls.start()
+
+    def wait_ready(self, timeout: float = 30.0) -> bool:
+        """Wait until the server accepts requests, returning whether it does."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process is not None and self.process.poll() is not None:
+                return False
+            if self._ping():
+                return True
+            time.sleep(0.05)
+        return False
+
+    def _ping(self) -> bool:
+        return self._request({"ping": True}) is not None
+
+    def _request(self, message: Dict) -> Optional[Dict]:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(self.address)
+                sock.sendall(json.dumps(message).encode() + b"\n")
+                with sock.makefile("rb") as reply:
+                    return json.loads(reply.readline())
+        except (OSError, ValueError):
+            return None
+
+    def launch(self, argv: List[str], cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None) -> Optional[int]:
+        """
+        Ask the server for a new PyDM process.
+
+        Parameters
+        ----------
+        argv : list of str
+            The command line of the new process, as given to the ``pydm``
+            launcher.
+        cwd : str, optional
+            The working directory of the new process, defaults to the one of
+            this process.
+        env : dict, optional
+            The environment of the new process, defaults to the one of this
+            process.
+
+        Returns
+        -------
+        int, optional
+            The process id of the new process, None if the server could not
+            be reached or refused the request, in which case the process
+            should be started some other way.
+        """
+        reply = self._request(
+            {
+                "argv": list(argv),
+                "cwd": cwd or os.getcwd(),
+                "env": dict(os.environ if env is None else env),
+            }
+        )
+        if reply is None:
+            logger.debug("Fork server at %s is not reachable", self.address)
+            return None
+        if "error" in reply:
+            logger.debug("Fork server refused the request: %s", reply["error"])
+            return None
+        return reply.get("pid")
+
+
+def _preload() -> None:
+    """Import and initialize everything a PyDM process needs before creating a QApplication."""
+    import numpy  # noqa: F401
+    import pyqtgraph  # noqa: F401
+    from qtpy import QtCore, QtGui, QtWidgets  # noqa: F401
+
+    import pydm.widgets  # noqa: F401
+    import pydm_launcher.main  # noqa: F401
+    from pydm import data_plugins
+
+    # Only find the data plugins whose protocols are known without importing
+    # them: importing a plugin could load libraries such as libca which start
+    # threads, and those do not survive a fork.  Children complete the search
+    # and import the plugins of the protocols they use, see
+    # data_plugins.load_plugin.
+    data_plugins.initialize_plugins_if_needed(import_unknown=False)
+
+
+def _run_child(request: Dict) -> None:
+    """Run the PyDM launcher in a freshly forked child.  Never returns."""
+    code = 1
+    try:
+        os.setsid()
+        for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGCHLD):
+            signal.signal(signum, signal.SIG_DFL)
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        sys.argv = list(request["argv"])
+
+        from pydm_launcher.main import main
+
+        main()
+        code = 0
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except BaseException:
+        import traceback
+
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def serve(address: str, parent_pid: int) -> None:
+    """
+    Run the fork server until the process which started it and all the
+    processes it forked have exited.
+
+    Parameters
+    ----------
+    address : str
+        The path of the socket to listen on.
+    parent_pid : int
+        The process id of the process which started the server.
+    """
+    # Interrupting the terminal should not take the server down with the
+    # process that started it; it exits on its own once nothing uses it.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _preload()
+    environment = _import_time_environment(os.environ)
+    children = set()
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(address)
+    listener.listen(16)
+    try:
+        while True:
+            for pid in list(children):
+                try:
+                    if os.waitpid(pid, os.WNOHANG)[0] != 0:
+                        children.discard(pid)
+                except ChildProcessError:
+                    children.discard(pid)
+            if os.getppid() != parent_pid and not children:
+                break
+            if not select.select([listener], [], [], 1.0)[0]:
+                continue
+            connection, _ = listener.accept()
+            with connection:
+                connection.settimeout(ForkServer.timeout)
+                try:
+                    with connection.makefile("rb") as stream:
+                        request = json.loads(stream.readline())
+                except (OSError, ValueError):
+                    continue
+                if request.get("ping"):
+                    reply = {"pid": os.getpid()}
+                elif _import_time_environment(request.get("env", {})) != environment:
+                    reply = {"error": "the PyDM environment variables changed since the server started"}
+                else:
+                    pid = os.fork()
+                    if pid == 0:
+                        listener.close()
+                        connection.close()
+                        _run_child(request)
+                    children.add(pid)
+                    reply = {"pid": pid}
+                try:
+                    connection.sendall(json.dumps(reply).encode() + b"\n")
+                except OSError:
+                    pass
+    finally:
+        listener.close()
+        try:
+            os.unlink(address)
+            os.rmdir(os.path.dirname(address))
+        except OSError:
+            pass
+
+
+if __name__ == "__main__":
+    serve(sys.argv[1], int(sys.argv[2]))
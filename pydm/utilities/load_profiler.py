@@ -0,0 +1,277 @@
+"""
+Timing of the steps involved in loading PyDM displays.
+
+When enabled, every display loaded through :func:`pydm.display.load_file`
+gets a :class:`DisplayLoadRecord` holding the time spent resolving files,
+compiling and executing the ui file, expanding macros, constructing each
+kind of widget, registering rules and connecting channels.  Displays loaded
+while another one is loading (embedded displays, template repeater items)
+are recorded as children of that display, so the records form a tree that
+can be printed with :func:`report` or exported with :func:`to_json`.
+"""
+
+import functools
+import json
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+class DisplayLoadRecord:
+    """
+    Timings collected while loading a single display file.
+
+    Parameters
+    ----------
+    file_path : str
+        The display file being loaded.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.duration = 0.0
+        # Keyed on section name, values are [count, seconds]
+        self.sections = {}
+        # Keyed on widget class name, values are [count, seconds]
+        self.widgets = {}
+        self.children = []
+
+    def add(self, section: str, seconds: float) -> None:
+        entry = self.sections.setdefault(section, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+    def add_widget(self, class_name: str, seconds: float) -> None:
+        entry = self.widgets.setdefault(class_name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+    def as_dict(self) -> Dict:
+        return {
+            "file": self.file_path,
+            "duration": self.duration,
+            "sections": {
+                name: {"count": count, "duration": seconds} for name, (count, seconds) in self.sections.items()
+            },
+            "widgets": {name: {"count": count, "duration": seconds} for name, (count, seconds) in self.widgets.items()},
+            "children": [child.as_dict() for child in self.children],
+        }
+
+
+class _TimedConstructor:
+    """
+    Stands in for a widget class in the namespace of a compiled ui file,
+    timing each instance constructed by ``setupUi``.
+    """
+
+    def __init__(self, profiler, cls):
+        self._profiler = profiler
+        self._cls = cls
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._cls(*args, **kwargs)
+        finally:
+            self._profiler.record_widget(self._cls.__name__, time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        return getattr(self._cls, name)
+
+
+class LoadProfiler:
+    """
+    Collects :class:`DisplayLoadRecord` trees for the displays loaded while
+    it is enabled.  Time spent outside of any display load (for example
+    connecting the channels of a display shown again through the navigation
+    history) is accumulated in the ``unattributed`` record.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.records = []
+        self.unattributed = DisplayLoadRecord(None)
+        self._stack = []
+        self._display_records = weakref.WeakKeyDictionary()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Forget every collected record."""
+        self.records = []
+        self.unattributed = DisplayLoadRecord(None)
+        self._stack = []
+        self._display_records = weakref.WeakKeyDictionary()
+
+    @property
+    def current(self) -> DisplayLoadRecord:
+        return self._stack[-1] if self._stack else self.unattributed
+
+    @contextmanager
+    def display(self, file_path: str):
+        """
+        Context manager recording the load of ``file_path``.
+        """
+        if not self.enabled:
+            yield None
+            return
+        record = DisplayLoadRecord(file_path)
+        if self._stack:
+            self._stack[-1].children.append(record)
+        else:
+            self.records.append(record)
+        self._stack.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.duration = time.perf_counter() - start
+            self._stack.pop()
+
+    def bind(self, display, record: Optional[DisplayLoadRecord]) -> None:
+        """
+        Associate a loaded display with its record, so that displays loaded
+        later on its behalf can be recorded as its children with :meth:`within`.
+        """
+        if record is not None:
+            self._display_records[display] = record
+
+    @contextmanager
+    def within(self, display):
+        """
+        Context manager attributing the work done in its block to the record
+        of ``display``, used for deferred loads such as embedded displays
+        opened when first shown.
+        """
+        record = self._display_records.get(display) if self.enabled and display is not None else None
+        if record is None or (self._stack and self._stack[-1] is record):
+            yield
+            return
+        self._stack.append(record)
+        try:
+            yield
+        finally:
+            self._stack.remove(record)
+
+    @contextmanager
+    def section(self, name: str):
+        """
+        Context manager adding the time spent in its block to the section
+        ``name`` of the display being loaded.
+        """
+        if not self.enabled:
+            yield
+            return
+        record = self.current
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record.add(name, time.perf_counter() - start)
+
+    def timed(self, name: str):
+        """
+        Decorator adding the time spent in the decorated function to the
+        section ``name`` of the display being loaded.
+        """
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.section(name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def record_widget(self, class_name: str, seconds: float) -> None:
+        self.current.add_widget(class_name, seconds)
+
+    def instrument_widget_classes(self, namespace: Dict) -> None:
+        """
+        Replace the widget classes found in the namespace of a compiled ui
+        file with stand-ins timing their construction.
+        """
+        if not self.enabled:
+            return
+        from qtpy.QtWidgets import QWidget
+
+        for name, value in list(namespace.items()):
+            if isinstance(value, type) and issubclass(value, QWidget):
+                namespace[name] = _TimedConstructor(self, value)
+
+    def as_dict(self) -> Dict:
+        return {
+            "displays": [record.as_dict() for record in self.records],
+            "unattributed": self.unattributed.as_dict()["sections"],
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.as_dict(), indent=indent)
+
+    def report(self, max_widgets: int = 5) -> str:
+        """
+        Human readable tree of the collected records.
+
+        Parameters
+        ----------
+        max_widgets : int, optional
+            Number of widget classes listed per display, slowest first.
+
+        Returns
+        -------
+        str
+        """
+        lines = []
+        for record in self.records:
+            self._report_record(record, 0, max_widgets, lines)
+        if self.unattributed.sections:
+            lines.append("Outside of display loads")
+            lines.extend(_section_lines(self.unattributed.sections, 1))
+        return "\n".join(lines)
+
+    def _report_record(self, record: DisplayLoadRecord, depth: int, max_widgets: int, lines: List[str]) -> None:
+        indent = "  " * depth
+        lines.append("{}{}  {}".format(indent, record.file_path, _ms(record.duration)))
+        lines.extend(_section_lines(record.sections, depth + 1))
+        widgets = sorted(record.widgets.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (count, seconds) in widgets[:max_widgets]:
+            lines.append("{}  widget {:<28} {:>6}x  {}".format(indent, name, count, _ms(seconds)))
+        if len(widgets) > max_widgets:
+            count = sum(entry[0] for _, entry in widgets[max_widgets:])
+            seconds = sum(entry[1] for _, entry in widgets[max_widgets:])
+            lines.append("{}  widget {:<28} {:>6}x  {}".format(indent, "(others)", count, _ms(seconds)))
+        for child in record.children:
+            self._report_record(child, depth + 1, max_widgets, lines)
+
+
+def _ms(seconds: float) -> str:
+    return "{:9.2f} ms".format(seconds * 1000.0)
+
+
+def _section_lines(sections: Dict, depth: int) -> List[str]:
+    indent = "  " * depth
+    return [
+        "{}{:<35} {:>6}x  {}".format(indent, name, count, _ms(seconds)) for name, (count, seconds) in sections.items()
+    ]
+
+
+profiler = LoadProfiler()
+
+enable = profiler.enable
+disable = profiler.disable
+reset = profiler.reset
+display = profiler.display
+section = profiler.section
+within = profiler.within
+timed = profiler.timed
+report = profiler.report
+to_json = profiler.to_json
@@ -1,9 +1,14 @@
+import functools
 import io
+import logging
+import os
 import re
 import six
 from string import Template
 import json
 
+logger = logging.getLogger(__name__)
+
 # Macro parsing states
 PRE_NAME = 0
 IN_NAME = 1
@@ -31,31 +36,230 @@ def substitute_in_file(file_path, macros):
 
 
 def replace_macros_in_template(template, macros):
-    curr_template = template
-    prev_template = Template("")
-    expanded_text = ""
+    """
+    Substitute the macros given by ${name} or $name in a template with the
+    entries of the `macros` dictionary.
+
+    Macro values may themselves reference other macros, which are expanded
+    too, as are the references formed by the substituted text (e.g.
+    ``${DEV_${N}}``).  Macros that are not defined, or that reference
+    themselves through other macros, are left untouched.
+
+    Parameters
+    ----------
+    template : string.Template or str
+        The text in which to substitute.
+    macros : dict
+        Dictionary containing macro name as key and value as what will be substituted.
+
+    Returns
+    -------
+    file : io.StringIO
+        File-like object with the proper substitutions.
+    """
+    if isinstance(template, Template):
+        template = template.template
     # Escape any single or double quotes to ensure macro substitution results in valid python code
     # when replaced (e.g. xterm -e 'echo hi')
     macros = {
         key: re.sub(r'(?<!\\)"', '\\"', re.sub(r"(?<!\\)'", "\\'", value)) if isinstance(value, str) else value
         for key, value in macros.items()
     }
+    expanded_text = _unescape(_expand(tokenize_template(template), _MacroResolver(macros)))
+    return io.StringIO(six.text_type(expanded_text))
+
+
+def expand_macros(text, macros):
+    """
+    Substitute the macros given by ${name} or $name in a string with the
+    entries of the `macros` dictionary, without escaping quotes.
+
+    Parameters
+    ----------
+    text : str
+        The text in which to substitute.
+    macros : dict
+        Dictionary containing macro name as key and value as what will be substituted.
+
+    Returns
+    -------
+    str
+    """
+    return _unescape(_expand(tokenize_template(text), _MacroResolver(macros)))
+
+
+def _tokenize(text):
+    """
+    Split a template into literal text and macro references.
+
+    Returns
+    -------
+    tuple
+        Tuples of (literal, name, reference) where literal is the text
+        preceding the macro reference, name is the macro name and reference
+        is the original text of the reference.  The last tuple only holds the
+        trailing literal text, with name and reference set to None.  Escaped
+        delimiters ($$) are kept in the literal text, see :func:`_unescape`.
+    """
+    tokens = []
+    literal = []
+    position = 0
+    for match in Template.pattern.finditer(text):
+        literal.append(text[position : match.start()])
+        position = match.end()
+        name = match.group("named") or match.group("braced")
+        if name is None:
+            # An escaped delimiter ($$) or a lone $ that is not a reference
+            literal.append(match.group())
+            continue
+        tokens.append(("".join(literal), name, match.group()))
+        literal = []
+    literal.append(text[position:])
+    tokens.append(("".join(literal), None, None))
+    return tuple(tokens)
+
+
+@functools.lru_cache(maxsize=64)
+def tokenize_template(text):
+    """
+    Tokenized version of a template, cached so that a display loaded many
+    times (e.g. embedded displays or template repeater items) is only
+    scanned for macro references once.
+
+    Parameters
+    ----------
+    text : str
+        The template text.
 
-    for i in range(100):
-        expanded_text = curr_template.safe_substitute(macros)
-        if curr_template.template == prev_template.template:
+    Returns
+    -------
+    tuple
+        See :func:`_tokenize`.
+    """
+    return _tokenize(text)
+
+
+# Most times the substituted text is scanned again for references it forms
+_MAX_PASSES = 100
+
+
+def _expand(tokens, resolver):
+    """
+    Substitute the macro references of tokenized text, then those formed by
+    the substituted text, until it stops changing.
+    """
+    text, rescan = _substitute(tokens, resolver)
+    for _ in range(_MAX_PASSES):
+        if not rescan:
             break
-        prev_template = curr_template
-        curr_template = Template(expanded_text)
-    return io.StringIO(six.text_type(expanded_text))
+        # References to macros found to be cyclic are kept, as in the first
+        # pass, instead of growing the text on each pass.
+        expanded, rescan = _substitute(_tokenize(text), resolver, skip=resolver.cyclic)
+        if expanded == text:
+            break
+        text = expanded
+    return text
+
+
+def _substitute(tokens, resolver, skip=frozenset()):
+    """
+    Substitute the macro references of tokenized text once.
+
+    Returns
+    -------
+    tuple
+        The substituted text and whether it may contain new references,
+        i.e. whether a delimiter was substituted or is in the literal text.
+    """
+    parts = []
+    substituted = False
+    delimiters = False
+    for literal, name, reference in tokens:
+        parts.append(literal)
+        delimiters = delimiters or Template.delimiter in literal
+        if name is not None:
+            value = None if name in skip else resolver.resolve(name)
+            if value is None:
+                parts.append(reference)
+            else:
+                parts.append(value)
+                substituted = True
+                delimiters = delimiters or Template.delimiter in value
+    return "".join(parts), substituted and delimiters
+
+
+def _unescape(text):
+    """Replace the escaped delimiters ($$) of expanded text with a single $."""
+    if Template.delimiter not in text:
+        return text
+    return Template.pattern.sub(
+        lambda match: Template.delimiter if match.group("escaped") is not None else match.group(), text
+    )
+
+
+class _MacroResolver:
+    """
+    Resolves macro values, expanding the macros referenced by each value
+    once, depth first, and detecting reference cycles.
+    """
+
+    def __init__(self, macros):
+        self.macros = macros
+        self.resolved = {}
+        self.resolving = set()
+        self.cyclic = set()
+
+    def resolve(self, name):
+        try:
+            return self.resolved[name]
+        except KeyError:
+            pass
+        if name not in self.macros:
+            return None
+        if name in self.resolving:
+            logger.warning("Macro %s references itself, it will not be expanded.", name)
+            self.cyclic.update(self.resolving)
+            return None
+        self.resolving.add(name)
+        value = self.macros[name]
+        value = value if isinstance(value, str) else "%s" % (value,)
+        if Template.delimiter in value:
+            value = _expand(_tokenize(value), self)
+        self.resolving.discard(name)
+        self.resolved[name] = value
+        return value
 
 
 def template_for_file(file_path):
+    """
+    Read a file as a template.
+
+    The template is cached until the file is modified.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the file.
+
+    Returns
+    -------
+    string.Template
+    """
+    stat = os.stat(file_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _file_templates.get(file_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
     with open(file_path) as orig_file:
         text = Template(orig_file.read())
+    _file_templates[file_path] = (signature, text)
     return text
 
 
+# Templates read by template_for_file, keyed on file path.
+_file_templates = {}
+
+
 def parse_macro_string(macro_string):
     """Parses a macro string and returns a dictionary.
     First, this method attempts to parse the string as JSON.
@@ -1,7 +1,9 @@
 import enum
+import math
 import os
 import re
 import platform
+import time
 import weakref
 import logging
 import functools
@@ -10,7 +12,7 @@ import copy
 import numpy as np
 from qtpy.QtWidgets import QApplication, QMenu, QGraphicsOpacityEffect, QToolTip, QWidget
 from qtpy.QtGui import QCursor, QIcon, QClipboard
-from qtpy.QtCore import Qt, QEvent, Signal, Slot
+from qtpy.QtCore import Qt, QEvent, Signal, Slot, QTimer
 from .channel import PyDMChannel
 from pydm import data_plugins, tools, config
 from pydm.utilities import is_qt_designer, remove_protocol
@@ -137,6 +139,89 @@ def refresh_style(widget):
             logger.debug("Error while refreshing stylesheet. %s ", ex)
 
 
+def repolish(widget, children=()):
+    """
+    Refresh the style of a single widget, plus an explicit list of its
+    children, without traversing the rest of the widget tree.
+
+    Parameters
+    ----------
+    widget : QWidget
+    children : iterable of QWidget, optional
+    """
+    for child_widget in (widget, *children):
+        try:
+            style = child_widget.style()
+            style.unpolish(child_widget)
+            style.polish(child_widget)
+            child_widget.update()
+        except Exception as ex:
+            # Widget was probably destroyed
+            logger.debug("Error while refreshing stylesheet. %s ", ex)
+
+
+class AlarmStyleScheduler(object):
+    """
+    Coalesces the style refreshes caused by alarm severity changes.
+
+    The first severity change a widget receives in an event loop iteration is
+    applied right away.  Any further changes to that widget during the same
+    iteration are queued, and the widget is restyled once more with its final
+    severity the next time the event loop runs, or not at all if the severity
+    ends up where it was last styled.
+    """
+
+    _pending = {}
+    _styled = set()
+    _flush_scheduled = False
+
+    @classmethod
+    def schedule(cls, widget):
+        """
+        Refresh the style of widget now, or at the next event loop iteration
+        if it was already refreshed during this one.
+
+        Parameters
+        ----------
+        widget : PyDMWidget
+        """
+        if QApplication.instance() is None:
+            cls.restyle(widget)
+            return
+        key = id(widget)
+        if key in cls._styled:
+            cls._pending[key] = weakref.ref(widget)
+        else:
+            cls._styled.add(key)
+            cls.restyle(widget)
+        if not cls._flush_scheduled:
+            cls._flush_scheduled = True
+            QTimer.singleShot(0, cls.flush)
+
+    @classmethod
+    def flush(cls):
+        """Restyle all widgets queued since the last flush."""
+        pending = cls._pending
+        cls._pending = {}
+        cls._styled = set()
+        cls._flush_scheduled = False
+        for widget_ref in pending.values():
+            widget = widget_ref()
+            if widget is not None:
+                cls.restyle(widget)
+
+    @staticmethod
+    def restyle(widget):
+        state = widget._alarm_state
+        if state == widget._styled_alarm_state:
+            return
+        widget._styled_alarm_state = state
+        if config.ALARM_RESTYLE_SUBTREE:
+            refresh_style(widget)
+        else:
+            repolish(widget, widget.alarm_style_children())
+
+
 def PostParentClassInitSetup(self):
     # This function should only be called from a pydm widget class's __init__ call, and *not* from
     # from the __init__ of it's parent classes (PyDMWidget/PyDMPrimitiveWidget) where it throws an error on pyside6.
@@ -396,25 +481,64 @@ class TextFormatter(object):
         self._user_prec = 0
         self._prec = 0
         self._unit = ""
+        # The inputs the current format string was built from, and the
+        # equivalent format spec and suffix used by format_value.
+        self._format_key = None
+        self._compiled_format_string = None
+        self._format_spec = ""
+        self._format_suffix = ""
 
     def update_format_string(self):
         """
         Reconstruct the format string to be used when representing the
         output value.
 
+        The format string is only rebuilt when the value type, precision or
+        units it depends on have changed since the last call.
+
         Returns
         -------
         format_string : str
             The format string to be used including or not the precision
             and unit
         """
+        is_number = isinstance(self.value, (int, float))
+        show_units = self._show_units and self._unit != ""
+        key = (is_number, self.precision if is_number else None, self._unit if show_units else None)
+        if key == self._format_key and self.format_string is self._compiled_format_string:
+            return self.format_string
+        self._format_key = key
+        self._format_spec = ""
+        self._format_suffix = ""
         self.format_string = "{}"
-        if isinstance(self.value, (int, float)):
-            self.format_string = "{:." + str(self.precision) + "f}"
-        if self._show_units and self._unit != "":
-            self.format_string += " {}".format(self._unit)
+        if is_number:
+            self._format_spec = "." + str(self.precision) + "f"
+            self.format_string = "{:" + self._format_spec + "}"
+        if show_units:
+            self._format_suffix = " {}".format(self._unit)
+            self.format_string += self._format_suffix
+        self._compiled_format_string = self.format_string
         return self.format_string
 
+    def format_value(self, value):
+        """
+        Format a value with the current format string.
+
+        Equivalent to ``self.format_string.format(value)``, but skips parsing
+        the format string on every call unless it was replaced by a subclass.
+
+        Parameters
+        ----------
+        value : Any
+
+        Returns
+        -------
+        str
+        """
+        if self.format_string is not self._compiled_format_string:
+            return self.format_string.format(value)
+        return format(value, self._format_spec) + self._format_suffix
+
     def precision_changed(self, new_precision):
         """
         Callback invoked when the Channel has new precision value.
@@ -643,7 +767,13 @@ class PyDMWidget(PyDMPrimitiveWidget):
         self._alarm_sensitive_content = False
         self._alarm_sensitive_border = True
         self._alarm_state = self.ALARM_NONE
+        self._styled_alarm_state = None
         self._tooltip = None
+        # Updates held back while the widget is hidden, see updates_suspended
+        self._suspend_when_hidden = False
+        self._held_value = None
+        self._has_held_value = False
+        self._restyle_held = False
 
         self._upper_ctrl_limit = None
         self._lower_ctrl_limit = None
@@ -684,6 +814,8 @@ class PyDMWidget(PyDMPrimitiveWidget):
         if not is_qt_designer():
             self._connected = False
             self.alarmSeverityChanged(self.ALARM_DISCONNECTED)
+            # Looked up on the first update received while hidden
+            self._suspend_when_hidden = None
 
     def widget_ctx_menu(self):
         """
@@ -812,7 +944,60 @@ class PyDMWidget(PyDMPrimitiveWidget):
             self._alarm_state = PyDMWidget.ALARM_NONE
         else:
             self._alarm_state = new_alarm_severity
-        refresh_style(self)
+        if self.updates_suspended():
+            self._restyle_held = True
+        else:
+            AlarmStyleScheduler.schedule(self)
+
+    def updates_suspended(self) -> bool:
+        """
+        Whether the updates of the channel value and of the alarm style are
+        held back.  This is the case while the widget is hidden, for instance
+        on an inactive tab, if the PYDM_SUSPEND_HIDDEN_UPDATES environment
+        variable or the ``suspend_hidden_updates`` attribute of one of the
+        displays containing the widget is set.  Channels stay connected, and
+        the latest value and alarm style are applied when the widget is shown.
+
+        Returns
+        -------
+        bool
+        """
+        if self._suspend_when_hidden is False or self.isVisible():
+            return False
+        if self._suspend_when_hidden is None:
+            self._suspend_when_hidden = config.SUSPEND_HIDDEN_UPDATES or self._display_suspends_hidden_updates()
+        return self._suspend_when_hidden
+
+    def _display_suspends_hidden_updates(self) -> bool:
+        widget = self.parent()
+        while widget is not None:
+            if isinstance(widget, Display) and widget.suspend_hidden_updates:
+                return True
+            widget = widget.parent()
+        return False
+
+    def _apply_held_updates(self) -> None:
+        if self._has_held_value:
+            new_val = self._held_value
+            self._held_value = None
+            self._has_held_value = False
+            self.value_changed(new_val)
+        if self._restyle_held:
+            self._restyle_held = False
+            AlarmStyleScheduler.schedule(self)
+
+    def alarm_style_children(self):
+        """
+        The child widgets whose style depends on this widget's alarm
+        severity, restyled along with this widget when the severity changes.
+        Composite widgets whose internal children are targeted by
+        alarm-sensitive stylesheet rules should override this.
+
+        Returns
+        -------
+        list
+        """
+        return []
 
     def enum_strings_changed(self, new_enum_strings):
         """
@@ -827,7 +1012,9 @@ class PyDMWidget(PyDMPrimitiveWidget):
         """
         if new_enum_strings != self.enum_strings:
             self.enum_strings = new_enum_strings
-            self.value_changed(self.value)
+            # A value held back while hidden is shown with the new strings
+            if not self._has_held_value:
+                self.channelValueChanged(self.value)
 
     def timestamp_changed(self, new_timestamp):
         """
@@ -913,8 +1100,27 @@ class PyDMWidget(PyDMPrimitiveWidget):
         ----------
         new_val : int, float, str, bool or np.ndarray
         """
+        if self.updates_suspended():
+            self._held_value = new_val
+            self._has_held_value = True
+            return
         self.value_changed(new_val)
 
+    @Slot(dict)
+    def metadataChanged(self, metadata):
+        """
+        PyQT Slot for changes of several control variables of the Channel at
+        once, which calls the slot of each of them in turn.
+
+        Parameters
+        ----------
+        metadata : dict
+        """
+        for channel in self._channels:
+            if channel.address == self._channel:
+                channel.apply_metadata(metadata)
+                break
+
     @Slot(int)
     def alarmSeverityChanged(self, new_alarm_severity):
         """
@@ -1273,6 +1479,7 @@ class PyDMWidget(PyDMPrimitiveWidget):
                 channel.unit_slot = self.unitChanged
             if hasattr(self, "precisionChanged"):
                 channel.prec_slot = self.precisionChanged
+            channel.metadata_slot = self.metadataChanged
             # Connect write channels if we have them
             channel.connect()
             self._channels.append(channel)
@@ -1357,6 +1564,11 @@ class PyDMWidget(PyDMPrimitiveWidget):
             True to stop the event from being handled further; otherwise
             return false.
         """
+        if obj is self and event.type() in (QEvent.Show, QEvent.Hide, QEvent.ParentChange):
+            # The displays containing the widget may have changed
+            self._suspend_when_hidden = None
+            if event.type() == QEvent.Show:
+                self._apply_held_updates()
 
         if event.type() == QEvent.Enter and self._connected:
             if not self._pydm_tool_tip:
@@ -1368,6 +1580,74 @@ class PyDMWidget(PyDMPrimitiveWidget):
         return super().eventFilter(obj, event)
 
 
+class WriteCoalescer(object):
+    """
+    Limits the rate at which a writable widget sends values to its channel.
+
+    The first value is sent right away.  Values sent less than ``1 / rate``
+    seconds after the previous write replace each other, and only the latest
+    one is sent once the interval is over.  A continuously dragged widget
+    thus writes at most ``rate`` values per second instead of one per pixel
+    of movement, and always ends with its final value.
+
+    Parameters
+    ----------
+    widget : PyDMWritableWidget
+        The widget whose send_value_signal is rate limited.
+    rate : float
+        Most values sent per second.
+    """
+
+    def __init__(self, widget, rate):
+        self.widget = widget
+        self.rate = rate
+        self._pending = None
+        self._last_sent = None
+        self._timer = QTimer(widget)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+    @property
+    def has_pending(self) -> bool:
+        return self._pending is not None
+
+    def send(self, value, signal_type=None) -> None:
+        """
+        Send a value now if the previous write is old enough, otherwise
+        once it is, unless a newer value is sent in between.
+
+        Parameters
+        ----------
+        value : int, float, str, bool or np.ndarray
+            The value to write.
+        signal_type : type, optional
+            The overload of send_value_signal to emit.
+        """
+        interval = 1.0 / self.rate
+        elapsed = None if self._last_sent is None else time.monotonic() - self._last_sent
+        if not self._timer.isActive() and (elapsed is None or elapsed >= interval):
+            self._emit(value, signal_type)
+            return
+        self._pending = (value, signal_type)
+        if not self._timer.isActive():
+            self._timer.start(int(math.ceil((interval - elapsed) * 1000)))
+
+    def flush(self) -> None:
+        """Send the pending value, if any, right away."""
+        self._timer.stop()
+        if self._pending is not None:
+            value, signal_type = self._pending
+            self._pending = None
+            self._emit(value, signal_type)
+
+    def _emit(self, value, signal_type) -> None:
+        self._last_sent = time.monotonic()
+        signal = self.widget.send_value_signal
+        if signal_type is not None:
+            signal = signal[signal_type]
+        signal.emit(value)
+
+
 class PyDMWritableWidget(PyDMWidget):
     """
     PyDM base class for Writable widgets.
@@ -1394,6 +1674,8 @@ class PyDMWritableWidget(PyDMWidget):
         self._disp_channel = None
         self._disable_put = False
         self._monitor_disp = False
+        self._max_write_rate = config.MAX_WRITE_RATE
+        self._write_coalescer = None
         super().__init__(init_channel=init_channel)
 
     def init_for_designer(self):
@@ -1454,6 +1736,41 @@ class PyDMWritableWidget(PyDMWidget):
 
     monitorDisp = Property(bool, readMonitorDisp, setMonitorDisp)
 
+    def _set_max_write_rate(self, rate: float) -> None:
+        """Change the rate limit of send_coalesced_value, writing any value it holds back."""
+        self._max_write_rate = max(0.0, float(rate))
+        if self._write_coalescer is not None:
+            self._write_coalescer.flush()
+            if self._max_write_rate > 0:
+                self._write_coalescer.rate = self._max_write_rate
+
+    def send_coalesced_value(self, value, signal_type=None) -> None:
+        """
+        Send a value through send_value_signal, at most ``maxWriteRate``
+        times per second, the latest value replacing any one waiting to be
+        sent.  See :class:`WriteCoalescer`.  Meant for widgets whose value
+        changes continuously, which expose the ``maxWriteRate`` property.
+
+        Parameters
+        ----------
+        value : int, float, str, bool or np.ndarray
+            The value to write.
+        signal_type : type, optional
+            The overload of send_value_signal to emit.
+        """
+        if self._max_write_rate <= 0:
+            signal = self.send_value_signal if signal_type is None else self.send_value_signal[signal_type]
+            signal.emit(value)
+            return
+        if self._write_coalescer is None:
+            self._write_coalescer = WriteCoalescer(self, self._max_write_rate)
+        self._write_coalescer.send(value, signal_type)
+
+    def flush_pending_write(self) -> None:
+        """Write the value held back by ``maxWriteRate``, if any, right away."""
+        if self._write_coalescer is not None:
+            self._write_coalescer.flush()
+
     def readChannel(self) -> Optional[str]:
         """
         The channel address in use for this widget.
@@ -2,10 +2,26 @@ import logging
 
 import pydm.data_plugins
 
-from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes
+from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes, load_profiler
 
 logger = logging.getLogger(__name__)
 
+# Slot of PyDMChannel receiving each key of the metadata of a connection
+METADATA_SLOTS = {
+    "severity": "severity_slot",
+    "write_access": "write_access_slot",
+    "enum_strings": "enum_strings_slot",
+    "units": "unit_slot",
+    "precision": "prec_slot",
+    "upper_ctrl_limit": "upper_ctrl_limit_slot",
+    "lower_ctrl_limit": "lower_ctrl_limit_slot",
+    "upper_alarm_limit": "upper_alarm_limit_slot",
+    "lower_alarm_limit": "lower_alarm_limit_slot",
+    "upper_warning_limit": "upper_warning_limit_slot",
+    "lower_warning_limit": "lower_warning_limit_slot",
+    "timestamp": "timestamp_slot",
+}
+
 
 def clear_channel_address(channel):
     # We must remove spaces, \n, \t and other crap from
@@ -92,8 +108,44 @@ class PyDMChannel(object):
     timestamp_slot : Slot, optional
         A function to be run when the timestamp updates
 
+    metadata_slot : Slot, optional
+        A function to be run with a dictionary of every control variable
+        that changed at once, usually one calling :meth:`apply_metadata`.
+        When the connection coalesces metadata, it replaces the separate
+        connections of the severity, write access, enum strings, unit,
+        precision, limit and timestamp slots.
+
+    Notes
+    -----
+    Channels define ``__slots__`` to keep their memory footprint small, so
+    only the attributes listed above can be set.  Setting any other
+    attribute raises an ``AttributeError``; keep extra per-channel state
+    on the widget, or in a subclass, which gets a ``__dict__`` unless it
+    defines ``__slots__`` too.
     """
 
+    # A display may hold a very large number of channels, so keep them compact
+    __slots__ = (
+        "_address",
+        "connection_slot",
+        "value_slot",
+        "severity_slot",
+        "write_access_slot",
+        "enum_strings_slot",
+        "unit_slot",
+        "prec_slot",
+        "upper_ctrl_limit_slot",
+        "lower_ctrl_limit_slot",
+        "upper_alarm_limit_slot",
+        "lower_alarm_limit_slot",
+        "upper_warning_limit_slot",
+        "lower_warning_limit_slot",
+        "timestamp_slot",
+        "metadata_slot",
+        "value_signal",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         address=None,
@@ -112,6 +164,7 @@ class PyDMChannel(object):
         lower_warning_limit_slot=None,
         value_signal=None,
         timestamp_slot=None,
+        metadata_slot=None,
     ):
         self._address = None
         self.address = address
@@ -131,6 +184,7 @@ class PyDMChannel(object):
         self.upper_warning_limit_slot = upper_warning_limit_slot
         self.lower_warning_limit_slot = lower_warning_limit_slot
         self.timestamp_slot = timestamp_slot
+        self.metadata_slot = metadata_slot
 
         self.value_signal = value_signal
 
@@ -142,6 +196,20 @@ class PyDMChannel(object):
     def address(self, address):
         self._address = clear_channel_address(address)
 
+    def apply_metadata(self, metadata):
+        """
+        Call the slot of each control variable in ``metadata``.
+
+        Parameters
+        ----------
+        metadata : dict
+            Control variable values keyed on the names of :data:`METADATA_SLOTS`.
+        """
+        for key, value in metadata.items():
+            slot = getattr(self, METADATA_SLOTS[key])
+            if slot is not None:
+                slot(value)
+
     def connect(self):
         """
         Connect a PyDMChannel to the proper PyDMPlugin
@@ -151,7 +219,8 @@ class PyDMChannel(object):
         logger.debug("Connecting %r", self.address)
         # Connect to proper PyDMPlugin
         try:
-            pydm.data_plugins.establish_connection(self)
+            with load_profiler.section("channel connection"):
+                pydm.data_plugins.establish_connection(self)
         except Exception:
             logger.exception("Unable to make proper connection for %r", self)
 
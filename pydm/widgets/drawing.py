@@ -8,6 +8,7 @@ from qtpy.QtGui import QColor, QPainter, QBrush, QPen, QPolygonF, QPixmap, QMovi
 from qtpy.QtCore import Qt, QPointF, QSize, Slot, QTimer, QRectF
 from qtpy.QtDesigner import QDesignerFormWindowInterface
 from .base import PyDMWidget, PostParentClassInitSetup
+from .image_cache import image_cache
 from pydm.utilities import is_qt_designer, find_file
 from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes
 
@@ -1018,7 +1019,9 @@ class PyDMDrawingImage(PyDMDrawing):
                 self._movie.deleteLater()
                 self._movie = None
             if not abs_path.endswith(".gif"):
-                pixmap = QPixmap(abs_path)
+                pixmap = image_cache.load(abs_path, svg=False)
+                if pixmap is None:
+                    pixmap = QPixmap()
             else:
                 self._movie = QMovie(abs_path, parent=self)
                 self._movie.setCacheMode(QMovie.CacheAll)
@@ -1086,7 +1089,11 @@ class PyDMDrawingImage(PyDMDrawing):
         super().draw_item(painter)
         x, y, w, h = self.get_bounds(maxsize=True, force_no_pen=True)
         if not isinstance(self._pixmap, QMovie):
-            _scaled = self._pixmap.scaled(int(w), int(h), self._aspect_ratio_mode, Qt.SmoothTransformation)
+            if self._movie is None:
+                # Static images are shared, so is their rendering at a given size.
+                _scaled = image_cache.scaled(self._pixmap, (w, h), self._aspect_ratio_mode)
+            else:
+                _scaled = self._pixmap.scaled(int(w), int(h), self._aspect_ratio_mode, Qt.SmoothTransformation)
             # Make sure the image is centered if smaller than the widget itself
             if w > _scaled.width():
                 logger.debug("Centering image horizontally ...")
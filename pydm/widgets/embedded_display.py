@@ -1,10 +1,14 @@
 from pyqtgraph.GraphicsScene.mouseEvents import MouseClickEvent
-from qtpy.QtWidgets import QAction, QFrame, QApplication, QLabel, QMenu, QVBoxLayout
+from qtpy.QtWidgets import QAction, QFrame, QApplication, QLabel, QMenu, QVBoxLayout, QWidget
 from qtpy.QtCore import QPoint, Qt, QSize, QTimer
+from qtpy.compat import isalive
 
+import collections
 import copy
+import json
 import os.path
 import logging
+import weakref
 from .base import PyDMPrimitiveWidget
 from .baseplot import BasePlot
 from pydm.utilities import (
@@ -14,7 +18,9 @@ from pydm.utilities import (
     macro,
     is_qt_designer,
     find_file,
+    load_profiler,
 )
+from pydm import config
 from pydm.display import load_file, ScreenTarget
 from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes
 
@@ -28,6 +34,78 @@ logger = logging.getLogger(__name__)
 _embeddedDisplayRuleProperties = {"Filename": ["filename", str]}
 
 
+class _DisplayCache(object):
+    """
+    Displays previously shown by embedded displays, least recently used
+    first, kept to show them again without loading their file.
+
+    Each embedded display keeps at most its ``cacheSize`` displays, and all
+    of them together at most ``PYDM_EMBEDDED_CACHE_WIDGETS`` widgets.  The
+    displays of embedded displays which no longer exist are evicted once
+    they are destroyed.
+    """
+
+    def __init__(self):
+        # (embedded display id, key) -> (display, widget count, connected, embedded display reference)
+        self._entries = collections.OrderedDict()
+        self.widget_count = 0
+
+    def take(self, owner, key):
+        """Remove a display from the cache, returning it along with whether it is still connected."""
+        self._evict_orphans()
+        entry = self._pop((id(owner), key))
+        if entry is None:
+            return None, False
+        return entry[0], entry[2]
+
+    def put(self, owner, key, display, connected, max_count):
+        """Keep a display, evicting the least recently used ones beyond the limits."""
+        self._evict_orphans()
+        self._evict((id(owner), key))
+        widget_count = len(display.findChildren(QWidget)) + 1
+        self._entries[(id(owner), key)] = (display, widget_count, connected, weakref.ref(owner))
+        self.widget_count += widget_count
+        self.trim(owner, max_count)
+        while self.widget_count > config.EMBEDDED_CACHE_WIDGETS and self._entries:
+            self._evict(next(iter(self._entries)))
+
+    def trim(self, owner, max_count):
+        """Evict the least recently used displays of an embedded display beyond max_count."""
+        owned = [entry_key for entry_key in self._entries if entry_key[0] == id(owner)]
+        for entry_key in owned[: max(len(owned) - max_count, 0)]:
+            self._evict(entry_key)
+
+    def _pop(self, entry_key):
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self.widget_count -= entry[1]
+        return entry
+
+    def _evict(self, entry_key):
+        entry = self._pop(entry_key)
+        if entry is not None:
+            # Destroying the widgets closes their connections
+            entry[0].deleteLater()
+
+    def owner_destroyed(self, *args):
+        """Evict the displays of an embedded display being destroyed, once it is."""
+        QTimer.singleShot(0, self._evict_orphans)
+
+    def _evict_orphans(self):
+        # The Python wrapper of an embedded display loaded from a .ui file
+        # outlives it as long as its parent display is referenced
+        orphans = [entry_key for entry_key, entry in self._entries.items() if not self._is_alive(entry[3]())]
+        for entry_key in orphans:
+            self._evict(entry_key)
+
+    @staticmethod
+    def _is_alive(owner):
+        return owner is not None and isalive(owner)
+
+
+_display_cache = _DisplayCache()
+
+
 class PyDMEmbeddedDisplay(QFrame, PyDMPrimitiveWidget):
     """
     A QFrame capable of rendering a PyDM Display
@@ -56,6 +134,12 @@ class PyDMEmbeddedDisplay(QFrame, PyDMPrimitiveWidget):
         self._load_error_timer = None
         self._load_error = None
         self._follow_symlinks = False
+        self._cache_size = 0
+        self._keep_cached_connected = False
+        # Cache key of the display last opened and of the one embedded
+        self._opened = (None, None)
+        self._embedded_key = None
+        self._evicts_cache_when_destroyed = False
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
         self.open_in_new_window_action = QAction("Open in New Window", self)
@@ -262,13 +346,21 @@ class PyDMEmbeddedDisplay(QFrame, PyDMPrimitiveWidget):
                     parent_file_path = os.path.realpath(parent_file_path)
                 base_path = os.path.dirname(parent_file_path)
 
-            fname = find_file(
-                self.filename,
-                base_path=base_path,
-                raise_if_not_found=True,
-                subdir_scan_enabled=self._recursive_display_search,
-            )
-            w = load_file(fname, macros=self.parsed_macros(), target=None)
+            with load_profiler.within(parent_display):
+                fname = find_file(
+                    self.filename,
+                    base_path=base_path,
+                    raise_if_not_found=True,
+                    subdir_scan_enabled=self._recursive_display_search,
+                )
+                macros = self.parsed_macros()
+                key = (fname, json.dumps(macros, sort_keys=True, default=str))
+                w, connected = _display_cache.take(self, key)
+                if w is None:
+                    w = load_file(fname, macros=macros, target=None)
+                elif not connected:
+                    establish_widget_connections(w)
+            self._opened = (w, key)
             self._needs_load = False
             self.clear_error_text()
             return w
@@ -317,9 +409,16 @@ class PyDMEmbeddedDisplay(QFrame, PyDMPrimitiveWidget):
             return
         if self._embedded_widget is not None:
             self.layout.removeWidget(self._embedded_widget)
-            self._embedded_widget.deleteLater()
+            if self._cache_size > 0 and self._embedded_key is not None:
+                self._cache_embedded_widget()
+            else:
+                self._embedded_widget.deleteLater()
             self._embedded_widget = None
+            self._embedded_key = None
         if new_widget is not None:
+            opened_widget, opened_key = self._opened
+            self._embedded_key = opened_key if opened_widget is new_widget else None
+            self._opened = (None, None)
             self._embedded_widget = new_widget
             self._embedded_widget.setParent(self)
             self.layout.addWidget(self._embedded_widget)
@@ -327,6 +426,18 @@ class PyDMEmbeddedDisplay(QFrame, PyDMPrimitiveWidget):
             self._embedded_widget.show()
             self._is_connected = True
 
+    def _cache_embedded_widget(self):
+        widget = self._embedded_widget
+        widget.hide()
+        widget.setParent(None)
+        connected = self._is_connected and self._keep_cached_connected
+        if self._is_connected and not connected:
+            close_widget_connections(widget)
+        if not self._evicts_cache_when_destroyed:
+            self._evicts_cache_when_destroyed = True
+            self.destroyed.connect(_display_cache.owner_destroyed)
+        _display_cache.put(self, self._embedded_key, widget, connected, self._cache_size)
+
     def connect(self):
         """
         Establish the connection between the embedded widget and
@@ -422,6 +533,60 @@ class PyDMEmbeddedDisplay(QFrame, PyDMPrimitiveWidget):
 
     followSymlinks = Property(bool, readFollowSymlinks, setFollowSymlinks)
 
+    def readCacheSize(self) -> int:
+        """
+        The number of previously shown displays to keep, so that switching
+        back to one of them, by changing the filename or macros back, shows
+        it again without loading its file.  A value of 0 disables the cache.
+
+        Displays are identified by their file and macros.  The least recently
+        shown displays are discarded beyond this number, and whenever the
+        displays kept by all embedded displays hold more widgets than the
+        PYDM_EMBEDDED_CACHE_WIDGETS environment variable allows.
+
+        Returns
+        -------
+        int
+        """
+        return self._cache_size
+
+    def setCacheSize(self, cache_size: int) -> None:
+        """
+        The number of previously shown displays to keep.
+
+        Parameters
+        ----------
+        cache_size : int
+        """
+        self._cache_size = max(int(cache_size), 0)
+        _display_cache.trim(self, self._cache_size)
+
+    cacheSize = Property(int, readCacheSize, setCacheSize)
+
+    def readKeepCachedConnected(self) -> bool:
+        """
+        If True, the displays kept by the cache stay connected to their
+        channels, so that they show current values right away when shown
+        again.  If False (default), they are disconnected until then.
+
+        Returns
+        -------
+        bool
+        """
+        return self._keep_cached_connected
+
+    def setKeepCachedConnected(self, keep_connected: bool) -> None:
+        """
+        Whether the displays kept by the cache stay connected to their channels.
+
+        Parameters
+        ----------
+        keep_connected : bool
+        """
+        self._keep_cached_connected = keep_connected
+
+    keepCachedConnected = Property(bool, readKeepCachedConnected, setKeepCachedConnected)
+
     def showEvent(self, e):
         """
         Show events are sent to widgets that become visible on the screen.
@@ -0,0 +1,167 @@
+import os
+import logging
+from collections import OrderedDict
+from typing import Optional, Tuple, Union
+
+from qtpy.QtCore import Qt, QSize, QRectF, qInstallMessageHandler
+from qtpy.QtGui import QPainter, QPixmap
+from qtpy.QtSvg import QSvgRenderer
+
+logger = logging.getLogger(__name__)
+
+Image = Union[QPixmap, QSvgRenderer]
+
+
+def _silent_message_handler(msg_type, *args):
+    # Intentionally suppress all qt messages.  Make sure not to leave this handler installed.
+    pass
+
+
+class ImageCache:
+    """
+    Process-wide cache of decoded images shared by the image based widgets.
+
+    Decoded images are keyed on the absolute file path and invalidated when
+    the file's modification time or size changes, so that many widgets
+    showing the same file share a single QPixmap or QSvgRenderer and the file
+    is only read and decoded once.  Scaled rasterizations of those images
+    are kept in a bounded least-recently-used cache keyed on the image and
+    the requested size, so repainting at an unchanged size does not rescale
+    or re-render anything.
+
+    Parameters
+    ----------
+    max_scaled : int, optional
+        Maximum number of scaled rasterizations to keep around.
+    """
+
+    def __init__(self, max_scaled: int = 256):
+        self.max_scaled = max_scaled
+        self._images = {}
+        self._scaled = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        """Drop every cached image and rasterization."""
+        self._images.clear()
+        self._scaled.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: Optional[str], svg: bool = True) -> Optional[Image]:
+        """
+        Return the decoded image for ``path``, reading the file only when it
+        is not cached yet or has changed on disk since it was cached.
+
+        Parameters
+        ----------
+        path : str or None
+            Path to the image file.
+        svg : bool, optional
+            Whether to try loading the file as SVG before falling back to a
+            raster image.  SVG has to be tried first, otherwise QPixmap will
+            happily load the SVG and turn it into a raster image.
+
+        Returns
+        -------
+        QPixmap, QSvgRenderer or None
+            The shared decoded image, or None if the file could not be loaded.
+            Callers must not modify the returned object.
+        """
+        if not path:
+            return None
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._images.pop((path, svg), None)
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._images.get((path, svg))
+        if cached is not None and cached[0] == signature:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        image = self._decode(path, svg)
+        self._images[(path, svg)] = (signature, image)
+        return image
+
+    @staticmethod
+    def _decode(path: str, svg: bool) -> Optional[Image]:
+        if svg:
+            # Qt prints a warning any time SVG loading fails, which is
+            # expected for every raster file, so silence it while we probe.
+            qInstallMessageHandler(_silent_message_handler)
+            try:
+                renderer = QSvgRenderer()
+                if renderer.load(path):
+                    return renderer
+            finally:
+                qInstallMessageHandler(None)
+        image = QPixmap(path)
+        if image.isNull():
+            return None
+        return image
+
+    def scaled(
+        self,
+        image: Image,
+        size: Union[QSize, Tuple[int, int]],
+        mode: Qt.AspectRatioMode = Qt.KeepAspectRatio,
+        device_pixel_ratio: float = 1.0,
+    ) -> QPixmap:
+        """
+        Return ``image`` rasterized to fit ``size`` using the aspect ratio
+        ``mode``, reusing a previous rasterization if there is one.
+
+        Parameters
+        ----------
+        image : QPixmap or QSvgRenderer
+            The image to rasterize, usually one returned by :meth:`load`.
+        size : QSize or tuple
+            The target width and height in pixels.
+        mode : Qt.AspectRatioMode, optional
+            How the image aspect ratio is handled when scaling.
+        device_pixel_ratio : float, optional
+            The device pixel ratio of the paint device the result is drawn
+            on.  The image is rasterized at ``size`` times this ratio, so that
+            it stays sharp on high density screens, and the returned pixmap
+            carries the ratio so that it is drawn at ``size``.
+
+        Returns
+        -------
+        QPixmap
+        """
+        if isinstance(size, QSize):
+            size = (size.width(), size.height())
+        ratio = float(device_pixel_ratio)
+        width, height = int(size[0] * ratio), int(size[1] * ratio)
+        if isinstance(image, QPixmap):
+            key = ("pixmap", image.cacheKey(), width, height, int(mode), ratio)
+        else:
+            key = ("svg", id(image), width, height, int(mode), ratio)
+        scaled = self._scaled.get(key)
+        if scaled is not None:
+            self._scaled.move_to_end(key)
+            return scaled[1]
+        if isinstance(image, QPixmap):
+            scaled = image.scaled(width, height, mode, Qt.SmoothTransformation)
+        else:
+            draw_size = image.defaultSize()
+            draw_size.scale(width, height, mode)
+            scaled = QPixmap(max(draw_size.width(), 1), max(draw_size.height(), 1))
+            scaled.fill(Qt.transparent)
+            painter = QPainter(scaled)
+            image.render(painter, QRectF(0.0, 0.0, scaled.width(), scaled.height()))
+            painter.end()
+        scaled.setDevicePixelRatio(ratio)
+        # Keep a reference to the source so that its id/cacheKey cannot be
+        # reused by another image while this entry is alive.
+        self._scaled[key] = (image, scaled)
+        while len(self._scaled) > self.max_scaled:
+            self._scaled.popitem(last=False)
+        return scaled
+
+
+image_cache = ImageCache()
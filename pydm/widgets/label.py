@@ -201,24 +201,36 @@ class PyDMLabel(*_PyDMLabelBases):
         if isinstance(new_value, str_types):
             if self._show_units and self._unit != "":
                 new_value = "{} {}".format(new_value, self._unit)
-            self.setText(new_value)
+            self.set_text_if_changed(new_value)
             return
         # If the value is an enum, display the appropriate enum string for
         # the value.
         if self.enum_strings is not None and isinstance(new_value, int):
             try:
-                self.setText(self.enum_strings[new_value])
+                self.set_text_if_changed(self.enum_strings[new_value])
             except IndexError:
-                self.setText("**INVALID**")
+                self.set_text_if_changed("**INVALID**")
             return
         # If the value is a number (float or int), display it using a
         # format string if necessary.
         if isinstance(new_value, (int, float)):
-            self.setText(self.format_string.format(new_value))
+            self.set_text_if_changed(self.format_value(new_value))
             return
         # If you made it this far, just turn whatever the heck the value
         # is into a string and display it.
-        self.setText(str(new_value))
+        self.set_text_if_changed(str(new_value))
+
+    def set_text_if_changed(self, text):
+        """
+        Set the text of the label, skipping the relayout and repaint caused
+        by setText if the label already shows this text.
+
+        Parameters
+        ----------
+        text : str
+        """
+        if text != self.text():
+            self.setText(text)
 
     @only_if_channel_set
     def check_enable_state(self):
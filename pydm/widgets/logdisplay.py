@@ -1,9 +1,9 @@
 import logging
 import functools
 
-from collections import OrderedDict
+from collections import OrderedDict, deque
 
-from qtpy.QtCore import QObject, Slot, Signal, QSize
+from qtpy.QtCore import QObject, Slot, Signal, QSize, QTimer
 from qtpy.QtWidgets import (
     QWidget,
     QPlainTextEdit,
@@ -59,30 +59,101 @@ class GuiHandler(QObject, logging.Handler):
         # Publish log message via Signal
         ui_handler.message.connect(mySlot)
 
+    If ``buffer_size`` is set, records are instead collected in a ring buffer
+    holding at most that many records, and every ``flush_interval``
+    milliseconds all buffered messages are published at once through the
+    ``messages`` Signal.  Records that do not fit in the buffer between two
+    flushes are dropped, oldest first, and counted in ``dropped``.  This keeps
+    a burst of thousands of records per second from flooding the event loop.
+
     Parameters
     ----------
     level: int
         Level of Handler
 
     parent: QObject, optional
+
+    buffer_size: int, optional
+        Maximum number of records buffered between flushes. If 0, each
+        record is published as soon as it is received.
+
+    flush_interval: int, optional
+        Time in milliseconds between flushes of the buffer.
     """
 
     message = Signal(str)
+    messages = Signal(list)
 
-    def __init__(self, level=logging.NOTSET, parent=None):
+    def __init__(self, level=logging.NOTSET, parent=None, buffer_size=0, flush_interval=100):
         logging.Handler.__init__(self, level=level)
         QObject.__init__(self, parent)
+        self._buffer = None
+        self._pending_dropped = 0
+        self.dropped = 0
+        self._flush_timer = QTimer(self)
+        self._flush_timer.timeout.connect(self.flush)
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+
+    @property
+    def buffer_size(self):
+        """Maximum number of records buffered between flushes, 0 if unbuffered."""
+        return self._buffer.maxlen if self._buffer is not None else 0
+
+    @buffer_size.setter
+    def buffer_size(self, size):
+        self.flush()
+        with self.lock:
+            self._buffer = deque(maxlen=size) if size > 0 else None
+        if self._buffer is not None:
+            self._flush_timer.start()
+        else:
+            self._flush_timer.stop()
+
+    @property
+    def flush_interval(self):
+        """Time in milliseconds between flushes of the buffer."""
+        return self._flush_timer.interval()
+
+    @flush_interval.setter
+    def flush_interval(self, interval):
+        self._flush_timer.setInterval(interval)
 
     def emit(self, record):
         """Emit formatted log messages when received but only if level is set."""
         # Avoid garbage to be presented when master log is running with DEBUG.
         if self.level == logging.NOTSET:
             return
+        if self._buffer is not None:
+            # Called with the handler lock held, so this is safe from any thread.
+            # Formatting is deferred to flush so dropped records cost nothing.
+            if len(self._buffer) == self._buffer.maxlen:
+                self._pending_dropped += 1
+            self._buffer.append(record)
+            return
         try:
             self.message.emit(self.format(record))
         except RuntimeError:
             logger.debug("Handler was destroyed at the C++ level.")
 
+    def flush(self):
+        """Publish all buffered messages through the ``messages`` Signal."""
+        with self.lock:
+            if not self._buffer and not self._pending_dropped:
+                return
+            records = list(self._buffer)
+            self._buffer.clear()
+            dropped = self._pending_dropped
+            self._pending_dropped = 0
+        self.dropped += dropped
+        lines = [self.format(record) for record in records]
+        if dropped:
+            lines.insert(0, "... {} log messages dropped ...".format(dropped))
+        try:
+            self.messages.emit(lines)
+        except RuntimeError:
+            logger.debug("Handler was destroyed at the C++ level.")
+
 
 class LogLevels(object):
     NOTSET = 0
@@ -195,6 +266,9 @@ class PyDMLogDisplay(*_PyDMLogDisplayBases):
     terminator = "\n"
     default_format = "%(asctime)s %(message)s"
     default_level = logging.INFO
+    default_max_lines = 10000
+    default_buffer_size = 1000
+    default_flush_interval = 100
 
     def __init__(self, parent=None, logname=None, level=logging.NOTSET):
         QWidget.__init__(self, parent)
@@ -203,6 +277,7 @@ class PyDMLogDisplay(*_PyDMLogDisplayBases):
         self.combo = QComboBox(parent=self)
         self.text = QPlainTextEdit(parent=self)
         self.text.setReadOnly(True)
+        self.text.setMaximumBlockCount(self.default_max_lines)
         self.clear_btn = QPushButton("Clear", parent=self)
         # Create layout
         layout = QVBoxLayout()
@@ -220,9 +295,15 @@ class PyDMLogDisplay(*_PyDMLogDisplayBases):
         # Allow QPushButton to clear log text
         self.clear_btn.clicked.connect(self.clear)
         # Create a handler with the default format
-        self.handler = GuiHandler(level=level, parent=self)
+        self.handler = GuiHandler(
+            level=level,
+            parent=self,
+            buffer_size=self.default_buffer_size,
+            flush_interval=self.default_flush_interval,
+        )
         self.logFormat = self.default_format
         self.handler.message.connect(self.write)
+        self.handler.messages.connect(self.write_messages)
         # Create logger. Either as a root or given logname
         self.log = None
         self.level = None
@@ -275,6 +356,33 @@ class PyDMLogDisplay(*_PyDMLogDisplayBases):
 
     logFormat = Property(str, readLogFormat, setLogFormat)
 
+    def readMaxLines(self) -> int:
+        """Maximum number of lines kept in the display, 0 for no limit"""
+        return self.text.maximumBlockCount()
+
+    def setMaxLines(self, lines) -> None:
+        self.text.setMaximumBlockCount(max(0, lines))
+
+    maxLines = Property(int, readMaxLines, setMaxLines)
+
+    def readBufferSize(self) -> int:
+        """Maximum number of messages buffered between two updates of the display, 0 to show each at once"""
+        return self.handler.buffer_size
+
+    def setBufferSize(self, size) -> None:
+        self.handler.buffer_size = max(0, size)
+
+    bufferSize = Property(int, readBufferSize, setBufferSize)
+
+    def readFlushInterval(self) -> int:
+        """Time in milliseconds between updates of the display with buffered messages"""
+        return self.handler.flush_interval
+
+    def setFlushInterval(self, interval) -> None:
+        self.handler.flush_interval = max(1, interval)
+
+    flushInterval = Property(int, readFlushInterval, setFlushInterval)
+
     @Slot(str)
     def write(self, message):
         """Write a message to the log display"""
@@ -284,6 +392,12 @@ class PyDMLogDisplay(*_PyDMLogDisplayBases):
         for msg in message.split(self.terminator):
             self.text.appendPlainText(msg)
 
+    @Slot(list)
+    def write_messages(self, messages):
+        """Write a batch of messages to the log display with a single insert"""
+        if messages:
+            self.text.appendPlainText(self.terminator.join(messages))
+
     @Slot()
     def clear(self):
         """Clear the text area."""
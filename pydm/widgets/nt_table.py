@@ -2,6 +2,7 @@ import logging
 import numpy as np
 from operator import itemgetter
 from pydm.widgets.base import PyDMWidget, PyDMWritableWidget
+from pydm.widgets.waveformtable import index_ranges
 from qtpy import QtCore, QtWidgets
 from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes
 
@@ -168,6 +169,215 @@ class PythonTableModel(QtCore.QAbstractTableModel):
         self.layoutChanged.emit()
 
 
+class ColumnarTableModel(QtCore.QAbstractTableModel):
+    """
+    A table model that serves its data straight from a list of columns,
+    such as the NumPy arrays delivered for an NTTable, without building
+    Python row tuples.
+
+    Sorting is done through an argsort permutation over the sort column,
+    which is cached until that column changes.  When new columns with the
+    same shape are set, each column is compared with the previous one and
+    dataChanged is only emitted for the cells that changed.
+
+    Parameters
+    ----------
+    column_names : list
+        The header labels of the columns.
+    columns : list, optional
+        The initial data, one sequence per column.
+    parent : QObject, optional
+        The parent of this model, passed to edit_method.
+    edit_method : callable, optional
+        Called as edit_method(parent, row, column, value) when a cell is
+        edited, where row is the row in the original (unsorted) data.
+    can_edit_method : callable, optional
+        Called with a cell's value to decide if the cell is editable.
+    """
+
+    # Above this many separate changed ranges in a column a single bounding
+    # range is emitted instead.
+    max_changed_ranges = 32
+
+    def __init__(self, column_names, columns=None, parent=None, edit_method=None, can_edit_method=None):
+        super().__init__(parent)
+        self.parent = parent
+        self._column_names = list(column_names)
+        self._columns = []
+        self._row_count = 0
+        self._sort_column = None
+        self._sort_reversed = False
+        # Maps view rows to rows in self._columns, None when unsorted
+        self._permutation = None
+        self._inverse_permutation = None
+        self._argsort_cache = {}
+        self.edit_method = edit_method
+        self.can_edit_method = can_edit_method
+        self.set_columns(columns if columns is not None else [])
+
+    @property
+    def columns(self):
+        return self._columns
+
+    def set_columns(self, columns):
+        """
+        Replace the data of the model.
+
+        Parameters
+        ----------
+        columns : list
+            One sequence per column.  Columns longer than the shortest one
+            are truncated in the view.
+        """
+        columns = list(columns)
+        row_count = min((len(column) for column in columns), default=0)
+        old_columns = self._columns
+        if row_count != self._row_count or len(columns) != len(old_columns):
+            self.beginResetModel()
+            self._columns = columns
+            self._row_count = row_count
+            self._argsort_cache.clear()
+            self._update_permutation()
+            self.endResetModel()
+            return
+
+        self._columns = columns
+        changed = {}
+        for col, (old_column, new_column) in enumerate(zip(old_columns, columns)):
+            rows = self._changed_rows(old_column, new_column)
+            if len(rows):
+                changed[col] = rows
+                self._argsort_cache.pop(col, None)
+        if not changed:
+            return
+
+        if self._sort_column in changed:
+            # The sort order itself may have changed, so the whole layout is refreshed.
+            self.layoutAboutToBeChanged.emit()
+            self._update_permutation()
+            self.layoutChanged.emit()
+            return
+
+        for col, rows in changed.items():
+            if self._inverse_permutation is not None:
+                rows = np.sort(self._inverse_permutation[rows])
+            for first_row, last_row in index_ranges(rows, self.max_changed_ranges):
+                self.dataChanged.emit(self.index(first_row, col), self.index(last_row, col))
+
+    def _changed_rows(self, old_column, new_column):
+        """The rows, in data order, whose values differ between two columns."""
+        all_rows = np.arange(self._row_count)
+        if old_column is new_column:
+            return all_rows
+        try:
+            old_values = np.asarray(old_column)[: self._row_count]
+            new_values = np.asarray(new_column)[: self._row_count]
+            if old_values.shape != new_values.shape:
+                return all_rows
+            return np.flatnonzero(old_values != new_values)
+        except (TypeError, ValueError):
+            return all_rows
+
+    def _update_permutation(self):
+        self._permutation = None
+        self._inverse_permutation = None
+        if self._sort_column is None or self._sort_column >= len(self._columns):
+            return
+        ascending = self._argsort_cache.get(self._sort_column)
+        if ascending is None:
+            try:
+                values = np.asarray(self._columns[self._sort_column])[: self._row_count]
+                ascending = np.argsort(values, kind="stable")
+            except TypeError:
+                logger.exception("Unable to sort NTTable column %s.", self._sort_column)
+                return
+            self._argsort_cache[self._sort_column] = ascending
+        permutation = ascending[::-1] if self._sort_reversed else ascending
+        inverse = np.empty_like(permutation)
+        inverse[permutation] = np.arange(len(permutation))
+        self._permutation = permutation
+        self._inverse_permutation = inverse
+
+    def source_row(self, row):
+        """The row in the model's columns that is shown at view row."""
+        if self._permutation is None:
+            return row
+        return int(self._permutation[row])
+
+    # QAbstractItemModel Implementation
+    def clear(self):
+        self.set_columns([])
+
+    def flags(self, index):
+        f = QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled
+        if self.edit_method is not None:
+            editable = True
+            if self.can_edit_method is not None:
+                editable = self.can_edit_method(self._columns[index.column()][self.source_row(index.row())])
+            if editable:
+                f = f | QtCore.Qt.ItemIsEditable
+        return f
+
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return self._row_count
+
+    def columnCount(self, parent=None):
+        return len(self._column_names)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if index.row() >= self.rowCount():
+            return None
+        if index.column() >= self.columnCount():
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            try:
+                item = str(self._columns[index.column()][self.source_row(index.row())])
+            except IndexError:
+                item = ""
+            return item
+        else:
+            return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if self.edit_method is None:
+            return False
+        if role != QtCore.Qt.EditRole:
+            return False
+        if not index.isValid():
+            return False
+        if index.row() >= self.rowCount():
+            return False
+        if index.column() >= self.columnCount():
+            return False
+
+        success = self.edit_method(self.parent, self.source_row(index.row()), index.column(), value)
+
+        if success:
+            self.dataChanged.emit(index, index)
+        return success
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole:
+            return super().headerData(section, orientation, role)
+        if orientation == QtCore.Qt.Horizontal and section < self.columnCount():
+            return str(self._column_names[section])
+        elif orientation == QtCore.Qt.Vertical and section < self.rowCount():
+            return section
+
+    def sort(self, col, order=QtCore.Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column = col
+        self._sort_reversed = order == QtCore.Qt.AscendingOrder or order == 0
+        self._update_permutation()
+        self.layoutChanged.emit()
+
+    # End QAbstractItemModel implementation.
+
+
 class PyDMNTTable(QtWidgets.QWidget, PyDMWritableWidget):
     """
     The PyDMNTTable is a table widget used to display PVA NTTable data.
@@ -246,21 +456,20 @@ class PyDMNTTable(QtWidgets.QWidget, PyDMWritableWidget):
         super().value_changed(data)
 
         labels = data.get("labels", None)
-        values = data.get("value", {})
-
-        if not values:
-            values = data.values()
 
         if labels is None or len(labels) == 0:
             labels = data.keys()
             labels = list(labels)
 
+        columns = [v for k, v in data.items() if k != "labels"]
         try:
-            values = list(zip(*[v for k, v in data.items() if k != "labels"]))
+            for column in columns:
+                len(column)
         except TypeError:
             logger.exception("NTTable value items must be iterables.")
+            return
 
-        self._table_values = values
+        self._table_values = columns
 
         if labels != self._table_labels:
             if not self.readOnly:
@@ -269,10 +478,10 @@ class PyDMNTTable(QtWidgets.QWidget, PyDMWritableWidget):
                 self.edit_method = None
 
             self._table_labels = labels
-            self._model = PythonTableModel(labels, initial_list=values, parent=self, edit_method=self.edit_method)
+            self._model = ColumnarTableModel(labels, columns=columns, parent=self, edit_method=self.edit_method)
             self._table.setModel(self._model)
         else:
-            self._model.list = values
+            self._model.set_columns(columns)
 
     def send_table(self, row, column, value):
         """
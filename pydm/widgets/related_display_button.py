@@ -5,14 +5,15 @@ import warnings
 from functools import partial
 import hashlib
 from qtpy.QtWidgets import QPushButton, QMenu, QAction, QMessageBox, QInputDialog, QLineEdit, QWidget, QStyle
-from qtpy.QtGui import QCursor, QIcon, QMouseEvent, QColor
-from qtpy.QtCore import Slot, Qt, QSize, QPoint
+from qtpy.QtGui import QCursor, QIcon, QMouseEvent, QColor, QShowEvent
+from qtpy.QtCore import Slot, Qt, QSize, QPoint, QEvent
 from qtpy import QtDesigner
 from .base import PyDMWidget, only_if_channel_set, PostParentClassInitSetup
 from pydm.utilities import IconFont, find_file, is_pydm_app
 from pydm.utilities.macro import parse_macro_string
 from pydm.utilities.stylesheet import merge_widget_stylesheet
-from pydm.display import load_file, ScreenTarget
+from pydm import config
+from pydm.display import load_file, prefetch_ui_file, ScreenTarget
 from typing import Optional, List
 from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes
 
@@ -595,6 +596,46 @@ class PyDMRelatedDisplayButton(QPushButton, PyDMWidget):
             except Exception:
                 logger.exception("Failed to open display.")
 
+    def _parent_display_context(self):
+        """The directory and a copy of the macros of the display containing this button."""
+        parent_display = self.find_parent_display()
+        base_path = ""
+        macros = {}
+        if parent_display:
+            parent_file_path = parent_display.loaded_file()
+            if self._follow_symlinks:
+                parent_file_path = os.path.realpath(parent_file_path)
+            base_path = os.path.dirname(parent_file_path)
+            macros = copy.copy(parent_display.macros())
+        return base_path, macros
+
+    def prefetch_displays(self) -> None:
+        """
+        Prepare the displays opened by this button on worker threads, so
+        that opening them only has to build their widgets.  Called when the
+        button is shown or hovered if ``PYDM_PREFETCH_WORKERS`` is set, does
+        nothing for displays already prepared, nor for displays opened in a
+        new process, which would not use them.
+        """
+        if config.PREFETCH_WORKERS <= 0 or (self._open_in_new_window and is_pydm_app()):
+            return
+        base_path, macros = self._parent_display_context()
+        for item in self._get_items():
+            item_macros = copy.copy(macros)
+            try:
+                item_macros.update(parse_macro_string(item["macros"]))
+            except (TypeError, ValueError):
+                continue
+            prefetch_ui_file(item["filename"], base_path, item_macros, self._recursive_display_search)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        self.prefetch_displays()
+
+    def enterEvent(self, event: QEvent) -> None:
+        super().enterEvent(event)
+        self.prefetch_displays()
+
     @Slot()
     def open_display(self, filename, macro_string="", target=None):
         """
@@ -615,16 +656,7 @@ class PyDMRelatedDisplayButton(QPushButton, PyDMWidget):
         if not self.validate_password():
             return None
 
-        parent_display = self.find_parent_display()
-        base_path = ""
-        macros = {}
-        if parent_display:
-            parent_file_path = parent_display.loaded_file()
-            if self._follow_symlinks:
-                parent_file_path = os.path.realpath(parent_file_path)
-            base_path = os.path.dirname(parent_file_path)
-            macros = copy.copy(parent_display.macros())
-
+        base_path, macros = self._parent_display_context()
         fname = find_file(
             filename, base_path=base_path, raise_if_not_found=True, subdir_scan_enabled=self._recursive_display_search
         )
@@ -6,7 +6,7 @@ import weakref
 from qtpy.QtCore import Qt, QThread, QMutex, Signal, Slot
 from qtpy.QtWidgets import QWidget, QApplication
 from qtpy.QtGui import QColor, QBrush
-from pydm.utilities import is_qt_designer
+from pydm.utilities import is_qt_designer, load_profiler
 from .channel import PyDMChannel
 
 import numpy as np
@@ -93,7 +93,8 @@ class RulesDispatcher(object):
         -------
         None
         """
-        self.rules_engine.register(widget, rules)
+        with load_profiler.section("rules registration"):
+            self.rules_engine.register(widget, rules)
 
     def unregister(self, widget):
         """
@@ -507,7 +507,7 @@ class PyDMSlider(*_PyDMSliderBases):
             if slider_value != self.value:
                 self.remap_flag = True
                 self.value_changed(slider_value)
-                self.send_value_signal[float].emit(self.value)
+                self.send_coalesced_value(self.value, float)
         except ValueError:
             logger.error("the given value is not a valid type or outside of the slider range")
 
@@ -856,6 +856,18 @@ class PyDMSlider(*_PyDMSliderBases):
         super().write_access_changed(new_write_access)
         self.set_enable_state()
 
+    def alarm_style_children(self):
+        """
+        The value label is styled by the slider's alarm severity.
+
+        Returns
+        -------
+        list
+        """
+        if hasattr(self, "value_label"):
+            return [self.value_label]
+        return []
+
     def value_changed(self, new_val):
         """
         Callback invoked when the Channel value is changed.
@@ -958,6 +970,7 @@ class PyDMSlider(*_PyDMSliderBases):
         """
         Method invoked when the slider is released
         """
+        self.flush_pending_write()
         self.sliderReleased.emit()
 
     @Slot(int)
@@ -979,7 +992,7 @@ class PyDMSlider(*_PyDMSliderBases):
             try:
                 self.value = self._slider_position_to_value_map[val]
 
-                self.send_value_signal[float].emit(self.value)
+                self.send_coalesced_value(self.value, float)
             except IndexError:
                 pass
 
@@ -1000,6 +1013,19 @@ class PyDMSlider(*_PyDMSliderBases):
 
     tracking = Property(bool, readTracking, setTracking)
 
+    def readMaxWriteRate(self) -> float:
+        """
+        Most values per second written to the channel while the slider is
+        dragged.  Intermediate values are dropped, the last one is always
+        written.  0 writes every value.
+        """
+        return self._max_write_rate
+
+    def setMaxWriteRate(self, rate: float) -> None:
+        self._set_max_write_rate(rate)
+
+    maxWriteRate = Property(float, readMaxWriteRate, setMaxWriteRate)
+
     def hasTracking(self):
         """
         An alternative function to get the tracking property, to match what
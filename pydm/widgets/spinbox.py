@@ -172,7 +172,7 @@ class PyDMSpinbox(QDoubleSpinBox, TextFormatter, PyDMWritableWidget):
         """
         value = QDoubleSpinBox.value(self)
         if not self.valueBeingSet:
-            self.send_value_signal[float].emit(value)
+            self.send_coalesced_value(value, float)
 
     def readUserDefinedLimits(self) -> bool:
         """
@@ -356,3 +356,28 @@ class PyDMSpinbox(QDoubleSpinBox, TextFormatter, PyDMWritableWidget):
         self._write_on_press = val
 
     writeOnPress = Property(bool, readWriteOnPress, setWriteOnPress)
+
+    def readMaxWriteRate(self) -> float:
+        """
+        Most values per second written to the channel while the value is
+        continuously stepped, e.g. by holding an arrow.  Intermediate values
+        are dropped, the last one is always written.  0 writes every value.
+
+        Returns
+        -------
+        float
+        """
+        return self._max_write_rate
+
+    def setMaxWriteRate(self, rate: float) -> None:
+        """
+        Most values per second written to the channel while the value is
+        continuously stepped, e.g. by holding an arrow.
+
+        Parameters
+        ----------
+        rate : float
+        """
+        self._set_max_write_rate(rate)
+
+    maxWriteRate = Property(float, readMaxWriteRate, setMaxWriteRate)
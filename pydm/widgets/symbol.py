@@ -1,12 +1,14 @@
 import os
 import json
 import logging
+import warnings
 from qtpy.QtWidgets import QApplication, QWidget, QStyle, QStyleOption
 from qtpy.QtGui import QPainter, QPixmap
-from qtpy.QtCore import Qt, QSize, QSizeF, QRectF, qInstallMessageHandler
+from qtpy.QtCore import Qt, QSize, QSizeF, QRectF
 from qtpy.QtSvg import QSvgRenderer
 from pydm.utilities import find_file
 from .base import PyDMWidget, PostParentClassInitSetup
+from .image_cache import image_cache
 from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes
 
 if ACTIVE_QT_WRAPPER == QtWrapperTypes.PYSIDE6:
@@ -41,6 +43,7 @@ class PyDMSymbol(QWidget, PyDMWidget):
         self._current_key = 0
         self._state_images_string = ""
         self._state_images = {}  # Keyed on state values (ints), values are (filename, qpixmap or qsvgrenderer) tuples.
+        self._animated_renderers = []
         self._aspect_ratio_mode = Qt.KeepAspectRatio
         self._sizeHint = self.minimumSizeHint()
         self._painter = QPainter()
@@ -99,6 +102,11 @@ class PyDMSymbol(QWidget, PyDMWidget):
         new_files : str
         """
         self._state_images_string = str(new_files)
+        # The renderers are shared with other widgets, only stop listening to
+        # the ones of the previous files.
+        for renderer in self._animated_renderers:
+            renderer.repaintNeeded.disconnect(self.update)
+        self._animated_renderers = []
         try:
             new_file_dict = json.loads(self._state_images_string)
         except Exception:
@@ -110,32 +118,25 @@ class PyDMSymbol(QWidget, PyDMWidget):
         if parent_display:
             base_path = os.path.dirname(parent_display.loaded_file())
 
+        # Symbols commonly map several states onto the same few files, so
+        # resolve each distinct filename once and share the decoded images.
+        resolved = {}
         for state, filename in new_file_dict.items():
-            file_path = find_file(filename, base_path=base_path)
-            # First, lets try SVG.  We have to try SVG first, otherwise
-            # QPixmap will happily load the SVG and turn it into a raster image.
-            # Really annoying: We have to try to load the file as SVG,
-            # and we expect it will fail often (because many images aren't SVG).
-            # Qt prints a warning message to stdout any time SVG loading fails.
-            # So we have to temporarily silence Qt warning messages here.
-            qInstallMessageHandler(self.qt_message_handler)
-            svg = QSvgRenderer()
-            svg.repaintNeeded.connect(self.update)
-            if file_path is not None and svg.load(file_path):
-                self._state_images[int(state)] = (filename, svg)
-                self._sizeHint = self._sizeHint.expandedTo(svg.defaultSize())
-                qInstallMessageHandler(None)
-                continue
-            qInstallMessageHandler(None)
-            # SVG didn't work, lets try QPixmap
-            image = QPixmap(file_path) if file_path is not None else QPixmap()
-            if not image.isNull():
-                self._state_images[int(state)] = (filename, image)
+            if filename not in resolved:
+                file_path = find_file(filename, base_path=base_path)
+                resolved[filename] = image_cache.load(file_path)
+            image = resolved[filename]
+            if image is None:
+                # If we get this far, the file specified could not be loaded at all.
+                logger.error("Could not load image: {}".format(filename))
+            elif isinstance(image, QSvgRenderer):
+                if image.animated() and image not in self._animated_renderers:
+                    image.repaintNeeded.connect(self.update)
+                    self._animated_renderers.append(image)
+                self._sizeHint = self._sizeHint.expandedTo(image.defaultSize())
+            else:
                 self._sizeHint = self._sizeHint.expandedTo(image.size())
-                continue
-            # If we get this far, the file specified could not be loaded at all.
-            logger.error("Could not load image: {}".format(filename))
-            self._state_images[int(state)] = (filename, None)
+            self._state_images[int(state)] = (filename, image)
 
     imageFiles = Property(str, readImageFiles, setImageFiles)
 
@@ -250,6 +251,12 @@ class PyDMSymbol(QWidget, PyDMWidget):
                 scale = (sf, sf)
             self._painter.scale(scale[0], scale[1])
             self._painter.drawPixmap(event.rect().x(), event.rect().y(), image_to_draw)
+        elif isinstance(image_to_draw, QSvgRenderer) and not image_to_draw.animated():
+            self._painter.drawPixmap(
+                0,
+                0,
+                image_cache.scaled(image_to_draw, self.size(), self._aspect_ratio_mode, self.devicePixelRatioF()),
+            )
         elif isinstance(image_to_draw, QSvgRenderer):
             draw_size = QSizeF(image_to_draw.defaultSize())
             draw_size.scale(QSizeF(event.rect().size()), self._aspect_ratio_mode)
@@ -257,5 +264,8 @@ class PyDMSymbol(QWidget, PyDMWidget):
         self._painter.end()
 
     def qt_message_handler(self, msg_type, *args):
-        # Intentionally suppress all qt messages.  Make sure not to leave this handler installed.
-        pass
+        warnings.warn(
+            "'PyDMSymbol.qt_message_handler' is deprecated, images are now loaded through "
+            "'pydm.widgets.image_cache.image_cache', which silences Qt messages itself.",
+            DeprecationWarning,
+        )
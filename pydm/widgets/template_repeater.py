@@ -2,12 +2,24 @@ import os
 import json
 import copy
 import logging
-from qtpy.QtWidgets import QFrame, QApplication, QLabel, QVBoxLayout, QHBoxLayout, QWidget, QStyle, QSizePolicy, QLayout
-from qtpy.QtCore import Qt, QSize, QRect, QPoint
-from .base import PyDMPrimitiveWidget
+from xml.etree import ElementTree
+from qtpy.QtWidgets import (
+    QFrame,
+    QApplication,
+    QLabel,
+    QVBoxLayout,
+    QHBoxLayout,
+    QWidget,
+    QStyle,
+    QSizePolicy,
+    QLayout,
+    QAbstractScrollArea,
+)
+from qtpy.QtCore import Qt, QSize, QRect, QPoint, QObject, QTimer
+from .base import PyDMPrimitiveWidget, PyDMWidget
 from pydm.utilities import is_qt_designer
 import pydm.data_plugins
-from pydm.utilities import find_file
+from pydm.utilities import find_file, load_profiler, macro
 from pydm.display import load_file
 from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes, coerce_enum_value
 
@@ -117,6 +129,84 @@ class FlowLayout(QLayout):
             return parent.spacing()
 
 
+def _count_macros(text):
+    return sum(1 for _, name, _ in macro.tokenize_template(text) if name is not None)
+
+
+class TemplateBindings(object):
+    """
+    The string properties of the widgets of a .ui template which use macros,
+    so that an instance of the template can be filled in with other macros
+    without loading the file again.
+
+    Parameters
+    ----------
+    bindings : list of tuple
+        Tuples of (object name, property name, text with macros).
+    """
+
+    def __init__(self, bindings):
+        self.bindings = bindings
+
+    @classmethod
+    def from_file(cls, filename):
+        """
+        Find the properties using macros in a template file.
+
+        Parameters
+        ----------
+        filename : str
+
+        Returns
+        -------
+        TemplateBindings or None
+            None if the template is not a .ui file, or uses macros elsewhere
+            than in string properties, for instance in numbers or in the name
+            of a widget, in which case it must be loaded again for each set of
+            macros.
+        """
+        if not filename or not filename.lower().endswith(".ui"):
+            return None
+        try:
+            text = macro.template_for_file(filename).template
+            root = ElementTree.fromstring(text)
+        except (OSError, ElementTree.ParseError):
+            return None
+        bindings = []
+        for widget in root.iter("widget"):
+            for prop in widget.findall("property"):
+                string = prop.find("string")
+                if string is not None and string.text and _count_macros(string.text):
+                    bindings.append((widget.get("name"), prop.get("name"), string.text))
+        if sum(_count_macros(text) for _, _, text in bindings) != _count_macros(text):
+            return None
+        return cls(bindings)
+
+    def bind(self, widget, macros):
+        """
+        Fill in an instance of the template with new macros.
+
+        Parameters
+        ----------
+        widget : QWidget
+            The instance of the template.
+        macros : dict
+            The macros to fill it in with.
+        """
+        for object_name, property_name, text in self.bindings:
+            if widget.objectName() == object_name:
+                target = widget
+            else:
+                target = widget.findChild(QObject, object_name)
+            if target is None:
+                continue
+            value = macro.expand_macros(text, macros)
+            if property_name == "channel" and isinstance(target, PyDMWidget) and target.channel != value:
+                # Show the widget as disconnected until the new channel connects
+                target.connectionStateChanged(False)
+            target.setProperty(property_name, value)
+
+
 class LayoutType(object):
     Vertical = 0
     Horizontal = 1
@@ -167,12 +257,19 @@ class PyDMTemplateRepeater(*_PyDMTemplateRepeaterBases):
     amount of work: just build a template for a single magnet, and a JSON list
     with the data that describes all of the magnets.
 
+    With the virtualized property set, only the instances in view in the
+    enclosing scroll area are created, so that a list of thousands of items
+    is quick to build and only connects to the channels on screen.
+
     Parameters
     ----------
     parent : optional
         The parent of this widget.
     """
 
+    # Number of instances created beyond each edge of the visible area when virtualized
+    virtual_margin = 5
+
     if ACTIVE_QT_WRAPPER == QtWrapperTypes.PYQT5:
         from PyQt5.QtCore import Q_ENUM
 
@@ -204,6 +301,17 @@ class PyDMTemplateRepeater(*_PyDMTemplateRepeaterBases):
         self._parent_macros = None
         self._layout_type = self.LayoutType.Vertical
         self._temp_layout_spacing = 4
+        self._virtualized = False
+        # Instances of the template by item index, when virtualized
+        self._rows = {}
+        self._row_size = None
+        self._template_bindings = None
+        self._scroll_area = None
+        self._updating_rows = False
+        self._rows_timer = QTimer(self)
+        self._rows_timer.setSingleShot(True)
+        self._rows_timer.setInterval(0)
+        self._rows_timer.timeout.connect(self._update_rows)
         self.app = QApplication.instance()
         self.rebuild()
 
@@ -246,9 +354,45 @@ class PyDMTemplateRepeater(*_PyDMTemplateRepeaterBases):
         self._temp_layout_spacing = new_spacing
         if self.layout():
             self.layout().setSpacing(new_spacing)
+        elif self._row_size is not None:
+            self.updateGeometry()
+            self._schedule_rows_update()
 
     layoutSpacing = Property(int, readLayoutSpacing, setLayoutSpacing)
 
+    def readVirtualized(self) -> bool:
+        """
+        Whether to only create the instances of the template in view in the
+        enclosing scroll area, plus a few on each side.
+
+        Returns
+        -------
+        bool
+        """
+        return self._virtualized
+
+    def setVirtualized(self, virtualized) -> None:
+        """
+        Whether to only create the instances of the template in view in the
+        enclosing scroll area, plus a few on each side.  Instances are created
+        and their channels connected as they scroll into view.  Instances
+        scrolled out of view are reused for the items scrolling in by filling
+        in the macros of their string properties again, if the template only
+        uses macros in string properties, otherwise they are deleted.
+
+        All instances are given the size of the first one.  This property has
+        no effect with the Flow layout type, nor in Qt Designer.
+
+        Parameters
+        ----------
+        virtualized : bool
+        """
+        if virtualized != self._virtualized:
+            self._virtualized = virtualized
+            self.rebuild()
+
+    virtualized = Property(bool, readVirtualized, setVirtualized)
+
     def readCountShownInDesigner(self) -> int:
         """
         The number of instances to show in Qt Designer.  This property has no
@@ -468,33 +612,47 @@ class PyDMTemplateRepeater(*_PyDMTemplateRepeaterBases):
         -------
         display : QWidget
         """
-        if not variables:
-            variables = {}
-
         parent_display = self.find_parent_display()
+        with load_profiler.within(parent_display):
+            fname = self._find_template_file(parent_display)
+            try:
+                w = load_file(fname, macros=self._macros_for(variables), target=None)
+            except Exception as ex:
+                w = QLabel("Error: could not load template: " + str(ex))
+        return w
+
+    def _find_template_file(self, parent_display):
         base_path = None
         if parent_display:
             base_path = os.path.dirname(parent_display.loaded_file())
-        fname = find_file(
+        return find_file(
             self.templateFilename,
             base_path=base_path,
             raise_if_not_found=True,
             subdir_scan_enabled=self._recursive_template_search,
         )
 
+    def _macros_for(self, variables):
         if self._parent_macros is None:
             self._parent_macros = {}
+            parent_display = self.find_parent_display()
             if parent_display:
                 self._parent_macros = parent_display.macros()
-
-        parent_macros = copy.copy(self._parent_macros)
-        parent_macros.update(variables)
-        try:
-            w = load_file(fname, macros=parent_macros, target=None)
-        except Exception as ex:
-            w = QLabel("Error: could not load template: " + str(ex))
+        macros = copy.copy(self._parent_macros)
+        macros.update(variables or {})
+        return macros
+
+    def _create_instance(self, variables):
+        w = self.open_template_file(variables)
+        if w is None:
+            w = QLabel()
+            w.setText("No Template Loaded.  Data: {}".format(variables))
+        w.setParent(self)
         return w
 
+    def _is_virtualized(self):
+        return self._virtualized and self.layoutType != LayoutType.Flow and not is_qt_designer()
+
     def rebuild(self):
         """Clear out all existing widgets, and populate the list using the
         template file and data source."""
@@ -503,25 +661,28 @@ class PyDMTemplateRepeater(*_PyDMTemplateRepeaterBases):
             return
         self.setUpdatesEnabled(False)
 
-        layout_class = layout_class_for_type[self.layoutType]
+        virtualized = self._is_virtualized()
+        layout_class = None if virtualized else layout_class_for_type[self.layoutType]
         if type(self.layout()) != layout_class:
             if self.layout() is not None:
                 # Trick to remove the existing layout by re-parenting it in an empty widget.
                 QWidget().setLayout(self.layout())
-            currLayoutClass = layout_class(self)
-            self.setLayout(currLayoutClass)
-            self.layout().setSpacing(self._temp_layout_spacing)
+            if layout_class is not None:
+                currLayoutClass = layout_class(self)
+                self.setLayout(currLayoutClass)
+                self.layout().setSpacing(self._temp_layout_spacing)
         try:
             with pydm.data_plugins.connection_queue(defer_connections=True):
+                if virtualized:
+                    self._template_bindings = TemplateBindings.from_file(
+                        self._find_template_file(self.find_parent_display())
+                    )
+                    self._update_rows()
+                    return
                 for i, variables in enumerate(self.data):
                     if is_qt_designer() and i > self.countShownInDesigner - 1:
                         break
-                    w = self.open_template_file(variables)
-                    if w is None:
-                        w = QLabel()
-                        w.setText("No Template Loaded.  Data: {}".format(variables))
-                    w.setParent(self)
-                    self.layout().addWidget(w)
+                    self.layout().addWidget(self._create_instance(variables))
         except Exception:
             logger.exception("Template repeater failed to rebuild.")
         finally:
@@ -536,6 +697,12 @@ class PyDMTemplateRepeater(*_PyDMTemplateRepeaterBases):
     def clear(self):
         """Clear out any existing instances of the template inside
         the widget."""
+        for row in self._rows.values():
+            row.deleteLater()
+        self._rows = {}
+        if self._row_size is not None:
+            self._row_size = None
+            self.updateGeometry()
         if not self.layout():
             return
         while self.layout().count() > 0:
@@ -544,10 +711,124 @@ class PyDMTemplateRepeater(*_PyDMTemplateRepeaterBases):
             del item
 
     def count(self):
+        if self._rows:
+            return len(self._rows)
         if not self.layout():
             return 0
         return self.layout().count()
 
+    def _schedule_rows_update(self, *args):
+        if self._row_size is not None:
+            self._rows_timer.start()
+
+    def _watch_scroll_area(self):
+        scroll_area = self.parentWidget()
+        while scroll_area is not None and not isinstance(scroll_area, QAbstractScrollArea):
+            scroll_area = scroll_area.parentWidget()
+        if scroll_area is self._scroll_area:
+            return
+        if self._scroll_area is not None:
+            for bar in (self._scroll_area.horizontalScrollBar(), self._scroll_area.verticalScrollBar()):
+                try:
+                    bar.valueChanged.disconnect(self._schedule_rows_update)
+                except (TypeError, RuntimeError):
+                    pass
+        self._scroll_area = scroll_area
+        if scroll_area is not None:
+            for bar in (scroll_area.horizontalScrollBar(), scroll_area.verticalScrollBar()):
+                bar.valueChanged.connect(self._schedule_rows_update)
+
+    def _visible_rect(self):
+        if not self.isVisible():
+            return QRect()
+        if self._scroll_area is None:
+            return self.rect()
+        viewport = self._scroll_area.viewport()
+        return QRect(self.mapFrom(viewport, QPoint(0, 0)), viewport.size()).intersected(self.rect())
+
+    def _row_step(self):
+        if self.layoutType == LayoutType.Horizontal:
+            return self._row_size.width() + self._temp_layout_spacing
+        return self._row_size.height() + self._temp_layout_spacing
+
+    def _row_geometry(self, index):
+        contents = self.contentsRect()
+        offset = index * self._row_step()
+        if self.layoutType == LayoutType.Horizontal:
+            return QRect(contents.left() + offset, contents.top(), self._row_size.width(), contents.height())
+        return QRect(contents.left(), contents.top() + offset, contents.width(), self._row_size.height())
+
+    def _update_rows(self):
+        """Create the instances in view and reuse or delete the others, when virtualized."""
+        if self._updating_rows or not self._is_virtualized() or not self.templateFilename or not self.data:
+            return
+        self._updating_rows = True
+        try:
+            if self._row_size is None:
+                row = self._rows[0] = self._rows.get(0) or self._create_instance(self.data[0])
+                self._row_size = row.sizeHint().expandedTo(row.minimumSizeHint())
+                self.updateGeometry()
+            visible = self._visible_rect()
+            if visible.isEmpty():
+                return
+            contents = self.contentsRect()
+            if self.layoutType == LayoutType.Horizontal:
+                start, end, origin = visible.left(), visible.right(), contents.left()
+            else:
+                start, end, origin = visible.top(), visible.bottom(), contents.top()
+            step = max(self._row_step(), 1)
+            first = max((start - origin) // step - self.virtual_margin, 0)
+            last = min((end - origin) // step + self.virtual_margin, len(self.data) - 1)
+
+            released = [self._rows.pop(index) for index in list(self._rows) if not first <= index <= last]
+            for index in range(first, last + 1):
+                row = self._rows.get(index)
+                if row is None:
+                    if released and self._template_bindings is not None:
+                        row = released.pop()
+                        self._template_bindings.bind(row, self._macros_for(self.data[index]))
+                    else:
+                        row = self._create_instance(self.data[index])
+                    self._rows[index] = row
+                row.setGeometry(self._row_geometry(index))
+                row.show()
+            for row in released:
+                row.hide()
+                row.deleteLater()
+        except Exception:
+            logger.exception("Template repeater failed to update its instances.")
+        finally:
+            self._updating_rows = False
+
+    def sizeHint(self):
+        if self._row_size is None:
+            return super().sizeHint()
+        margins = self.contentsMargins()
+        extent = len(self.data) * self._row_step() - self._temp_layout_spacing
+        if self.layoutType == LayoutType.Horizontal:
+            return QSize(
+                extent + margins.left() + margins.right(),
+                self._row_size.height() + margins.top() + margins.bottom(),
+            )
+        return QSize(
+            self._row_size.width() + margins.left() + margins.right(),
+            extent + margins.top() + margins.bottom(),
+        )
+
+    def minimumSizeHint(self):
+        if self._row_size is None:
+            return super().minimumSizeHint()
+        return self.sizeHint()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._watch_scroll_area()
+        self._schedule_rows_update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_rows_update()
+
     @property
     def data(self):
         """
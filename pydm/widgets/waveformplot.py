@@ -10,6 +10,33 @@ from collections import OrderedDict
 from pydm.utilities import remove_protocol, ACTIVE_QT_WRAPPER, QtWrapperTypes
 
 
+def _is_all_inf(waveform):
+    """
+    Check whether every element of a waveform is infinite.
+
+    Equivalent to ``np.isinf(waveform).all()``, but avoids building a full
+    boolean array in the common case by checking the first element before
+    falling back to the vectorized test.  Non-floating point arrays can
+    never hold infinite values, so only empty ones are rejected.
+
+    Parameters
+    ----------
+    waveform: numpy.ndarray or scalar
+
+    Returns
+    -------
+    bool
+    """
+    arr = np.asarray(waveform)
+    if arr.size == 0:
+        return True
+    if arr.dtype.kind not in "fc":
+        return False
+    if not np.isinf(arr.flat[0]):
+        return False
+    return bool(np.isinf(arr).all())
+
+
 class WaveformCurveItem(BasePlotCurveItem):
     """
     WaveformCurveItem represents a single curve in a waveform plot.
@@ -73,6 +100,12 @@ class WaveformCurveItem(BasePlotCurveItem):
         # y_waveform with the latest values, based on the redraw mode.
         self.latest_x = None
         self.latest_y = None
+        # The generation counter is bumped every time x_waveform and y_waveform
+        # are replaced, and drawn_generation records the generation that was last
+        # pushed to pyqtgraph.  The owning plot uses these to skip curves whose
+        # data has not changed since the previous redraw.
+        self.generation = 0
+        self.drawn_generation = 0
         self.plot_style = plot_style
 
         super().__init__(**kws)
@@ -158,25 +191,30 @@ class WaveformCurveItem(BasePlotCurveItem):
         the data_changed signal will be emitted.  The data_changed signal
         is used by the plot that owns this curve to request a redraw.
         """
-        if self.redraw_mode == WaveformCurveItem.REDRAW_ON_EITHER:
+        if self.redraw_mode == WaveformCurveItem.REDRAW_ON_X:
+            ready = not self.needs_new_x
+        elif self.redraw_mode == WaveformCurveItem.REDRAW_ON_Y:
+            ready = not self.needs_new_y
+        elif self.redraw_mode == WaveformCurveItem.REDRAW_ON_BOTH:
+            ready = not (self.needs_new_y or self.needs_new_x)
+        else:
+            ready = self.redraw_mode == WaveformCurveItem.REDRAW_ON_EITHER
+        if ready:
             self.x_waveform = self.latest_x
             self.y_waveform = self.latest_y
+            self.generation += 1
             self.data_changed.emit()
-        elif self.redraw_mode == WaveformCurveItem.REDRAW_ON_X:
-            if not self.needs_new_x:
-                self.x_waveform = self.latest_x
-                self.y_waveform = self.latest_y
-                self.data_changed.emit()
-        elif self.redraw_mode == WaveformCurveItem.REDRAW_ON_Y:
-            if not self.needs_new_y:
-                self.x_waveform = self.latest_x
-                self.y_waveform = self.latest_y
-                self.data_changed.emit()
-        elif self.redraw_mode == WaveformCurveItem.REDRAW_ON_BOTH:
-            if not (self.needs_new_y or self.needs_new_x):
-                self.x_waveform = self.latest_x
-                self.y_waveform = self.latest_y
-                self.data_changed.emit()
+
+    @property
+    def needs_redraw(self):
+        """
+        Whether this curve holds data that has not been drawn yet.
+
+        Returns
+        -------
+        bool
+        """
+        return self.generation != self.drawn_generation
 
     @Slot(bool)
     def xConnectionStateChanged(self, connected):
@@ -198,9 +236,7 @@ class WaveformCurveItem(BasePlotCurveItem):
         new_waveform: numpy.ndarray
             A new array values for the X axis.
         """
-        if new_waveform is None:
-            return
-        if np.isinf(new_waveform).all():
+        if new_waveform is None or _is_all_inf(new_waveform):
             return
         self.latest_x = new_waveform
         self.needs_new_x = False
@@ -220,9 +256,7 @@ class WaveformCurveItem(BasePlotCurveItem):
         new_waveform: numpy.ndarray
             A new array values for the Y axis.
         """
-        if new_waveform is None:
-            return
-        if np.isinf(new_waveform).all():
+        if new_waveform is None or _is_all_inf(new_waveform):
             return
         self.latest_y = new_waveform
         self.needs_new_y = False
@@ -252,6 +286,7 @@ class WaveformCurveItem(BasePlotCurveItem):
 
         self.needs_new_x = True
         self.needs_new_y = True
+        self.drawn_generation = self.generation
 
     def _setCurveData(self):
         """Set waveform data for display as a line graph.
@@ -368,6 +403,12 @@ class PyDMWaveformPlot(BasePlot):
         # (x_channel, y_channel) tuple, with WaveformCurveItem values.
         # It gets populated in self.addChannel().
         self.channel_pairs = OrderedDict()
+        # Per-tick redraw statistics, see frameStatistics().
+        self._frames = 0
+        self._last_frame_updated = 0
+        self._last_frame_skipped = 0
+        self._total_curves_updated = 0
+        self._total_curves_skipped = 0
         init_channel_pairs = zip(init_x_channels, init_y_channels)
         for x_chan, y_chan in init_channel_pairs:
             self.addChannel(y_chan, x_channel=x_chan)
@@ -512,9 +553,22 @@ class PyDMWaveformPlot(BasePlot):
         """
         if not self._needs_redraw:
             return
+        updated = 0
+        skipped = 0
         for curve in self._curves:
-            curve.redrawCurve()
+            # Only curves that received new data since the last redraw are
+            # pushed to pyqtgraph, the rest keep their current plot data.
+            if getattr(curve, "needs_redraw", True):
+                curve.redrawCurve()
+                updated += 1
+            else:
+                skipped += 1
         self._needs_redraw = False
+        self._frames += 1
+        self._last_frame_updated = updated
+        self._last_frame_skipped = skipped
+        self._total_curves_updated += updated
+        self._total_curves_skipped += skipped
 
         if self.crosshair:
             global_pos = QCursor.pos()
@@ -527,6 +581,37 @@ class PyDMWaveformPlot(BasePlot):
                 self.horizontal_crosshair_line.setPos(mapped_point.y())
                 self.crosshair_position_updated.emit(scene_pos.x(), scene_pos.y())
 
+    def frameStatistics(self):
+        """
+        Statistics about the curves redrawn by redrawPlot.  Useful for tuning
+        the redraw rate and redraw modes of plots with many curves.
+
+        Returns
+        -------
+        dict
+            frames: the number of redraws performed,
+            last_updated / last_skipped: curves redrawn and skipped during the
+            most recent redraw,
+            total_updated / total_skipped: the same counts summed over all redraws.
+        """
+        return {
+            "frames": self._frames,
+            "last_updated": self._last_frame_updated,
+            "last_skipped": self._last_frame_skipped,
+            "total_updated": self._total_curves_updated,
+            "total_skipped": self._total_curves_skipped,
+        }
+
+    def resetFrameStatistics(self):
+        """
+        Reset the counters reported by frameStatistics.
+        """
+        self._frames = 0
+        self._last_frame_updated = 0
+        self._last_frame_skipped = 0
+        self._total_curves_updated = 0
+        self._total_curves_skipped = 0
+
     def clearCurves(self):
         """
         Remove all curves from the plot.
@@ -1,6 +1,6 @@
-from qtpy.QtWidgets import QTableWidget, QTableWidgetItem, QApplication
+from qtpy.QtWidgets import QTableView, QApplication
 from qtpy.QtGui import QCursor
-from qtpy.QtCore import Slot, Qt, QEvent
+from qtpy.QtCore import Qt, QEvent, QAbstractTableModel
 import numpy as np
 from .base import PyDMWritableWidget, PostParentClassInitSetup
 from pydm.utilities import ACTIVE_QT_WRAPPER, QtWrapperTypes
@@ -11,14 +11,222 @@ else:
     from qtpy.QtCore import Property
 
 
-class PyDMWaveformTable(QTableWidget, PyDMWritableWidget):
+def index_ranges(indices, max_ranges=32):
     """
-    A QTableWidget with support for Channels and more from PyDM.
+    Group sorted, unique indices into contiguous inclusive ranges.
+
+    Parameters
+    ----------
+    indices : np.ndarray
+        Sorted, unique integer indices.
+    max_ranges : int, optional
+        If the indices split into more than this many ranges, a single range
+        spanning all of them is returned instead.
+
+    Returns
+    -------
+    list of (int, int)
+        Inclusive (first, last) pairs.
+    """
+    if len(indices) == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(indices) > 1)
+    if len(breaks) >= max_ranges:
+        return [(int(indices[0]), int(indices[-1]))]
+    starts = np.concatenate(([indices[0]], indices[breaks + 1]))
+    ends = np.concatenate((indices[breaks], [indices[-1]]))
+    return [(int(start), int(end)) for start, end in zip(starts, ends)]
+
+
+class WaveformTableModel(QAbstractTableModel):
+    """
+    A table model that lays out the elements of a 1D array over a fixed
+    number of columns.
+
+    Cells are formatted lazily in data(), so only the cells the view actually
+    paints are converted to text.  When a new array with the same length as
+    the current one is set, the two are compared with a vectorized diff and
+    dataChanged is only emitted for the rows that contain changed elements.
+
+    Parameters
+    ----------
+    parent : QObject, optional
+        The parent of this model.
+    edit_method : callable, optional
+        Called as edit_method(row, column, value) when a cell is edited.
+        Must return True if the edit was accepted.
+    """
+
+    # Above this many separate changed row ranges a single bounding range is
+    # emitted instead, as the per-signal overhead outweighs the repaint savings.
+    max_changed_ranges = 32
+
+    def __init__(self, parent=None, edit_method=None):
+        super().__init__(parent)
+        self.edit_method = edit_method
+        self._waveform = np.array([])
+        self._column_count = 1
+        self._row_count = 0
+        self._column_labels = []
+        self._row_labels = []
+        self._column_header_items = {}
+        self._row_header_items = {}
+        self._item_flags = Qt.ItemIsSelectable | Qt.ItemIsEditable | Qt.ItemIsEnabled
+
+    @property
+    def waveform(self):
+        return self._waveform
+
+    def set_waveform(self, new_waveform):
+        """
+        Replace the array shown by the model.
+
+        Parameters
+        ----------
+        new_waveform : np.ndarray
+        """
+        old_waveform = self._waveform
+        new_waveform = np.ravel(np.asarray(new_waveform))
+        self._waveform = new_waveform
+        row_count = self._rows_for(len(new_waveform))
+        if row_count != self._row_count or len(old_waveform) != len(new_waveform):
+            self.beginResetModel()
+            self._row_count = row_count
+            self.endResetModel()
+            return
+        if row_count == 0:
+            return
+        for first_row, last_row in self._changed_row_ranges(old_waveform, new_waveform):
+            self.dataChanged.emit(self.index(first_row, 0), self.index(last_row, self._column_count - 1))
+
+    def _rows_for(self, length):
+        return length // self._column_count + (1 if length % self._column_count else 0)
+
+    def _changed_row_ranges(self, old_waveform, new_waveform):
+        """
+        Find the contiguous ranges of rows whose elements differ between
+        two arrays of the same length.
+
+        Returns
+        -------
+        list of (int, int)
+            Inclusive (first_row, last_row) pairs.
+        """
+        full_range = [(0, self._row_count - 1)]
+        if np.may_share_memory(old_waveform, new_waveform):
+            # The array was modified in place, nothing to compare against.
+            return full_range
+        try:
+            changed = np.flatnonzero(old_waveform != new_waveform)
+        except (TypeError, ValueError):
+            return full_range
+        return index_ranges(np.unique(changed // self._column_count), self.max_changed_ranges)
+
+    def set_column_count(self, count):
+        count = max(1, int(count))
+        if count == self._column_count:
+            return
+        self.beginResetModel()
+        self._column_count = count
+        self._row_count = self._rows_for(len(self._waveform))
+        self.endResetModel()
+
+    def set_item_flags(self, flags):
+        if flags == self._item_flags:
+            return
+        self._item_flags = flags
+        if self._row_count:
+            self.dataChanged.emit(self.index(0, 0), self.index(self._row_count - 1, self._column_count - 1))
+
+    def set_header_labels(self, orientation, labels):
+        if orientation == Qt.Horizontal:
+            self._column_labels = list(labels)
+            count = self._column_count
+        else:
+            self._row_labels = list(labels)
+            count = self._row_count
+        if count:
+            self.headerDataChanged.emit(orientation, 0, count - 1)
+
+    def set_header_item(self, orientation, section, item):
+        items = self._column_header_items if orientation == Qt.Horizontal else self._row_header_items
+        items[section] = item
+        self.headerDataChanged.emit(orientation, section, section)
+
+    def header_item(self, orientation, section):
+        items = self._column_header_items if orientation == Qt.Horizontal else self._row_header_items
+        return items.get(section)
+
+    def element_index(self, row, column):
+        """
+        The index into the waveform for a cell, or None if the cell is past
+        the end of the waveform.
+        """
+        ind = row * self._column_count + column
+        if column >= self._column_count or ind >= len(self._waveform):
+            return None
+        return ind
+
+    # QAbstractItemModel Implementation
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return self._row_count
+
+    def columnCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return self._column_count
+
+    def flags(self, index):
+        if not index.isValid() or self.element_index(index.row(), index.column()) is None:
+            return Qt.NoItemFlags
+        return self._item_flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        ind = self.element_index(index.row(), index.column())
+        if ind is None:
+            return None
+        return str(self._waveform[ind])
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if self.edit_method is None or role != Qt.EditRole or not index.isValid():
+            return False
+        if self.element_index(index.row(), index.column()) is None:
+            return False
+        success = self.edit_method(index.row(), index.column(), value)
+        if success:
+            self.dataChanged.emit(index, index)
+        return success
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return super().headerData(section, orientation, role)
+        labels = self._column_labels if orientation == Qt.Horizontal else self._row_labels
+        if section < len(labels):
+            return labels[section]
+        item = self.header_item(orientation, section)
+        if item is not None and item.text():
+            return item.text()
+        return str(section + 1)
+
+    # End QAbstractItemModel implementation.
+
+
+class PyDMWaveformTable(QTableView, PyDMWritableWidget):
+    """
+    A QTableView with support for Channels and more from PyDM.
 
     Values of the array are displayed in the selected number of columns.
     The number of rows is determined by the size of the waveform.
     It is possible to define the labels of each row and column.
 
+    The values are served by a :class:`WaveformTableModel`, so an update
+    only repaints the cells whose values changed instead of recreating an
+    item for every element.
+
     Parameters
     ----------
     parent : QWidget
@@ -28,15 +236,15 @@ class PyDMWaveformTable(QTableWidget, PyDMWritableWidget):
     """
 
     def __init__(self, parent=None, init_channel=None):
-        QTableWidget.__init__(self, parent)
+        QTableView.__init__(self, parent)
         PyDMWritableWidget.__init__(self, init_channel=init_channel)
         self._columnHeaders = ["Value"]
         self._rowHeaders = []
         self._itemsFlags = Qt.ItemIsSelectable | Qt.ItemIsEditable | Qt.ItemIsEnabled
         self.waveform = None
-        self._valueBeingSet = False
-        self.setColumnCount(1)
-        self.cellChanged.connect(self.send_waveform)
+        self._model = WaveformTableModel(parent=self, edit_method=self.send_waveform)
+        self._model.set_header_labels(Qt.Horizontal, self._columnHeaders)
+        self.setModel(self._model)
         # Execute setup calls that must be done here in the widget class's __init__,
         # and after it's parent __init__ calls have completed.
         # (so we can avoid pyside6 throwing an error, see func def for more info)
@@ -57,24 +265,10 @@ class PyDMWaveformTable(QTableWidget, PyDMWritableWidget):
             The new waveform value from the channel.
         """
         PyDMWritableWidget.value_changed(self, new_waveform)
-        self._valueBeingSet = True
         self.waveform = new_waveform
-        col_count = self.columnCount()
-        len_wave = len(new_waveform)
-        row_count = len_wave // col_count + (1 if len_wave % col_count else 0)
-        self.setRowCount(row_count)
-        for ind, element in enumerate(new_waveform):
-            i, j = ind // col_count, ind % col_count
-            value_cell = QTableWidgetItem(str(element))
-            value_cell.setFlags(self._itemsFlags)
-            self.setItem(i, j, value_cell)
-
-        self.setVerticalHeaderLabels(self._rowHeaders)
-        self.setHorizontalHeaderLabels(self._columnHeaders)
-        self._valueBeingSet = False
+        self._model.set_waveform(new_waveform)
 
-    @Slot(int, int)
-    def send_waveform(self, row, column):
+    def send_waveform(self, row, column, value):
         """Update Channel value when cell value is changed.
 
         Parameters
@@ -83,15 +277,24 @@ class PyDMWaveformTable(QTableWidget, PyDMWritableWidget):
             Row of the changed cell.
         column : int
             Column of the changed cell.
+        value : str
+            The text entered in the cell.
+
+        Returns
+        -------
+        bool
+            True if the new value was sent to the channel.
         """
-        if self._valueBeingSet:
-            return
-        item = self.item(row, column)
-        if item and self.subtype:
-            new_val = self.subtype(item.text())
-            ind = row * self.columnCount() + column
-            self.waveform[ind] = new_val
-            self.send_value_signal[np.ndarray].emit(self.waveform)
+        ind = self._model.element_index(row, column)
+        if ind is None or self.waveform is None or not self.subtype:
+            return False
+        try:
+            new_val = self.subtype(value)
+        except (TypeError, ValueError):
+            return False
+        self.waveform[ind] = new_val
+        self.send_value_signal[np.ndarray].emit(self.waveform)
+        return True
 
     def check_enable_state(self):
         """
@@ -106,11 +309,7 @@ class PyDMWaveformTable(QTableWidget, PyDMWritableWidget):
             self._itemsFlags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
         else:
             self._itemsFlags = Qt.ItemIsSelectable
-        for col in range(0, self.columnCount()):
-            for row in range(0, self.rowCount()):
-                item = self.item(row, col)
-                if item is not None:
-                    item.setFlags(self._itemsFlags)
+        self._model.set_item_flags(self._itemsFlags)
 
     def eventFilter(self, obj, event):
         status = self._connected
@@ -120,6 +319,65 @@ class PyDMWaveformTable(QTableWidget, PyDMWritableWidget):
             QApplication.setOverrideCursor(QCursor(Qt.ForbiddenCursor))
         return False
 
+    def rowCount(self) -> int:
+        """
+        The number of rows needed to display the current waveform.
+
+        Returns
+        -------
+        int
+        """
+        return self._model.rowCount()
+
+    def setRowCount(self, rows) -> None:
+        """
+        The row count follows the size of the waveform, this is kept so that
+        .ui files created when this widget was a QTableWidget still load.
+        """
+        pass
+
+    def columnCount(self) -> int:
+        """
+        The number of columns the waveform is laid out over.
+
+        Returns
+        -------
+        int
+        """
+        return self._model.columnCount()
+
+    def setColumnCount(self, columns) -> None:
+        """
+        Set the number of columns the waveform is laid out over.
+
+        Parameters
+        ----------
+        columns : int
+        """
+        self._model.set_column_count(columns)
+
+    numberOfColumns = Property(int, columnCount, setColumnCount)
+
+    def setHorizontalHeaderLabels(self, labels) -> None:
+        self._model.set_header_labels(Qt.Horizontal, labels)
+
+    def setVerticalHeaderLabels(self, labels) -> None:
+        self._model.set_header_labels(Qt.Vertical, labels)
+
+    def setHorizontalHeaderItem(self, column, item) -> None:
+        """Header items are accepted for compatibility with .ui files created for QTableWidget."""
+        self._model.set_header_item(Qt.Horizontal, column, item)
+
+    def horizontalHeaderItem(self, column):
+        return self._model.header_item(Qt.Horizontal, column)
+
+    def setVerticalHeaderItem(self, row, item) -> None:
+        """Header items are accepted for compatibility with .ui files created for QTableWidget."""
+        self._model.set_header_item(Qt.Vertical, row, item)
+
+    def verticalHeaderItem(self, row):
+        return self._model.header_item(Qt.Vertical, row)
+
     def readColumnHeaderLabels(self) -> list[str]:
         """
         Return the list of labels for the columns of the Table.
@@ -53,9 +53,25 @@ def main():
     parser.add_argument(
         "--perfmon",
         action="store_true",
-        help="Enable performance monitoring, and print CPU usage to the terminal.",
+        help="Enable performance monitoring: show the event loop lag in the status bar, "
+        "and print CPU usage to the terminal.",
     )
     parser.add_argument("--profile", action="store_true", help="Enable cProfile function profiling, printing on exit.")
+    parser.add_argument(
+        "--profile-load",
+        nargs="?",
+        const="-",
+        metavar="JSON_FILE",
+        help="Record the time spent loading each display, printing a report on exit, "
+        "or writing it as JSON to JSON_FILE if given.",
+    )
+    parser.add_argument(
+        "--fork-server",
+        action="store_true",
+        default=pydm.config.FORK_SERVER,
+        help="Open displays in new windows by forking them from a pre-warmed server process "
+        "instead of starting a new PyDM process from scratch.  Only available on POSIX systems.",
+    )
     parser.add_argument("--faulthandler", action="store_true", help="Enable faulthandler to trace segmentation faults.")
     parser.add_argument("--hide-nav-bar", action="store_true", help="Start PyDM with the navigation bar hidden.")
     parser.add_argument("--hide-menu-bar", action="store_true", help="Start PyDM with the menu bar hidden.")
@@ -106,6 +122,11 @@ def main():
         profile = cProfile.Profile()
         profile.enable()
 
+    if pydm_args.profile_load:
+        from pydm.utilities import load_profiler
+
+        load_profiler.enable()
+
     if pydm_args.faulthandler:
         faulthandler.enable()
 
@@ -130,6 +151,7 @@ def main():
         recursive_display_search=pydm_args.recurse,
         stylesheet_path=pydm_args.stylesheet,
         home_file=pydm_args.homefile,
+        fork_server=pydm_args.fork_server,
     )
 
     base_path = os.path.dirname(os.path.realpath(__file__))
@@ -158,6 +180,13 @@ def main():
         ).sort_stats(pstats.SortKey.CUMULATIVE)
         stats.print_stats()
 
+    if pydm_args.profile_load:
+        if pydm_args.profile_load == "-":
+            print(load_profiler.report())
+        else:
+            with open(pydm_args.profile_load, "w") as f:
+                f.write(load_profiler.to_json())
+
     if pydm_args.faulthandler:
         faulthandler.disable()
 